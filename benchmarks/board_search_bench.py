@@ -0,0 +1,102 @@
+"""
+게시글 검색 벤치마크: 기존 `title ILIKE '%kw%'` 전체 조회 vs 2-gram tsvector 검색(관련도순 첫 페이지).
+
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.board_search_bench           # 100,000건
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.board_search_bench 300000
+
+별도 스키마(bench_board_search)에 board 복제 테이블을 만들어 채우고, 끝나면 스키마째 지운다.
+"""
+from __future__ import annotations
+import os
+import statistics
+import sys
+import time
+
+import psycopg2
+
+from migrations.versions.m0008_board_search import FUNCTION_SQL
+from migrations.versions.m0010_board_tsquery import SQL as TSQUERY_SQL
+
+SCHEMA = "bench_board_search"
+KEYWORDS = ["서울", "부산 맛집", "야경", "제주 한옥 숙소", "캠핑", "코스 777"]
+PAGE = 20
+REPEAT = 7
+
+SETUP_SQL = f"""
+DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+CREATE SCHEMA {SCHEMA};
+SET search_path TO {SCHEMA}, public;
+{FUNCTION_SQL}
+{TSQUERY_SQL}
+CREATE TABLE board (
+    id UUID PRIMARY KEY,
+    likes INT DEFAULT 0,
+    title TEXT NOT NULL,
+    content TEXT,
+    search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', board_bigrams(title)), 'A')
+        || setweight(to_tsvector('simple', board_bigrams(content)), 'B')
+    ) STORED
+);
+"""
+
+SEED_SQL = """
+WITH w AS (
+    SELECT ARRAY['서울','부산','제주','여행','맛집','카페','산책','바다','야경','캠핑',
+                 '한옥','전시','축제','시장','등산','가족','데이트','힐링','드라이브','숙소'] AS a
+)
+INSERT INTO board (id, likes, title, content)
+SELECT md5('b' || g)::uuid, g %% 100,
+       a[g %% 20 + 1] || ' ' || a[(g * 7) %% 20 + 1] || ' 코스 ' || g,
+       a[(g * 3) %% 20 + 1] || ' 다녀온 후기. ' || a[(g * 11) %% 20 + 1] || ' 근처 '
+           || a[(g * 13) %% 20 + 1] || ' 추천합니다. 일정 ' || (g %% 5 + 1) || '일'
+FROM generate_series(1, %s) g, w;
+CREATE INDEX ix_board_search_vector ON board USING gin (search_vector);
+ANALYZE board;
+"""
+
+ILIKE_SQL = "SELECT id, title, content, likes FROM board WHERE title ILIKE %s;"
+
+SEARCH_SQL = """
+SELECT id, title, content, likes, ts_rank(search_vector, q)::float8 AS rank
+FROM board, board_tsquery(%s) q
+WHERE search_vector @@ q
+ORDER BY rank DESC, id DESC
+LIMIT %s;
+"""
+
+
+def _median_ms(cur, sql, params) -> tuple[float, int]:
+    times = []
+    rows = 0
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        cur.execute(sql, params)
+        rows = len(cur.fetchall())
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(times), rows
+
+
+if __name__ == "__main__":
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        sys.exit("BENCH_DATABASE_URL이 필요합니다 (비워도 되는 Postgres).")
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    con = psycopg2.connect(url)
+    con.autocommit = True
+    try:
+        with con.cursor() as cur:
+            cur.execute(SETUP_SQL)
+            t0 = time.perf_counter()
+            cur.execute(SEED_SQL, (n,))
+            print(f"seeded {n:,} boards in {time.perf_counter() - t0:.1f}s")
+            for kw in KEYWORDS:
+                t_ilike, n_ilike = _median_ms(cur, ILIKE_SQL, (f"%{kw}%",))
+                t_search, n_search = _median_ms(cur, SEARCH_SQL, (kw, PAGE))
+                print(
+                    f"{kw!r:>16}  ilike={t_ilike:8.1f}ms ({n_ilike:>6,} rows)"
+                    f"  bigram={t_search:7.1f}ms (top {n_search})  speedup={t_ilike / t_search:6.1f}x"
+                )
+            cur.execute(f"DROP SCHEMA {SCHEMA} CASCADE;")
+    finally:
+        con.close()
@@ -0,0 +1,50 @@
+"""
+콜드 스타트 벤치마크: 새 인터프리터에서 `import main`에 걸리는 시간과 DB 접속 시도 횟수.
+
+    python -m benchmarks.cold_start_bench        # 5회
+    python -m benchmarks.cold_start_bench 10
+
+매 회 별도 프로세스에서 psycopg2.connect / asyncpg.connect / asyncpg.create_pool 호출을 세면서 main을 import한다.
+import는 DB에 접속하지 않아야 하므로 접속 시도는 0이어야 한다.
+"""
+from __future__ import annotations
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+_PROBE = r"""
+import json, time
+import psycopg2, asyncpg
+calls = {"psycopg2.connect": 0, "asyncpg.connect": 0, "asyncpg.create_pool": 0}
+def _wrap(mod, name, key):
+    orig = getattr(mod, name)
+    def counted(*a, **kw):
+        calls[key] += 1
+        return orig(*a, **kw)
+    setattr(mod, name, counted)
+_wrap(psycopg2, "connect", "psycopg2.connect")
+_wrap(asyncpg, "connect", "asyncpg.connect")
+_wrap(asyncpg, "create_pool", "asyncpg.create_pool")
+t0 = time.perf_counter()
+import main
+print(json.dumps({"ms": (time.perf_counter() - t0) * 1000.0, "db_calls": calls}))
+"""
+
+
+def run_once(root: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=root, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runs = [run_once(root) for _ in range(n)]
+    times = [r["ms"] for r in runs]
+    total_calls = sum(sum(r["db_calls"].values()) for r in runs)
+    print(f"import main x{n}: median={statistics.median(times):.0f}ms min={min(times):.0f}ms max={max(times):.0f}ms")
+    print(f"DB connect attempts during import: {total_calls}")
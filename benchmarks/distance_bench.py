@@ -0,0 +1,47 @@
+"""
+거리 계산 마이크로 벤치마크: 항목별 haversine() 루프 vs util.geo_distance.within_radius.
+
+    python -m benchmarks.distance_bench
+"""
+from __future__ import annotations
+import random
+import timeit
+
+from haversine import haversine, Unit
+
+from util.geo_distance import within_radius
+
+ORIGIN = (37.5665, 126.9780)
+RADIUS_M = 10_000
+
+
+def _points(n: int):
+    rng = random.Random(n)
+    # 절반은 반경 안, 절반은 전국에 흩어진 점
+    lats = [rng.gauss(ORIGIN[0], 0.05) if i % 2 else rng.uniform(33.0, 38.6) for i in range(n)]
+    lons = [rng.gauss(ORIGIN[1], 0.05) if i % 2 else rng.uniform(124.6, 131.9) for i in range(n)]
+    return lats, lons
+
+
+def loop(lats, lons):
+    out = []
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        d = haversine(ORIGIN, (lat, lon), unit=Unit.METERS)
+        if d <= RADIUS_M:
+            out.append((i, int(round(d))))
+    return out
+
+
+def vectorized(lats, lons):
+    idx, d = within_radius(ORIGIN[0], ORIGIN[1], lats, lons, RADIUS_M)
+    return list(zip(idx.tolist(), d.tolist()))
+
+
+if __name__ == "__main__":
+    for n in (10, 100, 1_000, 10_000, 100_000):
+        lats, lons = _points(n)
+        assert loop(lats, lons) == vectorized(lats, lons)
+        number = max(1, 200_000 // n)
+        t_loop = timeit.timeit(lambda: loop(lats, lons), number=number) / number * 1e6
+        t_vec = timeit.timeit(lambda: vectorized(lats, lons), number=number) / number * 1e6
+        print(f"n={n:>7,}  loop={t_loop:10.1f}us  vectorized={t_vec:9.1f}us  speedup={t_loop / t_vec:6.1f}x")
@@ -0,0 +1,82 @@
+"""
+공간 인덱스 벤치마크: GeoGridIndex vs 전체 순회(haversine).
+
+    python -m benchmarks.spatial_index_bench            # 10k, 100k, 1M
+    python -m benchmarks.spatial_index_bench 10000 100000
+
+한국 영역(위도 33~38.6, 경도 124.6~131.9)에 무작위 점을 만들고,
+반경 10km 질의와 k=10 근접 질의의 평균 지연을 측정한다.
+"""
+from __future__ import annotations
+import random
+import statistics
+import sys
+import time
+
+from haversine import haversine, Unit
+
+from util.spatial_index import GeoGridIndex
+
+LAT_RANGE = (33.0, 38.6)
+LON_RANGE = (124.6, 131.9)
+TYPES = [12, 14, 15, 25, 28, 32, 38, 39]
+QUERIES = 200
+RADIUS_M = 10_000
+K = 10
+
+
+def _points(n: int, rng: random.Random):
+    # 인구 밀집 지역 편중을 흉내내기 위해 절반은 서울/부산 근처에 몰아 생성
+    hubs = [(37.5665, 126.9780), (35.1796, 129.0756)]
+    for i in range(n):
+        if i % 2 == 0:
+            hlat, hlon = hubs[i % 4 // 2]
+            yield i, rng.gauss(hlat, 0.15), rng.gauss(hlon, 0.15), rng.choice(TYPES)
+        else:
+            yield i, rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE), rng.choice(TYPES)
+
+
+def _timeit(fn, queries):
+    samples = []
+    for q in queries:
+        t0 = time.perf_counter()
+        fn(*q)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    samples.sort()
+    return statistics.mean(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def run(n: int, precision: int = 5) -> None:
+    rng = random.Random(n)
+    pts = list(_points(n, rng))
+    t0 = time.perf_counter()
+    index = GeoGridIndex(precision)
+    for pid, lat, lon, t in pts:
+        index.add(pid, lat, lon, t)
+    build_s = time.perf_counter() - t0
+
+    queries = [(rng.gauss(37.5665, 0.1), rng.gauss(126.9780, 0.1), rng.choice(TYPES)) for _ in range(QUERIES)]
+
+    radius_mean, radius_p95 = _timeit(lambda lat, lon, t: index.radius(lat, lon, RADIUS_M, t), queries)
+    knn_mean, knn_p95 = _timeit(lambda lat, lon, t: index.nearest(lat, lon, K, t), queries)
+
+    def brute(lat, lon, t):
+        return sorted(
+            d for d in (haversine((lat, lon), (plat, plon), unit=Unit.METERS) for _, plat, plon, pt in pts if pt == t)
+            if d <= RADIUS_M
+        )
+    brute_q = queries[: max(5, QUERIES // (n // 10_000 or 1))]
+    brute_mean, _ = _timeit(brute, brute_q)
+
+    print(
+        f"n={n:>9,}  build={build_s:6.2f}s  cells={index.stats()['cells']:>6}  "
+        f"radius10km mean={radius_mean:7.3f}ms p95={radius_p95:7.3f}ms  "
+        f"knn{K} mean={knn_mean:7.3f}ms p95={knn_p95:7.3f}ms  "
+        f"full-scan mean={brute_mean:9.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    for n in sizes:
+        run(n)
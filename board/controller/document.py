@@ -1,20 +1,26 @@
 import uuid
 from typing import List, Optional
 
-from fastapi import APIRouter, Body, Depends, Query, Path
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Path
 
-from board.model.document import BoardResponse, BoardDetailResponse
+from board.model.document import BoardResponse, BoardListResponse, BoardDetailResponse
 from board.service import document as service
 from user.controller.user import get_current_user_id
+from util.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor
 
 router = APIRouter(prefix="/api/board")
 
-@router.get("", response_model=List[BoardResponse])
+@router.get("", response_model=BoardListResponse)
 def get_all_boards(
-        keyword: Optional[str] = Query(None),
+        keyword: Optional[str] = Query(None, description="제목/본문 검색어 (있으면 관련도순, 없으면 최신순)"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="한 번에 받을 게시글 수"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (첫 페이지는 생략)"),
         user_id: uuid.UUID = Depends(get_current_user_id)
     ):
-    return service.get_all_boards(keyword, user_id)
+    try:
+        return service.get_all_boards(keyword, user_id, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{board_id}", response_model=BoardDetailResponse)
 def get_board_details(
@@ -1,6 +1,7 @@
 import uuid
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class BoardResponse(BaseModel):
@@ -10,6 +11,10 @@ class BoardResponse(BaseModel):
     is_liked: bool
     likes: int
 
+class BoardListResponse(BaseModel):
+    plans: List[BoardResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
+
 class BoardDetailResponse(BaseModel):
     board_id: uuid.UUID
     title: str
@@ -1,44 +1,68 @@
 import uuid
-from user.repository import get_connection
+from datetime import datetime
+from typing import Optional, Tuple
+from user.repository import db_cursor
 
-def get_all_boards_with_keyword(keyword: str, user_id: uuid.UUID):
-    con, cur = get_connection()
-    try:
+def search_boards(
+        keyword: str,
+        user_id: uuid.UUID,
+        *,
+        limit: int,
+        after: Optional[Tuple[float, uuid.UUID]] = None):
+    """
+    keyword: 검색어 원문. search_vector와 같은 board_bigrams() 규칙으로 DB에서 tsquery로 바꾼다 (board_tsquery)
+    관련도(ts_rank) 내림차순, 동점은 id 내림차순. after=(rank, id)이면 그 다음부터
+    반환 행: (id, title, content, is_liked, likes, rank)
+    """
+    after_rank, after_id = after if after else (None, None)
+    with db_cursor() as (con, cur):
         cur.execute(
             """
-            SELECT b.id, b.title, b.content, l.id is not null AS is_liked, b.likes
-            FROM public.board b
-            LEFT JOIN public."like" l
-            ON b.id = l.board_id AND l.user_id = %s
-            WHERE b.title ILIKE %s;
+            SELECT s.id, s.title, s.content, s.is_liked, s.likes, s.rank
+            FROM (
+                SELECT b.id, b.title, b.content, l.id is not null AS is_liked, b.likes,
+                       ts_rank(b.search_vector, q.q)::float8 AS rank
+                FROM public.board b
+                CROSS JOIN (SELECT board_tsquery(%s) AS q) q
+                LEFT JOIN public."like" l
+                ON b.id = l.board_id AND l.user_id = %s
+                WHERE b.search_vector @@ q.q
+            ) s
+            WHERE %s::float8 IS NULL OR (s.rank, s.id) < (%s::float8, %s::uuid)
+            ORDER BY s.rank DESC, s.id DESC
+            LIMIT %s;
             """,
-            (str(user_id), f'%{keyword}%')
+            (keyword, str(user_id), after_rank, after_rank, after_id and str(after_id), limit)
         )
         return cur.fetchall()
-    finally:
-        cur.close()
-        con.close()
 
-def get_all_boards(user_id: uuid.UUID):
-    con, cur = get_connection()
-    try:
+def get_all_boards(
+        user_id: uuid.UUID,
+        *,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None):
+    """
+    최신순(created_at, id 내림차순). after=(created_at, id)이면 그 다음부터
+    반환 행: (id, title, content, is_liked, likes, created_at)
+    """
+    after_at, after_id = after if after else (None, None)
+    with db_cursor() as (con, cur):
         cur.execute(
             """
-            SELECT b.title, b.content, l.id is not null AS is_liked, b.likes
+            SELECT b.id, b.title, b.content, l.id is not null AS is_liked, b.likes, b.created_at
             FROM public.board b
             LEFT JOIN public."like" l
-            ON b.id = l.board_id AND l.user_id = %s;
+            ON b.id = l.board_id AND l.user_id = %s
+            WHERE %s::timestamptz IS NULL OR (b.created_at, b.id) < (%s::timestamptz, %s::uuid)
+            ORDER BY b.created_at DESC, b.id DESC
+            LIMIT %s;
             """,
-            (str(user_id),)
+            (str(user_id), after_at, after_at, after_id and str(after_id), limit)
         )
         return cur.fetchall()
-    finally:
-        cur.close()
-        con.close()
 
 def get_board_details(board_id: uuid.UUID, user_id: uuid.UUID):
-    con, cur = get_connection()
-    try:
+    with db_cursor() as (con, cur):
         cur.execute(
             """
             SELECT b.title, b.content, l.id is not null AS is_liked, b.likes, b.plan_id
@@ -50,14 +74,10 @@ def get_board_details(board_id: uuid.UUID, user_id: uuid.UUID):
             (str(user_id), str(board_id))
         )
         return cur.fetchone()
-    finally:
-        cur.close()
-        con.close()
 
 
 def get_plan_by_id(plan_id: uuid.UUID):
-    con, cur = get_connection()
-    try:
+    with db_cursor() as (con, cur):
         cur.execute(
             """
             select p.id, p.start_date, p.end_date, i.todo, i.place, i."time" 
@@ -66,7 +86,4 @@ def get_plan_by_id(plan_id: uuid.UUID):
             """,
             (str(plan_id),)
         )
-        return cur.fetchall()
-    finally:
-        cur.close()
-        con.close()
\ No newline at end of file
+        return cur.fetchall()
\ No newline at end of file
@@ -1,45 +1,69 @@
 import uuid
-from user.repository import get_connection
+from typing import Optional
+from user.repository import db_cursor
 
-def like_board(board_id: uuid.UUID, user_id: uuid.UUID):
-    con, cur = get_connection()
-    try:
+def like_board(board_id: uuid.UUID, user_id: uuid.UUID) -> Optional[int]:
+    """
+    좋아요 추가와 board.likes +1을 한 문장(한 트랜잭션)으로 처리.
+    이미 좋아요한 경우 아무것도 바꾸지 않는다.
+    반환: 새 likes 값 (변경이 없었으면 None)
+    """
+    with db_cursor() as (con, cur):
         cur.execute("""
-        insert into public."like" (id, user_id, board_id)
-            values (%s, %s, %s);
-        """, (str(uuid.uuid4()), str(user_id), str(board_id))
+        WITH ins AS (
+            INSERT INTO public."like" (id, user_id, board_id)
+            VALUES (%s, %s, %s)
+            ON CONFLICT (user_id, board_id) DO NOTHING
+            RETURNING board_id
         )
+        UPDATE board
+        SET likes = COALESCE(likes, 0) + 1
+        WHERE id = (SELECT board_id FROM ins)
+        RETURNING likes;
+        """, (str(uuid.uuid4()), str(user_id), str(board_id)))
+        row = cur.fetchone()
         con.commit()
+    return row[0] if row else None
 
+def delete_like_board(board_id: uuid.UUID, user_id: uuid.UUID) -> Optional[int]:
+    """
+    좋아요 삭제와 board.likes -1을 한 문장(한 트랜잭션)으로 처리.
+    좋아요가 없었으면 아무것도 바꾸지 않는다.
+    반환: 새 likes 값 (변경이 없었으면 None)
+    """
+    with db_cursor() as (con, cur):
         cur.execute("""
-            UPDATE board 
-            SET likes = COALESCE((
-                SELECT COUNT(*) 
-                FROM "like" l 
-                WHERE l.board_id = board.id
-            ), 0)
-            WHERE id IS NOT NULL;
-        """)
-        con.commit()
-    finally:
-        cur.close()
-        con.close()
-
-def delete_like_board(board_id: uuid.UUID, user_id: uuid.UUID):
-    con, cur = get_connection()
-    try:
-        cur.execute("""
-        delete from public."like"
-        where board_id = %s and user_id = %s;
+        WITH del AS (
+            DELETE FROM public."like"
+            WHERE board_id = %s AND user_id = %s
+            RETURNING board_id
+        )
+        UPDATE board
+        SET likes = GREATEST(COALESCE(likes, 0) - 1, 0)
+        WHERE id = (SELECT board_id FROM del)
+        RETURNING likes;
         """, (str(board_id), str(user_id)))
+        row = cur.fetchone()
         con.commit()
+    return row[0] if row else None
 
+def reconcile_like_counts() -> int:
+    """
+    board.likes가 실제 like 행 수와 다른 게시글만 고친다 (일치하는 행은 쓰지 않음).
+    반환: 고친 게시글 수
+    """
+    with db_cursor() as (con, cur):
         cur.execute("""
-        update board
-        set likes= likes - 1
-            where id = %s;
-        """, (str(board_id),))
+        UPDATE board b
+        SET likes = c.cnt
+        FROM (
+            SELECT b2.id, COUNT(l.id)::int AS cnt
+            FROM board b2
+            LEFT JOIN public."like" l ON l.board_id = b2.id
+            GROUP BY b2.id
+        ) c
+        WHERE b.id = c.id AND b.likes IS DISTINCT FROM c.cnt;
+        """)
+        fixed = cur.rowcount
         con.commit()
-    finally:
-        cur.close()
-        con.close()
\ No newline at end of file
+    return fixed
@@ -1,27 +1,52 @@
 import uuid
+from datetime import datetime
 from typing import Optional, List, Any
 
 from board.model.document import BoardResponse, BoardDetailResponse
 
 from board.repository import document as repository
+from util.pagination import DEFAULT_PAGE_SIZE, decode_cursor, page_size, paginate
 
-def get_all_boards(keyword: Optional[str], user_id: uuid.UUID):
-    if keyword is None:
-        rows = repository.get_all_boards(user_id)
-    else:
-        rows = repository.get_all_boards_with_keyword(keyword, user_id)
-    result = []
-    for row in rows:
-        result.append(
-            BoardResponse(
-                board_id=row[0],
-                title=row[1],
-                content=row[2],
-                is_liked=row[3],
-                likes=row[4]
-            )
-        )
-    return {"plans": result}
+def _to_response(row) -> BoardResponse:
+    return BoardResponse(
+        board_id=row[0],
+        title=row[1],
+        content=row[2],
+        is_liked=row[3],
+        likes=row[4]
+    )
+
+def get_all_boards(keyword: Optional[str], user_id: uuid.UUID, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None):
+    if keyword is not None and keyword.strip():
+        return search_boards(keyword, user_id, limit=limit, cursor=cursor)
+    return list_boards(user_id, limit=limit, cursor=cursor)
+
+def list_boards(user_id: uuid.UUID, *, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None):
+    """
+    최신순 목록. 잘못된 cursor는 InvalidCursor
+    cursor: 이전 응답의 next_cursor (created_at, board_id)
+    """
+    limit = page_size(limit)
+    after = decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+    # 한 개 더 읽어 다음 페이지 유무를 판단
+    rows = repository.get_all_boards(user_id, limit=limit + 1, after=after)
+    page, next_cursor = paginate(rows, limit, key=lambda row: (row[5], row[0]))
+    return {"plans": [_to_response(row) for row in page], "next_cursor": next_cursor}
+
+def search_boards(keyword: str, user_id: uuid.UUID, *, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None):
+    """
+    제목/본문 2-gram 검색, 관련도순. 잘못된 cursor는 InvalidCursor
+    cursor: 이전 응답의 next_cursor (관련도, board_id)
+    """
+    limit = page_size(limit)
+    after = decode_cursor(cursor, float, uuid.UUID)
+    # 토큰 분리는 DB(board_tsquery)에서만 한다. 공백뿐이면 조회하지 않는다
+    keyword = (keyword or "").strip()
+    if not keyword:
+        return {"plans": [], "next_cursor": None}
+    rows = repository.search_boards(keyword, user_id, limit=limit + 1, after=after)
+    page, next_cursor = paginate(rows, limit, key=lambda row: (row[5], row[0]))
+    return {"plans": [_to_response(row) for row in page], "next_cursor": next_cursor}
 
 def get_board_details(board_id: uuid.UUID, user_id: uuid.UUID) -> BoardDetailResponse:
     board = repository.get_board_details(board_id, user_id)
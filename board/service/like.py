@@ -1,8 +1,12 @@
+import asyncio
+import os
 import uuid
+from typing import Optional
 
 from fastapi import Body
 
 from board.repository import like as repository
+from util.periodic import PeriodicTask
 
 
 def like_board(
@@ -20,4 +24,36 @@ def delete_like_board(
     repository.delete_like_board(board_id, user_id)
     return {
         "msg" : "좋아요를 성공적으로 취소함"
-    }
\ No newline at end of file
+    }
+
+
+async def reconcile_like_counts() -> int:
+    """board.likes 드리프트 보정 (동기 DB 작업이라 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+    fixed = await asyncio.to_thread(repository.reconcile_like_counts)
+    if fixed:
+        print(f"[board] reconciled likes for {fixed} boards")
+    return fixed
+
+
+_task: Optional[PeriodicTask] = None
+
+
+def start_like_reconcile() -> Optional[PeriodicTask]:
+    """
+    lifespan에서 호출.
+    - BOARD_LIKE_RECONCILE_INTERVAL: 초, 기본 3600 (0이면 비활성)
+    """
+    global _task
+    interval = float(os.getenv("BOARD_LIKE_RECONCILE_INTERVAL", "3600"))
+    if interval <= 0:
+        return None
+    _task = PeriodicTask("board-like-reconcile", interval, reconcile_like_counts, run_immediately=False)
+    _task.start()
+    return _task
+
+
+async def stop_like_reconcile() -> None:
+    global _task
+    if _task is not None:
+        task, _task = _task, None
+        await task.stop()
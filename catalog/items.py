@@ -0,0 +1,115 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+KST = ZoneInfo("Asia/Seoul")
+
+# tour_item 컬럼 ↔ TourAPI 응답 필드 (synced_at 제외, 순서가 곧 행 튜플 순서)
+FIELD_MAP: List[Tuple[str, str]] = [
+    ("content_id", "contentid"),
+    ("content_type_id", "contenttypeid"),
+    ("title", "title"),
+    ("addr1", "addr1"),
+    ("addr2", "addr2"),
+    ("zipcode", "zipcode"),
+    ("tel", "tel"),
+    ("area_code", "areacode"),
+    ("sigungu_code", "sigungucode"),
+    ("cat1", "cat1"),
+    ("cat2", "cat2"),
+    ("cat3", "cat3"),
+    ("lcls1", "lclsSystm1"),
+    ("lcls2", "lclsSystm2"),
+    ("lcls3", "lclsSystm3"),
+    ("l_dong_regn_cd", "lDongRegnCd"),
+    ("l_dong_signgu_cd", "lDongSignguCd"),
+    ("latitude", "mapy"),
+    ("longitude", "mapx"),
+    ("first_image", "firstimage"),
+    ("first_image2", "firstimage2"),
+    ("created_time", "createdtime"),
+    ("modified_time", "modifiedtime"),
+]
+TOUR_ITEM_COLUMNS = [c for c, _ in FIELD_MAP]
+MODIFIED_TIME_IDX = TOUR_ITEM_COLUMNS.index("modified_time")
+_INT_COLUMNS = {"content_type_id", "area_code", "sigungu_code", "l_dong_regn_cd", "l_dong_signgu_cd"}
+_FLOAT_COLUMNS = {"latitude", "longitude"}
+
+TourItemRow = Tuple[Any, ...]
+
+
+def _to_int(v: Any) -> Optional[int]:
+    try:
+        return int(str(v).strip()) if v not in (None, "") else None
+    except ValueError:
+        return None
+
+
+def _to_float(v: Any) -> Optional[float]:
+    try:
+        f = float(v) if v not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+    # TourAPI는 좌표가 없으면 0을 내려준다
+    return f if f else None
+
+
+def _to_str(v: Any) -> Optional[str]:
+    s = str(v).strip() if v is not None else ""
+    return s or None
+
+
+def parse_item(item: Dict[str, Any]) -> Optional[TourItemRow]:
+    """TourAPI 목록 항목 → tour_item 행 튜플. contentid/contenttypeid/title이 없으면 None"""
+    if not item:
+        return None
+    row: List[Any] = []
+    for col, field in FIELD_MAP:
+        v = item.get(field)
+        if col in _INT_COLUMNS:
+            row.append(_to_int(v))
+        elif col in _FLOAT_COLUMNS:
+            row.append(_to_float(v))
+        else:
+            row.append(_to_str(v))
+    content_id, content_type_id, title = row[0], row[1], row[2]
+    if not content_id or content_type_id is None or not title:
+        return None
+    return tuple(row)
+
+
+def row_to_item(row: Any, *, dist: Optional[float] = None) -> Dict[str, Any]:
+    """tour_item 행(컬럼 순서 = TOUR_ITEM_COLUMNS) → TourAPI 응답과 같은 모양의 항목 dict"""
+    item: Dict[str, Any] = {}
+    for i, (_, field) in enumerate(FIELD_MAP):
+        v = row[i]
+        item[field] = "" if v is None else str(v)
+    if dist is not None:
+        item["dist"] = f"{dist:.1f}"
+    return item
+
+
+def as_response(items: List[Dict[str, Any]], *, page_no: int, num_of_rows: int, total: int) -> Dict[str, Any]:
+    """TourAPI 목록 응답 형태로 감싼다 (items_or_empty, paginate 등 기존 파서가 그대로 동작)"""
+    return {
+        "response": {
+            "header": {"resultCode": "0000", "resultMsg": "OK", "source": "mirror"},
+            "body": {
+                "items": {"item": items},
+                "numOfRows": num_of_rows,
+                "pageNo": page_no,
+                "totalCount": total,
+            },
+        }
+    }
+
+
+def parse_modified_time(s: Optional[str]) -> Optional[datetime]:
+    """TourAPI modifiedtime(YYYYMMDDHHMMSS, KST) → aware datetime"""
+    if not s:
+        return None
+    try:
+        return datetime.strptime(s[:14].ljust(14, "0"), "%Y%m%d%H%M%S").replace(tzinfo=KST)
+    except ValueError:
+        return None
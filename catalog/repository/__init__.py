@@ -0,0 +1,2 @@
+# 스키마 생성/변경은 migrations 패키지가 담당 (import 시점에 DB에 접속하지 않는다)
+from user.repository import get_connection, db_cursor
@@ -0,0 +1,166 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from util.async_db_pool import async_connection
+from catalog.items import TOUR_ITEM_COLUMNS, TourItemRow
+
+COLUMNS = ", ".join(TOUR_ITEM_COLUMNS)
+
+# 미러 조회에서 허용하는 동등 조건 컬럼
+FILTER_COLUMNS = {
+    "content_type_id", "area_code", "sigungu_code",
+    "cat1", "cat2", "cat3", "lcls1", "lcls2", "lcls3",
+    "l_dong_regn_cd", "l_dong_signgu_cd",
+}
+
+STATE_COLUMNS = (
+    "name, watermark, last_full_at, last_incremental_at, run_mode, run_status, "
+    "run_started_at, run_finished_at, run_error, pages_done, pages_total, items_upserted, items_deleted"
+)
+
+
+def _where(filters: Dict[str, Any], params: List[Any], image_only: bool) -> List[str]:
+    conds: List[str] = []
+    for col, v in filters.items():
+        if col not in FILTER_COLUMNS:
+            raise ValueError(f"지원하지 않는 필터: {col}")
+        params.append(v)
+        conds.append(f"{col} = ${len(params)}")
+    if image_only:
+        conds.append("COALESCE(first_image, '') <> ''")
+    return conds
+
+
+class AsyncTourItemRepository:
+    """tour_item(미러) / catalog_sync_state 접근 (asyncpg)"""
+
+    async def upsert_items(self, rows: Sequence[TourItemRow]) -> int:
+        if not rows:
+            return 0
+        placeholders = ", ".join(f"${i + 1}" for i in range(len(TOUR_ITEM_COLUMNS)))
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in TOUR_ITEM_COLUMNS[1:])
+        sql = f"""
+        INSERT INTO tour_item ({COLUMNS}, synced_at)
+        VALUES ({placeholders}, now())
+        ON CONFLICT (content_id) DO UPDATE SET {updates}, synced_at = now();
+        """
+        async with async_connection() as con:
+            async with con.transaction():
+                await con.executemany(sql, rows)
+        return len(rows)
+
+    async def delete_items(self, content_ids: Sequence[str]) -> int:
+        if not content_ids:
+            return 0
+        async with async_connection() as con:
+            status = await con.execute("DELETE FROM tour_item WHERE content_id = ANY($1::varchar[]);", list(content_ids))
+        return int(status.split()[-1])
+
+    async def delete_synced_before(self, ts: datetime) -> int:
+        """전체 적재에서 다시 보이지 않은(원본에서 사라진) 항목 제거"""
+        async with async_connection() as con:
+            status = await con.execute("DELETE FROM tour_item WHERE synced_at < $1;", ts)
+        return int(status.split()[-1])
+
+    async def count(self) -> int:
+        async with async_connection() as con:
+            return int(await con.fetchval("SELECT COUNT(*) FROM tour_item;"))
+
+    async def fetch_since(self, since: Optional[datetime] = None) -> List[Any]:
+        """synced_at > since 인 행 (since가 None이면 전체). 마지막 컬럼은 synced_at"""
+        async with async_connection() as con:
+            if since is None:
+                return await con.fetch(f"SELECT {COLUMNS}, synced_at FROM tour_item;")
+            return await con.fetch(f"SELECT {COLUMNS}, synced_at FROM tour_item WHERE synced_at > $1;", since)
+
+    async def find_in_bbox(
+        self,
+        *,
+        min_lat: float, max_lat: float, min_lon: float, max_lon: float,
+        filters: Optional[Dict[str, Any]] = None,
+        image_only: bool = False,
+    ) -> List[Any]:
+        params: List[Any] = [min_lat, max_lat, min_lon, max_lon]
+        conds = ["latitude BETWEEN $1 AND $2", "longitude BETWEEN $3 AND $4"]
+        conds += _where(filters or {}, params, image_only)
+        sql = f"SELECT {COLUMNS} FROM tour_item WHERE {' AND '.join(conds)};"
+        async with async_connection() as con:
+            return await con.fetch(sql, *params)
+
+    async def search_title(
+        self,
+        keyword: str,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        image_only: bool = False,
+        order_by: str = "modified_time DESC",
+        limit: int = 10,
+        offset: int = 0,
+    ) -> Tuple[List[Any], int]:
+        allowed = {"title", "modified_time DESC", "created_time DESC"}
+        ob = order_by if order_by in allowed else "modified_time DESC"
+        params: List[Any] = [f"%{keyword.strip()}%"]
+        conds = ["title ILIKE $1"] + _where(filters or {}, params, image_only)
+        where = " AND ".join(conds)
+        params += [limit, offset]
+        sql = f"""
+        SELECT {COLUMNS}, COUNT(*) OVER () AS total
+        FROM tour_item WHERE {where}
+        ORDER BY {ob}, content_id
+        LIMIT ${len(params) - 1} OFFSET ${len(params)};
+        """
+        async with async_connection() as con:
+            rows = await con.fetch(sql, *params)
+        total = int(rows[0]["total"]) if rows else 0
+        return list(rows), total
+
+    # ---- 동기화 상태 ----
+    async def get_state(self, name: str) -> Optional[Dict[str, Any]]:
+        async with async_connection() as con:
+            row = await con.fetchrow(f"SELECT {STATE_COLUMNS} FROM catalog_sync_state WHERE name = $1;", name)
+        return dict(row) if row else None
+
+    async def start_run(self, name: str, mode: str) -> datetime:
+        sql = """
+        INSERT INTO catalog_sync_state (name, run_mode, run_status, run_started_at, run_finished_at, run_error,
+                                        pages_done, pages_total, items_upserted, items_deleted)
+        VALUES ($1, $2, 'running', now(), NULL, NULL, 0, 0, 0, 0)
+        ON CONFLICT (name) DO UPDATE SET
+            run_mode = EXCLUDED.run_mode, run_status = 'running', run_started_at = now(),
+            run_finished_at = NULL, run_error = NULL,
+            pages_done = 0, pages_total = 0, items_upserted = 0, items_deleted = 0
+        RETURNING run_started_at;
+        """
+        async with async_connection() as con:
+            return await con.fetchval(sql, name, mode)
+
+    async def update_progress(self, name: str, *, pages_done: int, pages_total: int, upserted: int, deleted: int) -> None:
+        sql = """
+        UPDATE catalog_sync_state
+        SET pages_done = $2, pages_total = $3, items_upserted = $4, items_deleted = $5
+        WHERE name = $1;
+        """
+        async with async_connection() as con:
+            await con.execute(sql, name, pages_done, pages_total, upserted, deleted)
+
+    async def finish_run(self, name: str, mode: str, *, watermark: Optional[str]) -> None:
+        """성공 종료. watermark는 기존 값보다 클 때만 전진"""
+        done_col = "last_full_at" if mode == "full" else "last_incremental_at"
+        sql = f"""
+        UPDATE catalog_sync_state
+        SET run_status = 'ok', run_finished_at = now(), {done_col} = now(),
+            watermark = GREATEST(watermark, $2)
+        WHERE name = $1;
+        """
+        async with async_connection() as con:
+            await con.execute(sql, name, watermark)
+
+    async def fail_run(self, name: str, error: str) -> None:
+        sql = """
+        UPDATE catalog_sync_state
+        SET run_status = 'failed', run_finished_at = now(), run_error = $2
+        WHERE name = $1;
+        """
+        async with async_connection() as con:
+            await con.execute(sql, name, error[:2000])
@@ -0,0 +1,158 @@
+from __future__ import annotations
+import math
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from haversine import haversine, Unit
+
+from catalog.items import FIELD_MAP, TOUR_ITEM_COLUMNS, as_response, row_to_item
+from catalog.service.spatial import get_spatial_index
+from catalog.service.sync import STATE_NAME
+from util.cache import BoundedTTLCache, MISSING
+
+# TourAPI 인자명 → tour_item 컬럼 (미러가 지원하는 필터)
+_ARG_COLUMNS = {
+    "content_type_id": "content_type_id",
+    "area_code": "area_code",
+    "sigungu_code": "sigungu_code",
+    "cat1": "cat1", "cat2": "cat2", "cat3": "cat3",
+    "lcls1": "lcls1", "lcls2": "lcls2", "lcls3": "lcls3",
+    "l_dong_regn_cd": "l_dong_regn_cd",
+    "l_dong_signgu_cd": "l_dong_signgu_cd",
+}
+_PAGING_ARGS = {"arrange", "num_of_rows", "page_no"}
+_LAT_IDX = TOUR_ITEM_COLUMNS.index("latitude")
+_LON_IDX = TOUR_ITEM_COLUMNS.index("longitude")
+_ITEM_FIELDS = dict(FIELD_MAP)
+
+# 준비 여부(동기화 상태) 조회 결과는 잠깐 기억해 요청마다 상태 테이블을 읽지 않는다
+_ready_cache = BoundedTTLCache(max_entries=1, ttl_seconds=60.0)
+
+
+def mirror_enabled() -> bool:
+    return os.getenv("CATALOG_MIRROR_ENABLED", "1").lower() not in ("0", "false", "no")
+
+
+def _filters(args: Dict[str, Any], known: set) -> Optional[Dict[str, Any]]:
+    """지원하지 않는 인자가 있으면 None (→ 라이브 API로 위임)"""
+    out: Dict[str, Any] = {}
+    for k, v in args.items():
+        if v is None or k in known or k in _PAGING_ARGS:
+            continue
+        col = _ARG_COLUMNS.get(k)
+        if col is None:
+            return None
+        out[col] = int(v) if col in ("content_type_id", "area_code", "sigungu_code", "l_dong_regn_cd", "l_dong_signgu_cd") else str(v)
+    return out
+
+
+def _paging(args: Dict[str, Any]) -> tuple:
+    num_of_rows = max(1, int(args.get("num_of_rows") or 10))
+    page_no = max(1, int(args.get("page_no") or 1))
+    return num_of_rows, page_no
+
+
+class CatalogMirror:
+    """
+    로컬 tour_item 미러에서 TourAPI 목록 응답과 같은 모양의 결과를 만든다.
+    미러가 준비되지 않았거나(전체 적재 전, 동기화 지연 초과) 지원하지 않는 인자가 있으면 None을 반환하고,
+    호출부는 라이브 TourAPI로 대체한다.
+    - CATALOG_MIRROR_ENABLED: 기본 1 (0이면 항상 라이브)
+    - CATALOG_MAX_LAG: 마지막 성공 동기화 후 허용 경과 시간(초), 기본 2일
+    repo: catalog.repository.tour_item_async.AsyncTourItemRepository 호환 객체
+    """
+    def __init__(self, repo: Any) -> None:
+        self.repo = repo
+        self.max_lag = float(os.getenv("CATALOG_MAX_LAG", str(2 * 24 * 3600)))
+
+    async def ready(self) -> bool:
+        if not mirror_enabled():
+            return False
+        cached = _ready_cache.get(STATE_NAME)
+        if cached is not MISSING:
+            return cached
+        try:
+            state = await self.repo.get_state(STATE_NAME) or {}
+        except Exception:
+            state = {}
+        ok = False
+        if state.get("last_full_at"):
+            last_ok = max(t for t in (state.get("last_full_at"), state.get("last_incremental_at")) if t)
+            ok = (datetime.now(timezone.utc) - last_ok).total_seconds() <= self.max_lag
+        _ready_cache.set(STATE_NAME, ok)
+        return ok
+
+    async def location_based_list(self, **args: Any) -> Optional[Dict[str, Any]]:
+        """
+        locationBasedList2 대체: 적재된 메모리 공간 인덱스가 있으면 그것으로,
+        없으면 DB 바운딩 박스로 후보를 읽어 실제 거리로 반경 필터/정렬
+        """
+        filters = _filters(args, {"map_x", "map_y", "radius"})
+        if filters is None or not await self.ready():
+            return None
+        lon, lat, radius = float(args["map_x"]), float(args["map_y"]), float(args["radius"])
+        arrange = str(args.get("arrange") or "").upper()
+        image_only = arrange in ("O", "Q", "R", "S")
+        num_of_rows, page_no = _paging(args)
+
+        index = get_spatial_index()
+        if index is not None:
+            hits = self._from_index(index, lat, lon, radius, filters, image_only)
+        else:
+            hits = await self._from_db(lat, lon, radius, filters, image_only)
+
+        if arrange in ("E", "S"):
+            hits.sort(key=lambda h: h[0])
+        elif arrange in ("A", "O"):
+            hits.sort(key=lambda h: h[1].get("title") or "")
+        elif arrange in ("D", "R"):
+            hits.sort(key=lambda h: h[1].get("createdtime") or "", reverse=True)
+        else:
+            hits.sort(key=lambda h: h[1].get("modifiedtime") or "", reverse=True)
+        page = hits[(page_no - 1) * num_of_rows: page_no * num_of_rows]
+        items = [dict(item, dist=f"{d:.1f}") for d, item in page]
+        return as_response(items, page_no=page_no, num_of_rows=num_of_rows, total=len(hits))
+
+    def _from_index(self, index, lat: float, lon: float, radius: float, filters: Dict[str, Any], image_only: bool) -> list:
+        ctype = filters.pop("content_type_id", None)
+        wanted = {_ITEM_FIELDS[c]: str(v) for c, v in filters.items()}
+        hits = []
+        for d, cid in index.radius(lat, lon, radius, ctype):
+            item = index.payload(cid)
+            if item is None or (image_only and not item.get("firstimage")):
+                continue
+            if any(item.get(f) != v for f, v in wanted.items()):
+                continue
+            hits.append((d, item))
+        return hits
+
+    async def _from_db(self, lat: float, lon: float, radius: float, filters: Dict[str, Any], image_only: bool) -> list:
+        dlat = radius / 111_320.0
+        dlon = radius / (111_320.0 * max(0.01, math.cos(math.radians(lat))))
+        rows = await self.repo.find_in_bbox(
+            min_lat=lat - dlat, max_lat=lat + dlat, min_lon=lon - dlon, max_lon=lon + dlon,
+            filters=filters, image_only=image_only,
+        )
+        hits = []
+        for r in rows:
+            d = haversine((lat, lon), (r[_LAT_IDX], r[_LON_IDX]), unit=Unit.METERS)
+            if d <= radius:
+                hits.append((d, row_to_item(r)))
+        return hits
+
+    async def search_keyword(self, **args: Any) -> Optional[Dict[str, Any]]:
+        """searchKeyword2 대체: 제목 부분 일치"""
+        filters = _filters(args, {"keyword"})
+        keyword = str(args.get("keyword") or "").strip()
+        if filters is None or not keyword or not await self.ready():
+            return None
+        arrange = str(args.get("arrange") or "").upper()
+        num_of_rows, page_no = _paging(args)
+        order_by = {"A": "title", "O": "title", "D": "created_time DESC", "R": "created_time DESC"}.get(arrange, "modified_time DESC")
+        rows, total = await self.repo.search_title(
+            keyword, filters=filters, image_only=arrange in ("O", "Q", "R"),
+            order_by=order_by, limit=num_of_rows, offset=(page_no - 1) * num_of_rows,
+        )
+        items = [row_to_item(r) for r in rows]
+        return as_response(items, page_no=page_no, num_of_rows=num_of_rows, total=total)
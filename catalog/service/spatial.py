@@ -0,0 +1,117 @@
+from __future__ import annotations
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from catalog.items import TOUR_ITEM_COLUMNS, row_to_item
+from util.periodic import PeriodicTask
+from util.spatial_index import GeoGridIndex
+
+_ID_IDX = TOUR_ITEM_COLUMNS.index("content_id")
+_TYPE_IDX = TOUR_ITEM_COLUMNS.index("content_type_id")
+_LAT_IDX = TOUR_ITEM_COLUMNS.index("latitude")
+_LON_IDX = TOUR_ITEM_COLUMNS.index("longitude")
+_SYNCED_AT_IDX = len(TOUR_ITEM_COLUMNS)
+
+# synced_at은 트랜잭션 시작 시각이라 늦게 커밋된 행이 워터마크보다 과거일 수 있어 겹쳐서 다시 읽는다
+_REFRESH_OVERLAP = timedelta(minutes=5)
+
+# 증분 갱신은 살아 있는 인덱스를 이벤트 루프에서 고치므로 이만큼씩 끊어 다른 요청에 양보한다
+_REFRESH_CHUNK = 2000
+
+_index: Optional[GeoGridIndex] = None
+
+
+def get_spatial_index() -> Optional[GeoGridIndex]:
+    """로드가 끝난 공간 인덱스 (아직 없으면 None → 호출부는 DB 조회로 대체)"""
+    return _index
+
+
+class SpatialIndexLoader:
+    """
+    tour_item 미러를 메모리 GeoGridIndex로 적재하고 주기적으로 갱신한다.
+    - refresh(): synced_at 이후 변경된 행만 반영 (증분)
+    - rebuild_interval마다 전체 재적재해 원본에서 삭제된 항목도 정리
+      (새 인덱스는 스레드에서 만들고 완성된 뒤 참조만 교체 → 적재 중에도 이벤트 루프가 막히지 않는다)
+    repo: catalog.repository.tour_item_async.AsyncTourItemRepository 호환 객체
+    """
+    def __init__(self, repo: Any, *, precision: int = 5, rebuild_interval: float = 6 * 3600.0) -> None:
+        self.repo = repo
+        self.precision = precision
+        self.rebuild_interval = rebuild_interval
+        self._since: Optional[datetime] = None
+        self._built_at = 0.0
+        self.last_load_ms = 0.0
+
+    def _apply(self, index: GeoGridIndex, rows) -> None:
+        for r in rows:
+            lat, lon = r[_LAT_IDX], r[_LON_IDX]
+            if lat is None or lon is None:
+                index.remove(r[_ID_IDX])
+                continue
+            index.add(r[_ID_IDX], lat, lon, r[_TYPE_IDX], payload=row_to_item(r))
+            synced_at = r[_SYNCED_AT_IDX]
+            if synced_at is not None and (self._since is None or synced_at > self._since):
+                self._since = synced_at
+
+    async def rebuild(self) -> GeoGridIndex:
+        global _index
+        t0 = time.monotonic()
+        self._since = None
+        index = GeoGridIndex(self.precision)
+        rows = await self.repo.fetch_since(None)
+        # 아직 아무도 보지 않는 새 인덱스라 스레드에서 채워도 읽기와 경합하지 않는다
+        await asyncio.to_thread(self._apply, index, rows)
+        _index = index
+        self._built_at = time.monotonic()
+        self.last_load_ms = (time.monotonic() - t0) * 1000.0
+        print(f"[catalog] spatial index rebuilt: {index.stats()['points']} points in {self.last_load_ms:.0f}ms")
+        return index
+
+    async def refresh(self) -> None:
+        if _index is None or time.monotonic() - self._built_at >= self.rebuild_interval:
+            await self.rebuild()
+            return
+        since = self._since - _REFRESH_OVERLAP if self._since is not None else None
+        rows = await self.repo.fetch_since(since)
+        index = _index
+        for i in range(0, len(rows), _REFRESH_CHUNK):
+            self._apply(index, rows[i:i + _REFRESH_CHUNK])
+            await asyncio.sleep(0)
+
+
+_task: Optional[PeriodicTask] = None
+
+
+def start_spatial_index(repo: Any) -> Optional[PeriodicTask]:
+    """
+    lifespan에서 호출: 백그라운드에서 적재 후 주기적으로 갱신.
+    - CATALOG_INDEX_ENABLED: 기본 1
+    - CATALOG_INDEX_PRECISION: geohash 자리수, 기본 5 (≈4.9km 셀)
+    - CATALOG_INDEX_REFRESH: 증분 갱신 주기(초), 기본 300
+    - CATALOG_INDEX_REBUILD: 전체 재적재 주기(초), 기본 21600
+    """
+    global _task
+    if os.getenv("CATALOG_INDEX_ENABLED", "1").lower() in ("0", "false", "no"):
+        return None
+    loader = SpatialIndexLoader(
+        repo,
+        precision=int(os.getenv("CATALOG_INDEX_PRECISION", "5")),
+        rebuild_interval=float(os.getenv("CATALOG_INDEX_REBUILD", str(6 * 3600))),
+    )
+    _task = PeriodicTask("catalog-spatial-index", float(os.getenv("CATALOG_INDEX_REFRESH", "300")), loader.refresh)
+    _task.start()
+    return _task
+
+
+async def stop_spatial_index() -> None:
+    global _task
+    if _task is not None:
+        task, _task = _task, None
+        await task.stop()
+
+
+def spatial_index_stats() -> Dict[str, Any]:
+    return _index.stats() if _index is not None else {"points": 0, "loaded": False}
@@ -0,0 +1,133 @@
+from __future__ import annotations
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from catalog.items import MODIFIED_TIME_IDX, parse_item, parse_modified_time
+from rag.normalizers import items_or_empty
+from rag.paging import paginate_concurrent, page_info
+from tourapi.client import TourAPIClient
+
+STATE_NAME = "tour_item"
+
+
+class CatalogSync:
+    """
+    TourAPI 카탈로그를 로컬 tour_item 테이블로 동기화한다.
+    - full_load: areaBasedList2 전체 페이지를 적재하고, 이번 적재에서 보이지 않은 행은 삭제
+    - incremental: areaBasedSyncList2를 modifiedtime 워터마크 이후로 조회해
+      showflag=1은 upsert, showflag=0은 삭제
+    진행률(pages_done/pages_total)과 처리 건수는 catalog_sync_state에 페이지마다 기록한다.
+    repo: catalog.repository.tour_item_async.AsyncTourItemRepository 호환 객체
+    """
+    def __init__(self, client: TourAPIClient, repo: Any, *, page_size: int = 500, window: int = 4, max_pages: int = 100_000) -> None:
+        self.client = client
+        self.repo = repo
+        self.page_size = page_size
+        self.window = window
+        self.max_pages = max_pages
+
+    async def full_load(self) -> Dict[str, Any]:
+        async def fetch(p: Dict[str, Any]) -> Dict[str, Any]:
+            return await self.client.get_area_based_list(arrange="C", **p)
+        return await self._run("full", fetch)
+
+    async def incremental(self) -> Dict[str, Any]:
+        state = await self.repo.get_state(STATE_NAME) or {}
+        watermark = state.get("watermark")
+        if not watermark:
+            raise ValueError("워터마크가 없습니다. 먼저 전체 적재(full)를 실행하세요.")
+
+        # modifiedtime은 일 단위(YYYYMMDD)로 조회되므로 같은 날의 변경은 다시 받는다 (upsert라 멱등)
+        async def fetch(p: Dict[str, Any]) -> Dict[str, Any]:
+            return await self.client.get_area_based_sync_list(modified_time=watermark[:8], arrange="C", **p)
+        return await self._run("incremental", fetch)
+
+    async def _run(self, mode: str, fetch) -> Dict[str, Any]:
+        started_at = await self.repo.start_run(STATE_NAME, mode)
+        t0 = time.monotonic()
+        pages_done = pages_total = upserted = deleted = 0
+        watermark: Optional[str] = None
+        try:
+            async for page in paginate_concurrent(
+                fetch, {"num_of_rows": self.page_size, "page_no": 1},
+                max_pages=self.max_pages, window=self.window,
+            ):
+                if pages_done == 0:
+                    info = page_info(page, 1, self.page_size)
+                    if info:
+                        _, num_rows, total = info
+                        pages_total = min(self.max_pages, max(1, -(-total // max(1, num_rows))))
+                upserts: List[tuple] = []
+                removals: List[str] = []
+                for item in items_or_empty(page):
+                    row = parse_item(item)
+                    if row is None:
+                        continue
+                    mt = row[MODIFIED_TIME_IDX]
+                    if mt and (watermark is None or mt > watermark):
+                        watermark = mt
+                    # areaBasedList2에는 showflag가 없다 → 노출 항목으로 간주
+                    if str(item.get("showflag", "1")).strip() == "0":
+                        removals.append(row[0])
+                    else:
+                        upserts.append(row)
+                upserted += await self.repo.upsert_items(upserts)
+                deleted += await self.repo.delete_items(removals)
+                pages_done += 1
+                await self.repo.update_progress(
+                    STATE_NAME, pages_done=pages_done, pages_total=pages_total, upserted=upserted, deleted=deleted,
+                )
+                print(f"[catalog] {mode} page {pages_done}/{pages_total} upserted={upserted} deleted={deleted}")
+
+            if mode == "full" and pages_done and pages_done >= pages_total:
+                # 모든 페이지를 받은 경우에만 원본에서 사라진 행 정리
+                deleted += await self.repo.delete_synced_before(started_at)
+                await self.repo.update_progress(
+                    STATE_NAME, pages_done=pages_done, pages_total=pages_total, upserted=upserted, deleted=deleted,
+                )
+            await self.repo.finish_run(STATE_NAME, mode, watermark=watermark)
+        except Exception as e:
+            await self.repo.fail_run(STATE_NAME, f"{type(e).__name__}: {e}")
+            raise
+        return {
+            "mode": mode,
+            "pages": pages_done,
+            "pages_total": pages_total,
+            "upserted": upserted,
+            "deleted": deleted,
+            "watermark": watermark,
+            "elapsed_s": round(time.monotonic() - t0, 2),
+        }
+
+    async def status(self) -> Dict[str, Any]:
+        """동기화 진행/지연 지표"""
+        state = await self.repo.get_state(STATE_NAME) or {}
+        return sync_metrics(state, await self.repo.count())
+
+
+def sync_metrics(state: Dict[str, Any], items: int, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    - watermark_lag_s: 현재 시각 - 미러가 반영한 최신 modifiedtime
+    - since_last_sync_s: 마지막 성공(full/incremental) 이후 경과 시간
+    """
+    now = now or datetime.now(timezone.utc)
+    wm = parse_modified_time(state.get("watermark"))
+    last_ok = max([t for t in (state.get("last_full_at"), state.get("last_incremental_at")) if t], default=None)
+    pages_total = state.get("pages_total") or 0
+    return {
+        "items": items,
+        "watermark": state.get("watermark"),
+        "watermark_lag_s": round((now - wm).total_seconds()) if wm else None,
+        "last_full_at": state.get("last_full_at"),
+        "last_incremental_at": state.get("last_incremental_at"),
+        "since_last_sync_s": round((now - last_ok).total_seconds()) if last_ok else None,
+        "run_mode": state.get("run_mode"),
+        "run_status": state.get("run_status"),
+        "run_error": state.get("run_error"),
+        "progress": round((state.get("pages_done") or 0) / pages_total, 3) if pages_total else None,
+        "pages_done": state.get("pages_done") or 0,
+        "pages_total": pages_total,
+        "items_upserted": state.get("items_upserted") or 0,
+        "items_deleted": state.get("items_deleted") or 0,
+    }
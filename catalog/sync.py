@@ -0,0 +1,59 @@
+"""
+TourAPI 카탈로그 미러 동기화 CLI/워커.
+
+    python -m catalog.sync full                  # areaBasedList2 전체 적재
+    python -m catalog.sync incremental           # areaBasedSyncList2 증분 (워터마크 이후)
+    python -m catalog.sync incremental --loop 3600   # 워커: 1시간마다 증분
+    python -m catalog.sync status                # 진행률/지연 지표(JSON)
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+
+from dotenv import load_dotenv
+
+
+async def _main(args: argparse.Namespace) -> None:
+    # DB/테이블 생성은 실행 시점에만 (import만으로 DB에 접속하지 않도록)
+    from catalog.repository.tour_item_async import AsyncTourItemRepository
+    from catalog.service.sync import CatalogSync
+    from tourapi.client import TourAPIClient
+    from util.async_db_pool import close_async_pool
+
+    api_key = os.getenv("TOURAPI_KEY")
+    if not api_key and args.command != "status":
+        raise SystemExit("TOURAPI_KEY 환경 변수가 설정되지 않았습니다.")
+    # 동기화는 항상 원본을 읽어야 하므로 응답 캐시를 쓰지 않는 전용 클라이언트
+    client = TourAPIClient(api_key or "", timeout=float(os.getenv("TOURAPI_TIMEOUT", "30")))
+    sync = CatalogSync(client, AsyncTourItemRepository(), page_size=args.page_size, window=args.window)
+    try:
+        while True:
+            if args.command == "full":
+                result = await sync.full_load()
+            elif args.command == "incremental":
+                result = await sync.incremental()
+            else:
+                result = await sync.status()
+            print(json.dumps(result, ensure_ascii=False, default=str))
+            if not args.loop or args.command == "status":
+                break
+            await asyncio.sleep(args.loop)
+    finally:
+        await client.close()
+        await close_async_pool()
+
+
+def main() -> None:
+    load_dotenv()
+    parser = argparse.ArgumentParser(prog="python -m catalog.sync", description="TourAPI 카탈로그 미러 동기화")
+    parser.add_argument("command", choices=["full", "incremental", "status"])
+    parser.add_argument("--page-size", type=int, default=int(os.getenv("CATALOG_PAGE_SIZE", "500")))
+    parser.add_argument("--window", type=int, default=int(os.getenv("CATALOG_FETCH_WINDOW", "4")), help="동시에 가져올 페이지 수")
+    parser.add_argument("--loop", type=float, default=0, help="초 단위 반복 주기 (0이면 한 번 실행)")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# kakao/client.py
+from __future__ import annotations
+from typing import Any, Dict, Optional
+from httpx import AsyncClient, Limits
+
+from util.cache import BoundedTTLCache, MISSING
+from util.singleflight import SingleFlight
+
+BASE_URL = "https://dapi.kakao.com"
+
+
+def normalize_keyword(keyword: str) -> str:
+    """캐시 키용 정규화: 앞뒤/연속 공백 정리 + 소문자"""
+    return " ".join((keyword or "").split()).lower()
+
+
+class KakaoLocalClient:
+    """
+    Kakao Local REST(키워드 검색) 비동기 클라이언트. 앱 전역에서 하나를 공유한다.
+    - 정규화한 키워드 단위로 첫 번째 검색 결과를 cache_ttl 동안 캐시
+    - 결과가 없는 키워드도 miss_ttl 동안 기억해 반복 호출을 막는다
+    - 네트워크/HTTP 오류는 캐시하지 않고 예외로 올려 '결과 없음'(None)과 구분한다
+    - 캐시 미스인 같은 키워드가 동시에 들어오면 SingleFlight로 한 번만 호출
+    """
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        cache_size: int = 2048,
+        cache_ttl: float = 3600.0,
+        miss_ttl: float = 60.0,
+    ) -> None:
+        self.api_key = api_key
+        self.miss_ttl = miss_ttl
+        self.client = AsyncClient(
+            base_url=BASE_URL,
+            timeout=timeout,
+            headers={"Authorization": f"KakaoAK {api_key}"},
+            limits=Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        self.cache = BoundedTTLCache(max_entries=cache_size, ttl_seconds=cache_ttl)
+        self.inflight = SingleFlight()
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    async def search_keyword_first(self, keyword: str) -> Optional[Dict[str, Any]]:
+        """
+        키워드 검색 첫 번째 document(dict)를 반환. 결과가 없으면 None.
+        네트워크/HTTP 오류(httpx.HTTPError 등)는 그대로 전파한다.
+        """
+        key = normalize_keyword(keyword)
+        if not self.api_key or not key:
+            return None
+
+        cached = self.cache.get(key)
+        if cached is not MISSING:
+            return cached
+        return await self.inflight.do(key, lambda: self._fetch_first(key, keyword.strip()))
+
+    async def _fetch_first(self, key: str, query: str) -> Optional[Dict[str, Any]]:
+        r = await self.client.get(
+            "/v2/local/search/keyword.json",
+            params={"query": query, "size": 1, "page": 1},
+        )
+        r.raise_for_status()
+        data = r.json()
+
+        docs = data.get("documents") or []
+        first = docs[0] if docs else None
+        self.cache.set(key, first, ttl=None if first else self.miss_ttl)
+        return first
+
+    def stats(self) -> Dict[str, Any]:
+        return {"cache": self.cache.stats(), "singleflight": self.inflight.stats()}
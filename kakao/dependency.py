@@ -0,0 +1,43 @@
+# kakao/dependency.py
+from __future__ import annotations
+import os
+from typing import Optional
+
+from .client import KakaoLocalClient
+
+_client: Optional[KakaoLocalClient] = None
+
+
+def init_kakao_client() -> KakaoLocalClient:
+    """
+    앱 전역 KakaoLocalClient 생성 (FastAPI lifespan에서 호출).
+    - KAKAO_REST_API_KEY: 없으면 모든 조회가 None
+    - KAKAO_TIMEOUT: 기본 10초
+    - KAKAO_MAX_CONNECTIONS / KAKAO_MAX_KEEPALIVE: 기본 20 / 10
+    - KAKAO_CACHE_SIZE: 기본 2048개
+    - KAKAO_CACHE_TTL: 기본 3600초, KAKAO_MISS_TTL: 기본 60초
+    """
+    global _client
+    if _client is None:
+        _client = KakaoLocalClient(
+            os.getenv("KAKAO_REST_API_KEY", ""),
+            timeout=float(os.getenv("KAKAO_TIMEOUT", "10")),
+            max_connections=int(os.getenv("KAKAO_MAX_CONNECTIONS", "20")),
+            max_keepalive_connections=int(os.getenv("KAKAO_MAX_KEEPALIVE", "10")),
+            cache_size=int(os.getenv("KAKAO_CACHE_SIZE", "2048")),
+            cache_ttl=float(os.getenv("KAKAO_CACHE_TTL", "3600")),
+            miss_ttl=float(os.getenv("KAKAO_MISS_TTL", "60")),
+        )
+    return _client
+
+
+def get_kakao_client() -> KakaoLocalClient:
+    """FastAPI 의존성: 공유 KakaoLocalClient 반환 (lifespan 밖에서 호출되면 지연 생성)"""
+    return _client if _client is not None else init_kakao_client()
+
+
+async def close_kakao_client() -> None:
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.close()
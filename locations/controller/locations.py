@@ -1,9 +1,14 @@
-from fastapi import APIRouter, HTTPException, Body, Header, Depends
+from fastapi import APIRouter, HTTPException, Body, Header, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from locations.service.locations import recommend
 from locations.model.request.request import RecommendRequest
-from locations.model.response.response import RecommendResponse
+from locations.model.response.response import RecommendResponse, TrendingResponse
+from locations.repository.trend_async import AsyncTrendRepository
+from locations.service.trend import trending_near
 from locations.constants import CONTENTTYPE
+from tourapi.client import TourAPIClient
+from tourapi.dependency import get_tourapi_client
+from util.pagination import InvalidCursor
 
 router = APIRouter(prefix="/api", tags=["장소 추천"])
 security = HTTPBearer(auto_error=False)
@@ -18,7 +23,7 @@ security = HTTPBearer(auto_error=False)
     tags=["장소 추천"],
     responses={
         400: {
-            "description": "유효하지 않은 콘텐츠 유형입니다.",
+            "description": "유효하지 않은 콘텐츠 유형 또는 cursor입니다.",
             "content": {
                 "application/json": {
                     "examples": {
@@ -68,6 +73,7 @@ async def locations(
         },
     ),
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    tour: TourAPIClient = Depends(get_tourapi_client),
 ):
     # 콘텐츠 유형 검증
     type_id = CONTENTTYPE.get(req.type)
@@ -78,6 +84,44 @@ async def locations(
         # Authorization 헤더 추출
         auth_header = f"Bearer {credentials.credentials}" if credentials else None
         # RecommendResponse 객체 반환
-        return await recommend(type_id, req.origin.longitude, req.origin.latitude, auth_header)
+        return await recommend(
+            type_id, req.origin.longitude, req.origin.latitude, auth_header,
+            client=tour, limit=req.limit, cursor=req.cursor,
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/locations/trending",
+    response_model=TrendingResponse,
+    summary="주변 트렌드 장소",
+    description="기준 좌표 반경 안에서 최근 24시간/7일 북마크·평점 활동이 많은 장소를 점수순으로 반환합니다.",
+    tags=["장소 추천"],
+)
+async def trending(
+    longitude: float = Query(..., ge=-180, le=180, description="경도"),
+    latitude: float = Query(..., ge=-90, le=90, description="위도"),
+    radius: int = Query(10_000, ge=100, le=50_000, description="반경(m)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 개수"),
+):
+    try:
+        rows = await trending_near(AsyncTrendRepository(), latitude, longitude, radius, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return TrendingResponse(items=[
+        {
+            "place_id": r["place_id"],
+            "place_name": r["name"],
+            "address": r["address"] or "",
+            "image": r["image_url"] or "",
+            "distance": r["distance"],
+            "bookmarks_24h": r["bookmarks_24h"],
+            "bookmarks_7d": r["bookmarks_7d"],
+            "ratings_24h": r["ratings_24h"],
+            "ratings_7d": r["ratings_7d"],
+        }
+        for r in rows
+    ])
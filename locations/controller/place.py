@@ -1,6 +1,10 @@
-from fastapi import APIRouter, HTTPException, Path, Query, Header
+from fastapi import APIRouter, HTTPException, Path, Query, Header, Depends
 from locations.model.response.place import PlaceResponse, PlaceDetailResponse
 from locations.service.place import PlaceService
+from tourapi.client import TourAPIClient
+from tourapi.dependency import get_tourapi_client
+from kakao.client import KakaoLocalClient
+from kakao.dependency import get_kakao_client
 
 router = APIRouter(prefix="/api/locations/place", tags=["장소"])
 
@@ -66,8 +70,10 @@ async def get_place_detail(
     longitude: float | None = Query(default=None, description="현재 위치 경도"),
     latitude: float | None = Query(default=None, description="현재 위치 위도"),
     Authorization: str | None = Header(default=None),
+    tour: TourAPIClient = Depends(get_tourapi_client),
+    kakao: KakaoLocalClient = Depends(get_kakao_client),
 ):
-    service = PlaceService()
+    service = PlaceService(tour=tour, kakao=kakao)
     return await service.get_place_detail(q, longitude=longitude, latitude=latitude, authorization=Authorization)
 
 @router.get(
@@ -193,6 +199,8 @@ async def get_or_create_place(
     longitude: float | None = Query(default=None, description="현재 위치 경도"),
     latitude: float | None = Query(default=None, description="현재 위치 위도"),
     Authorization: str | None = Header(default=None),
+    tour: TourAPIClient = Depends(get_tourapi_client),
+    kakao: KakaoLocalClient = Depends(get_kakao_client),
 ):
-    service = PlaceService()
+    service = PlaceService(tour=tour, kakao=kakao)
     return await service.get_or_create_place(place_name, longitude=longitude, latitude=latitude, authorization=Authorization)
\ No newline at end of file
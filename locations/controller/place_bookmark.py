@@ -60,7 +60,7 @@ def _get_current_user(credentials: HTTPAuthorizationCredentials = Security(secur
         }
     },
 )
-async def get_bookmark_status(
+def get_bookmark_status(
     place_id: UUID = Path(..., description="장소 ID"),
     user_id: UUID = Path(..., description="사용자 ID"),
     current: CurrentUser = Depends(_get_current_user),
@@ -90,7 +90,7 @@ async def get_bookmark_status(
         }
     },
 )
-async def add_bookmark(
+def add_bookmark(
     req: BookmarkRequest = Body(
         ...,
         description="북마크 추가 요청 바디",
@@ -131,7 +131,7 @@ async def add_bookmark(
         }
     },
 )
-async def remove_bookmark(
+def remove_bookmark(
     req: BookmarkRequest = Body(
         ...,
         description="북마크 삭제 요청 바디",
@@ -50,7 +50,7 @@ def _get_current_user(credentials: HTTPAuthorizationCredentials = Security(secur
         }
     }
 )
-async def get_rating(place_id: UUID = Path(..., description="조회할 장소의 ID")):
+def get_rating(place_id: UUID = Path(..., description="조회할 장소의 ID")):
     service = RatingService()
     return service.get_rating(place_id)
 
@@ -86,7 +86,7 @@ async def get_rating(place_id: UUID = Path(..., description="조회할 장소의
         }
     }
 )
-async def add_rating(
+def add_rating(
     req: RatingRequest = Body(
         ...,
         description="추가할 평점 정보",
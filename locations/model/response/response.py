@@ -1,7 +1,22 @@
 from pydantic import BaseModel, Field, confloat
-from typing import List
+from typing import List, Optional
 from locations.model.response.place import *
 
 class RecommendResponse(BaseModel):
     type: PlaceType = Field(..., description="요청 때 사용되었던 타입")
-    items: List[PlaceResponse] = Field(..., description="장소와 그 세부 사항의 리스트")
\ No newline at end of file
+    items: List[PlaceResponse] = Field(..., description="장소와 그 세부 사항의 리스트")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
+
+class TrendingPlaceResponse(BaseModel):
+    place_id: UUID
+    place_name: str
+    address: str = Field("", description="주소")
+    image: str = Field("", description="이미지 url")
+    distance: int = Field(..., ge=0, description="현재 위치로부터 거리(m)")
+    bookmarks_24h: int = Field(..., description="최근 24시간 북마크 증감")
+    bookmarks_7d: int = Field(..., description="최근 7일 북마크 증감")
+    ratings_24h: int = Field(..., description="최근 24시간 평점 등록 수")
+    ratings_7d: int = Field(..., description="최근 7일 평점 등록 수")
+
+class TrendingResponse(BaseModel):
+    items: List[TrendingPlaceResponse] = Field(..., description="트렌드 점수순 장소 리스트")
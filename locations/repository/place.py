@@ -1,112 +1,302 @@
 import uuid
-from typing import Optional, List, Dict, Any
-from locations.repository import get_connection
+from typing import Optional, List, Dict, Any, Sequence, Tuple
+from psycopg2.extras import execute_values
+from locations.repository import db_cursor
+
+def overall_rating_sql(alias: str = "") -> str:
+    """평균 평점은 저장하지 않고 누적 합/개수(rating_sum, rating_count)로 읽을 때 계산한다"""
+    p = f"{alias}." if alias else ""
+    return (
+        f"CASE WHEN {p}rating_count > 0 "
+        f"THEN ROUND({p}rating_sum::numeric / {p}rating_count, 1) ELSE 0 END"
+    )
+
+def _place_columns(alias: str = "") -> str:
+    p = f"{alias}." if alias else ""
+    return (
+        f"{p}place_id, {p}name, {p}address, {overall_rating_sql(alias)} AS overall_rating, {p}overall_bookmark, "
+        f"{p}latitude, {p}longitude, {p}image_url, {p}content_id, {p}fetched_at"
+    )
+
+PLACE_COLUMNS = _place_columns()
+# UPDATE ... FROM 처럼 별칭 p가 필요한 쿼리용
+PLACE_COLUMNS_P = _place_columns("p")
+
+# (address, name) 쌍. 어느 한쪽은 None/빈 문자열일 수 있다.
+PlacePair = Tuple[Optional[str], Optional[str]]
+
+# 외부(Kakao/TourAPI)에서 얻은 보조 정보: latitude, longitude, image_url, content_id
+PlaceDetails = Dict[str, Any]
+
+# (place_id, name, address, latitude, longitude, image_url, content_id)
+PlaceInsertRow = Tuple[uuid.UUID, str, Optional[str], Optional[float], Optional[float], Optional[str], Optional[str]]
+
+# (place_id, latitude, longitude, image_url, content_id)
+PlaceDetailRow = Tuple[uuid.UUID, Optional[float], Optional[float], Optional[str], Optional[str]]
+
+def _row_to_dict(row) -> Dict[str, Any]:
+    """PLACE_COLUMNS 순서의 행(tuple 또는 asyncpg Record)을 dict로 변환"""
+    return {
+        "place_id": row[0],
+        "name": row[1],
+        "address": row[2],
+        "overall_rating": row[3],
+        "overall_bookmark": row[4],
+        "latitude": row[5],
+        "longitude": row[6],
+        "image_url": row[7],
+        "content_id": row[8],
+        "fetched_at": row[9],
+    }
+
+def _empty_place(place_id: uuid.UUID, name: str, address: Optional[str]) -> Dict[str, Any]:
+    return {
+        "place_id": str(place_id), "name": name, "address": address,
+        "overall_rating": 0.0, "overall_bookmark": 0,
+        "latitude": None, "longitude": None, "image_url": None, "content_id": None, "fetched_at": None,
+    }
+
+def detail_row(place_id: Any, details: Optional[PlaceDetails]) -> PlaceDetailRow:
+    d = details or {}
+    content_id = d.get("content_id")
+    return (
+        place_id if isinstance(place_id, uuid.UUID) else uuid.UUID(str(place_id)),
+        d.get("latitude"),
+        d.get("longitude"),
+        (d.get("image_url") or None),
+        str(content_id) if content_id else None,
+    )
+
+# 북마크/평점 쓰기와 같은 트랜잭션에서 place 집계에 O(1) 델타를 더한다 ({0}~{3}: 파라미터 자리표시자)
+AGGREGATE_DELTA_SQL = f"""
+UPDATE place
+SET overall_bookmark = COALESCE(overall_bookmark, 0) + {{1}},
+    rating_sum = rating_sum + {{2}},
+    rating_count = rating_count + {{3}}
+WHERE place_id = {{0}}
+RETURNING {PLACE_COLUMNS};
+"""
+
+# 증분 집계(북마크/평점 쓰기 시 델타 적용)의 드리프트 보정. 값이 같은 행은 쓰지 않는다
+VERIFY_AGGREGATES_SQL = """
+UPDATE place p
+SET rating_sum = c.rating_sum, rating_count = c.rating_count, overall_bookmark = c.bookmarks
+FROM (
+    SELECT p2.place_id,
+           COALESCE(r.s, 0) AS rating_sum, COALESCE(r.n, 0) AS rating_count, COALESCE(b.n, 0) AS bookmarks
+    FROM place p2
+    LEFT JOIN (SELECT place_id, SUM(score) AS s, COUNT(*) AS n FROM rating GROUP BY place_id) r
+        ON r.place_id = p2.place_id
+    LEFT JOIN (SELECT place_id, COUNT(*) AS n FROM place_bookmark GROUP BY place_id) b
+        ON b.place_id = p2.place_id
+) c
+WHERE p.place_id = c.place_id
+  AND (p.rating_sum, p.rating_count, p.overall_bookmark) IS DISTINCT FROM (c.rating_sum, c.rating_count, c.bookmarks);
+"""
+
+_AGGREGATE_DELTA_SQL = AGGREGATE_DELTA_SQL.format("%s", "%s", "%s", "%s")
+
+def apply_aggregate_delta(cur, place_id: uuid.UUID, *, bookmarks: int = 0, rating_sum: int = 0, rating_count: int = 0) -> Optional[Dict[str, Any]]:
+    """열린 psycopg2 커서(트랜잭션)에서 집계 델타 적용 후 갱신된 place 반환. 커밋은 호출부가 한다"""
+    cur.execute(_AGGREGATE_DELTA_SQL, (str(place_id), bookmarks, rating_sum, rating_count))
+    row = cur.fetchone()
+    return _row_to_dict(row) if row else None
+
+def place_key(s: Optional[str]) -> str:
+    """DB의 LOWER(TRIM(...))와 같은 정규화 키"""
+    return (s or "").strip().lower()
+
+def match_pairs(pairs: Sequence[PlacePair], rows: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+    """
+    조회된 place 행을 입력 순서대로 매칭한다. 단건 조회와 동일하게 주소 일치를 이름 일치보다 우선한다.
+    """
+    by_addr: Dict[str, Dict[str, Any]] = {}
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for r in rows:
+        ak = place_key(r.get("address"))
+        nk = place_key(r.get("name"))
+        if ak:
+            by_addr.setdefault(ak, r)
+        if nk:
+            by_name.setdefault(nk, r)
+    out: List[Optional[Dict[str, Any]]] = []
+    for addr, name in pairs:
+        hit = by_addr.get(place_key(addr)) if place_key(addr) else None
+        if hit is None and place_key(name):
+            hit = by_name.get(place_key(name))
+        out.append(hit)
+    return out
+
+def pending_inserts(
+    pairs: Sequence[PlacePair],
+    resolved: List[Optional[Dict[str, Any]]],
+    details: Optional[Sequence[Optional[PlaceDetails]]] = None,
+) -> List[PlaceInsertRow]:
+    """매칭되지 않은 쌍을 INSERT 행으로 만든다. 같은 주소/이름은 한 번만 생성."""
+    seen = set()
+    rows: List[PlaceInsertRow] = []
+    for i, ((addr, name), hit) in enumerate(zip(pairs, resolved)):
+        if hit is not None:
+            continue
+        key = (place_key(addr), place_key(name))
+        if key in seen or key == ("", ""):
+            continue
+        seen.add(key)
+        norm_addr = (addr or "").strip() or None
+        norm_name = (name or "").strip() or "미상"
+        pid, lat, lon, image_url, content_id = detail_row(uuid.uuid4(), details[i] if details else None)
+        rows.append((pid, norm_name, norm_addr, lat, lon, image_url, content_id))
+    return rows
 
 class PlaceRepository:
-    def create_place(self, *, place_id: uuid.UUID, name: str, address: Optional[str] = None) -> Dict[str, Any]:
-        sql = """
-        INSERT INTO place (place_id, name, address)
-        VALUES (%s, %s, %s)
-        RETURNING place_id, name, address, overall_rating, overall_bookmark;
-        """
-        con, cur = get_connection()
-        try:
+    def create_place(self, *, place_id: uuid.UUID, name: str, address: Optional[str] = None, details: Optional[PlaceDetails] = None) -> Dict[str, Any]:
+        sql = f"""
+        INSERT INTO place (place_id, name, address, latitude, longitude, image_url, content_id, fetched_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, CASE WHEN %s THEN now() END)
+        RETURNING {PLACE_COLUMNS};
+        """
+        with db_cursor() as (con, cur):
             norm_name = (name or "").strip()
             norm_addr = (address or None)
             if norm_addr is not None:
                 norm_addr = norm_addr.strip() or None
-            cur.execute(sql, (str(place_id), norm_name, norm_addr))
+            _, lat, lon, image_url, content_id = detail_row(place_id, details)
+            cur.execute(sql, (str(place_id), norm_name, norm_addr, lat, lon, image_url, content_id, details is not None))
             row = cur.fetchone()
             con.commit()
             if not row:
-                return {"place_id": str(place_id), "name": norm_name, "address": norm_addr, "overall_rating": 0.0, "overall_bookmark": 0}
-            return {
-                "place_id": row[0],
-                "name": row[1],
-                "address": row[2],
-                "overall_rating": row[3],
-                "overall_bookmark": row[4],
-            }
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            cur.close()
-            con.close()
+                return _empty_place(place_id, norm_name, norm_addr)
+            return _row_to_dict(row)
 
     def get_place(self, place_id: uuid.UUID) -> Optional[Dict[str, Any]]:
-        sql = """
-        SELECT place_id, name, address, overall_rating, overall_bookmark
+        sql = f"""
+        SELECT {PLACE_COLUMNS}
         FROM place WHERE place_id = %s;
         """
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (str(place_id),))
             row = cur.fetchone()
             if not row:
                 return None
-            return {
-                "place_id": row[0],
-                "name": row[1],
-                "address": row[2],
-                "overall_rating": row[3],
-                "overall_bookmark": row[4],
-            }
-        finally:
-            cur.close()
-            con.close()
+            return _row_to_dict(row)
 
     def get_place_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
         이름으로 장소를 검색합니다.
         """
-        sql = """
-        SELECT place_id, name, address, overall_rating, overall_bookmark
+        sql = f"""
+        SELECT {PLACE_COLUMNS}
         FROM place WHERE LOWER(TRIM(name)) = LOWER(TRIM(%s))
         LIMIT 1;
         """
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (name.strip(),))
             row = cur.fetchone()
             if not row:
                 return None
-            return {
-                "place_id": row[0],
-                "name": row[1],
-                "address": row[2],
-                "overall_rating": row[3],
-                "overall_bookmark": row[4],
-            }
-        finally:
-            cur.close()
-            con.close()
+            return _row_to_dict(row)
 
     def get_place_by_address(self, address: str) -> Optional[Dict[str, Any]]:
         """
         주소로 장소를 검색합니다. 완전 일치 기준.
         """
-        sql = """
-        SELECT place_id, name, address, overall_rating, overall_bookmark
+        sql = f"""
+        SELECT {PLACE_COLUMNS}
         FROM place WHERE LOWER(TRIM(address)) = LOWER(TRIM(%s))
         LIMIT 1;
         """
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (address.strip(),))
             row = cur.fetchone()
             if not row:
                 return None
-            return {
-                "place_id": row[0],
-                "name": row[1],
-                "address": row[2],
-                "overall_rating": row[3],
-                "overall_bookmark": row[4],
-            }
-        finally:
-            cur.close()
-            con.close()
+            return _row_to_dict(row)
+
+    def find_places_bulk(self, pairs: Sequence[PlacePair]) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 (주소, 이름) 쌍을 한 번의 쿼리로 조회한다. 결과는 입력 순서와 같고, 없으면 None.
+        """
+        addrs = sorted({place_key(a) for a, _ in pairs if place_key(a)})
+        names = sorted({place_key(n) for _, n in pairs if place_key(n)})
+        if not addrs and not names:
+            return [None] * len(pairs)
+        sql = f"""
+        SELECT {PLACE_COLUMNS}
+        FROM place
+        WHERE LOWER(TRIM(address)) = ANY(%s) OR LOWER(TRIM(name)) = ANY(%s);
+        """
+        with db_cursor() as (con, cur):
+            cur.execute(sql, (addrs, names))
+            rows = cur.fetchall()
+        return match_pairs(pairs, [_row_to_dict(r) for r in rows])
+
+    def upsert_places(self, rows: List[PlaceInsertRow]) -> List[Dict[str, Any]]:
+        """
+        (place_id, name, address, latitude, longitude, image_url, content_id) 행들을 단일 multi-row INSERT로 생성한다.
+        이미 존재해 충돌한 행은 반환되지 않는다.
+        """
+        if not rows:
+            return []
+        sql = f"""
+        INSERT INTO place (place_id, name, address, latitude, longitude, image_url, content_id, fetched_at)
+        VALUES %s
+        ON CONFLICT DO NOTHING
+        RETURNING {PLACE_COLUMNS};
+        """
+        with db_cursor() as (con, cur):
+            inserted = execute_values(
+                cur, sql,
+                [(str(r[0]),) + tuple(r[1:]) for r in rows],
+                template="(%s, %s, %s, %s, %s, %s, %s, now())",
+                fetch=True,
+            )
+            con.commit()
+        return [_row_to_dict(r) for r in inserted]
+
+    def update_details(self, place_id: uuid.UUID, details: PlaceDetails) -> Optional[Dict[str, Any]]:
+        """좌표/이미지/contentid를 저장하고 fetched_at을 갱신한다. None 값은 기존 값을 유지."""
+        updated = self.update_details_bulk([detail_row(place_id, details)])
+        return updated[0] if updated else None
+
+    def update_details_bulk(self, rows: List[PlaceDetailRow]) -> List[Dict[str, Any]]:
+        """여러 place의 보조 정보를 단일 UPDATE ... FROM (VALUES ...)로 갱신한다."""
+        if not rows:
+            return []
+        sql = f"""
+        UPDATE place p
+        SET latitude = COALESCE(v.latitude, p.latitude),
+            longitude = COALESCE(v.longitude, p.longitude),
+            image_url = COALESCE(v.image_url, p.image_url),
+            content_id = COALESCE(v.content_id, p.content_id),
+            fetched_at = now()
+        FROM (VALUES %s) AS v(place_id, latitude, longitude, image_url, content_id)
+        WHERE p.place_id = v.place_id
+        RETURNING {PLACE_COLUMNS_P};
+        """
+        with db_cursor() as (con, cur):
+            updated = execute_values(
+                cur, sql,
+                [(str(r[0]),) + tuple(r[1:]) for r in rows],
+                template="(%s::uuid, %s::float8, %s::float8, %s::text, %s::varchar)",
+                fetch=True,
+            )
+            con.commit()
+        return [_row_to_dict(r) for r in updated]
+
+    def resolve_or_create_places(self, pairs: Sequence[PlacePair], details: Optional[Sequence[Optional[PlaceDetails]]] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        조회 1회 + 일괄 생성 1회(+ 동시 생성 충돌 시 재조회 1회)로 모든 쌍을 place 레코드로 해석한다.
+        details가 있으면 새로 생성하는 place에 좌표/이미지/contentid를 함께 저장한다.
+        """
+        resolved = self.find_places_bulk(pairs)
+        to_insert = pending_inserts(pairs, resolved, details)
+        if not to_insert:
+            return resolved
+        inserted = self.upsert_places(to_insert)
+        if len(inserted) < len(to_insert):
+            # 다른 요청이 먼저 생성한 행이 있으면 다시 조회
+            return self.find_places_bulk(pairs)
+        return [hit or nxt for hit, nxt in zip(resolved, match_pairs(pairs, inserted))]
 
     def list_places(self, *, limit: int = 20, offset: int = 0, order_by: str = "overall_bookmark DESC") -> List[Dict[str, Any]]:
         allowed = {
@@ -116,28 +306,15 @@ class PlaceRepository:
         }
         ob = order_by if order_by in allowed else "overall_bookmark DESC"
         sql = f"""
-        SELECT place_id, name, address, overall_rating, overall_bookmark
+        SELECT {PLACE_COLUMNS}
         FROM place
         ORDER BY {ob}
         LIMIT %s OFFSET %s;
         """
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (limit, offset))
             rows = cur.fetchall()
-            return [
-                {
-                    "place_id": r[0],
-                    "name": r[1],
-                    "address": r[2],
-                    "overall_rating": r[3],
-                    "overall_bookmark": r[4],
-                }
-                for r in rows
-            ]
-        finally:
-            cur.close()
-            con.close()
+            return [_row_to_dict(r) for r in rows]
 
     def update_place(self, *, place_id: uuid.UUID, name: Optional[str] = None, address: Optional[str] = None) -> Optional[Dict[str, Any]]:
         sets: List[str] = []
@@ -156,77 +333,20 @@ class PlaceRepository:
         UPDATE place
         SET {", ".join(sets)}
         WHERE place_id = %s
-        RETURNING place_id, name, address, overall_rating, overall_bookmark;
+        RETURNING {PLACE_COLUMNS};
         """
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, tuple(params))
             row = cur.fetchone()
             con.commit()
             if not row:
                 return None
-            return {
-                "place_id": row[0],
-                "name": row[1],
-                "address": row[2],
-                "overall_rating": row[3],
-                "overall_bookmark": row[4],
-            }
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            cur.close()
-            con.close()
+            return _row_to_dict(row)
 
     def delete_place(self, place_id: uuid.UUID) -> bool:
         sql = "DELETE FROM place WHERE place_id = %s;"
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (str(place_id),))
             deleted = cur.rowcount > 0
             con.commit()
             return deleted
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            cur.close()
-            con.close()
-
-    def refresh_aggregates(self, place_id: uuid.UUID) -> Dict[str, Any]:
-        """place.overall_bookmark를 실제 북마크 수로 갱신하고 최신 레코드를 반환"""
-        sql = """
-        UPDATE place p
-        SET overall_bookmark = (
-            SELECT COUNT(*) FROM place_bookmark b WHERE b.place_id = p.place_id
-        )
-        WHERE p.place_id = %s
-        RETURNING place_id, name, address, overall_rating, overall_bookmark;
-        """
-        con, cur = get_connection()
-        try:
-            cur.execute(sql, (str(place_id),))
-            row = cur.fetchone()
-            con.commit()
-            if not row:
-                return self.get_place(place_id) or {
-                    "place_id": str(place_id),
-                    "name": "",
-                    "address": None,
-                    "overall_rating": 0.0,
-                    "overall_bookmark": 0,
-                }
-            return {
-                "place_id": row[0],
-                "name": row[1],
-                "address": row[2],
-                "overall_rating": row[3],
-                "overall_bookmark": row[4],
-            }
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            cur.close()
-            con.close()
\ No newline at end of file
@@ -0,0 +1,191 @@
+import uuid
+from typing import Optional, List, Dict, Any, Sequence
+from util.async_db_pool import async_connection
+from locations.repository.place import (
+    PLACE_COLUMNS, PLACE_COLUMNS_P, PlacePair, PlaceDetails, PlaceInsertRow, PlaceDetailRow,
+    VERIFY_AGGREGATES_SQL, place_key, match_pairs, pending_inserts, detail_row, _row_to_dict, _empty_place,
+)
+
+def _to_dict(row) -> Optional[Dict[str, Any]]:
+    return _row_to_dict(row) if row else None
+
+class AsyncPlaceRepository:
+    """PlaceRepository와 동일한 연산을 asyncpg로 제공 (이벤트 루프를 막지 않음)"""
+
+    async def create_place(self, *, place_id: uuid.UUID, name: str, address: Optional[str] = None, details: Optional[PlaceDetails] = None, fetched: bool = True) -> Dict[str, Any]:
+        """details가 있고 fetched이면 fetched_at을 기록한다 (일부 조회가 실패한 details는 fetched=False로 저장)"""
+        sql = f"""
+        INSERT INTO place (place_id, name, address, latitude, longitude, image_url, content_id, fetched_at)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, CASE WHEN $8::bool THEN now() END)
+        RETURNING {PLACE_COLUMNS};
+        """
+        norm_name = (name or "").strip()
+        norm_addr = (address or None)
+        if norm_addr is not None:
+            norm_addr = norm_addr.strip() or None
+        _, lat, lon, image_url, content_id = detail_row(place_id, details)
+        async with async_connection() as con:
+            row = await con.fetchrow(sql, place_id, norm_name, norm_addr, lat, lon, image_url, content_id, details is not None and fetched)
+        if not row:
+            return _empty_place(place_id, norm_name, norm_addr)
+        return _to_dict(row)
+
+    async def get_place(self, place_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        sql = f"SELECT {PLACE_COLUMNS} FROM place WHERE place_id = $1;"
+        async with async_connection() as con:
+            return _to_dict(await con.fetchrow(sql, place_id))
+
+    async def get_place_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        이름으로 장소를 검색합니다.
+        """
+        sql = f"""
+        SELECT {PLACE_COLUMNS}
+        FROM place WHERE LOWER(TRIM(name)) = LOWER(TRIM($1))
+        LIMIT 1;
+        """
+        async with async_connection() as con:
+            return _to_dict(await con.fetchrow(sql, name.strip()))
+
+    async def get_place_by_address(self, address: str) -> Optional[Dict[str, Any]]:
+        """
+        주소로 장소를 검색합니다. 완전 일치 기준.
+        """
+        sql = f"""
+        SELECT {PLACE_COLUMNS}
+        FROM place WHERE LOWER(TRIM(address)) = LOWER(TRIM($1))
+        LIMIT 1;
+        """
+        async with async_connection() as con:
+            return _to_dict(await con.fetchrow(sql, address.strip()))
+
+    async def find_places_bulk(self, pairs: Sequence[PlacePair]) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 (주소, 이름) 쌍을 한 번의 쿼리로 조회한다. 결과는 입력 순서와 같고, 없으면 None.
+        """
+        addrs = sorted({place_key(a) for a, _ in pairs if place_key(a)})
+        names = sorted({place_key(n) for _, n in pairs if place_key(n)})
+        if not addrs and not names:
+            return [None] * len(pairs)
+        sql = f"""
+        SELECT {PLACE_COLUMNS}
+        FROM place
+        WHERE LOWER(TRIM(address)) = ANY($1::text[]) OR LOWER(TRIM(name)) = ANY($2::text[]);
+        """
+        async with async_connection() as con:
+            rows = await con.fetch(sql, addrs, names)
+        return match_pairs(pairs, [_to_dict(r) for r in rows])
+
+    async def upsert_places(self, rows: List[PlaceInsertRow]) -> List[Dict[str, Any]]:
+        """
+        (place_id, name, address, latitude, longitude, image_url, content_id) 행들을 단일 multi-row INSERT로 생성한다.
+        이미 존재해 충돌한 행은 반환되지 않는다.
+        """
+        if not rows:
+            return []
+        sql = f"""
+        INSERT INTO place (place_id, name, address, latitude, longitude, image_url, content_id, fetched_at)
+        SELECT u.*, now()
+        FROM UNNEST($1::uuid[], $2::varchar[], $3::varchar[], $4::float8[], $5::float8[], $6::text[], $7::varchar[]) AS u
+        ON CONFLICT DO NOTHING
+        RETURNING {PLACE_COLUMNS};
+        """
+        cols = [list(c) for c in zip(*rows)]
+        async with async_connection() as con:
+            inserted = await con.fetch(sql, *cols)
+        return [_to_dict(r) for r in inserted]
+
+    async def update_details(self, place_id: uuid.UUID, details: PlaceDetails) -> Optional[Dict[str, Any]]:
+        """좌표/이미지/contentid를 저장하고 fetched_at을 갱신한다. None 값은 기존 값을 유지."""
+        updated = await self.update_details_bulk([detail_row(place_id, details)])
+        return updated[0] if updated else None
+
+    async def update_details_bulk(self, rows: List[PlaceDetailRow]) -> List[Dict[str, Any]]:
+        """여러 place의 보조 정보를 단일 UPDATE ... FROM UNNEST로 갱신한다."""
+        if not rows:
+            return []
+        sql = f"""
+        UPDATE place p
+        SET latitude = COALESCE(v.latitude, p.latitude),
+            longitude = COALESCE(v.longitude, p.longitude),
+            image_url = COALESCE(v.image_url, p.image_url),
+            content_id = COALESCE(v.content_id, p.content_id),
+            fetched_at = now()
+        FROM UNNEST($1::uuid[], $2::float8[], $3::float8[], $4::text[], $5::varchar[])
+             AS v(place_id, latitude, longitude, image_url, content_id)
+        WHERE p.place_id = v.place_id
+        RETURNING {PLACE_COLUMNS_P};
+        """
+        cols = [list(c) for c in zip(*rows)]
+        async with async_connection() as con:
+            updated = await con.fetch(sql, *cols)
+        return [_to_dict(r) for r in updated]
+
+    async def resolve_or_create_places(self, pairs: Sequence[PlacePair], details: Optional[Sequence[Optional[PlaceDetails]]] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        조회 1회 + 일괄 생성 1회(+ 동시 생성 충돌 시 재조회 1회)로 모든 쌍을 place 레코드로 해석한다.
+        details가 있으면 새로 생성하는 place에 좌표/이미지/contentid를 함께 저장한다.
+        """
+        resolved = await self.find_places_bulk(pairs)
+        to_insert = pending_inserts(pairs, resolved, details)
+        if not to_insert:
+            return resolved
+        inserted = await self.upsert_places(to_insert)
+        if len(inserted) < len(to_insert):
+            # 다른 요청이 먼저 생성한 행이 있으면 다시 조회
+            return await self.find_places_bulk(pairs)
+        return [hit or nxt for hit, nxt in zip(resolved, match_pairs(pairs, inserted))]
+
+    async def list_places(self, *, limit: int = 20, offset: int = 0, order_by: str = "overall_bookmark DESC") -> List[Dict[str, Any]]:
+        allowed = {
+            "name", "name DESC",
+            "overall_rating", "overall_rating DESC",
+            "overall_bookmark", "overall_bookmark DESC"
+        }
+        ob = order_by if order_by in allowed else "overall_bookmark DESC"
+        sql = f"""
+        SELECT {PLACE_COLUMNS}
+        FROM place
+        ORDER BY {ob}
+        LIMIT $1 OFFSET $2;
+        """
+        async with async_connection() as con:
+            rows = await con.fetch(sql, limit, offset)
+        return [_to_dict(r) for r in rows]
+
+    async def update_place(self, *, place_id: uuid.UUID, name: Optional[str] = None, address: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        sets: List[str] = []
+        params: List[Any] = []
+        if name is not None:
+            params.append(name.strip())
+            sets.append(f"name = ${len(params)}")
+        if address is not None:
+            params.append(address.strip())
+            sets.append(f"address = ${len(params)}")
+        if not sets:
+            return await self.get_place(place_id)
+
+        params.append(place_id)
+        sql = f"""
+        UPDATE place
+        SET {", ".join(sets)}
+        WHERE place_id = ${len(params)}
+        RETURNING {PLACE_COLUMNS};
+        """
+        async with async_connection() as con:
+            return _to_dict(await con.fetchrow(sql, *params))
+
+    async def delete_place(self, place_id: uuid.UUID) -> bool:
+        sql = "DELETE FROM place WHERE place_id = $1;"
+        async with async_connection() as con:
+            status = await con.execute(sql, place_id)
+        return status.split()[-1] != "0"
+
+    async def verify_aggregates(self) -> int:
+        """
+        rating_sum/rating_count/overall_bookmark를 원본(rating, place_bookmark)과 대조해
+        어긋난 place만 고친다. 반환: 고친 place 수
+        """
+        async with async_connection() as con:
+            status = await con.execute(VERIFY_AGGREGATES_SQL)
+        return int(status.split()[-1])
@@ -1,7 +1,10 @@
 import uuid
-from typing import List, Dict, Any
-from locations.repository import get_connection
-from locations.repository.place import PlaceRepository
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
+from locations.repository import db_cursor
+from locations.repository.place import PlaceRepository, apply_aggregate_delta, overall_rating_sql, _empty_place
+from locations.repository.trend import record_activity
+from util.pagination import page_size
 
 class BookmarkRepository:
     def __init__(self):
@@ -14,64 +17,71 @@ class BookmarkRepository:
         ON CONFLICT (user_id, place_id) DO NOTHING
         RETURNING bookmark_id, user_id, place_id;
         """
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (str(bookmark_id), str(user_id), str(place_id)))
             row = cur.fetchone()  # None이면 이미 존재했던 것
+            refreshed = None
+            if row:
+                refreshed = apply_aggregate_delta(cur, place_id, bookmarks=1)
+                record_activity(cur, place_id, bookmarks=1)
             con.commit()
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            cur.close()
-            con.close()
 
-        refreshed = self.places.refresh_aggregates(place_id)
+        if refreshed is None:
+            refreshed = self.places.get_place(place_id) or _empty_place(place_id, "", None)
         return {"bookmark": row, "place": refreshed}
 
     def remove_bookmark(self, *, user_id: uuid.UUID, place_id: uuid.UUID) -> Dict[str, Any]:
         sql = "DELETE FROM place_bookmark WHERE user_id = %s AND place_id = %s;"
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (str(user_id), str(place_id)))
             deleted = cur.rowcount > 0
+            refreshed = None
+            if deleted:
+                refreshed = apply_aggregate_delta(cur, place_id, bookmarks=-1)
+                record_activity(cur, place_id, bookmarks=-1)
             con.commit()
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            cur.close()
-            con.close()
 
-        refreshed = self.places.refresh_aggregates(place_id)
+        if refreshed is None:
+            refreshed = self.places.get_place(place_id) or _empty_place(place_id, "", None)
         return {"deleted": deleted, "place": refreshed}
 
-    def list_user_bookmarks(self, user_id: uuid.UUID, *, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
-        sql = """
+    def list_user_bookmarks(self, user_id: uuid.UUID, *, limit: int = 50, after: Optional[Tuple[datetime, uuid.UUID]] = None) -> List[tuple]:
+        """
+        북마크한 시각 내림차순(동점은 bookmark_id). after=(created_at, bookmark_id)이면 그 다음부터
+        반환 행 끝의 (created_at, bookmark_id)가 다음 페이지 키
+        """
+        after_at, after_id = after if after else (None, None)
+        sql = f"""
         SELECT b.bookmark_id, b.user_id, b.place_id,
-               p.name, p.address, p.overall_rating, p.overall_bookmark
+               p.name, p.address, {overall_rating_sql("p")} AS overall_rating, p.overall_bookmark,
+               b.created_at
         FROM place_bookmark b
         JOIN place p ON p.place_id = b.place_id
         WHERE b.user_id = %s
-        ORDER BY p.overall_bookmark DESC
-        LIMIT %s OFFSET %s;
+          AND (%s::timestamptz IS NULL OR (b.created_at, b.bookmark_id) < (%s::timestamptz, %s::uuid))
+        ORDER BY b.created_at DESC, b.bookmark_id DESC
+        LIMIT %s;
         """
-        con, cur = get_connection()
-        try:
-            cur.execute(sql, (str(user_id), limit, offset))
+        with db_cursor() as (con, cur):
+            cur.execute(sql, (str(user_id), after_at, after_at, after_id and str(after_id), page_size(limit)))
             return cur.fetchall()
-        finally:
-            cur.close()
-            con.close()
 
     # 새 메서드: 특정 사용자/장소 북마크 존재 여부
     def has_bookmark(self, *, user_id: uuid.UUID, place_id: uuid.UUID) -> bool:
         sql = "SELECT EXISTS (SELECT 1 FROM place_bookmark WHERE user_id = %s AND place_id = %s);"
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (str(user_id), str(place_id)))
             row = cur.fetchone()
             return bool(row and row[0])
-        finally:
-            cur.close()
-            con.close()
+
+    def bookmarked_place_ids(self, user_id: uuid.UUID, place_ids: Iterable[uuid.UUID]) -> Set[uuid.UUID]:
+        """
+        place_ids 중 사용자가 북마크한 place_id 집합. (user_id, place_id) 유니크 인덱스를 타는 단일 쿼리.
+        """
+        ids = sorted({str(pid) for pid in place_ids if pid is not None})
+        if not ids:
+            return set()
+        sql = "SELECT place_id FROM place_bookmark WHERE user_id = %s AND place_id = ANY(%s::uuid[]);"
+        with db_cursor() as (con, cur):
+            cur.execute(sql, (str(user_id), ids))
+            return {uuid.UUID(str(r[0])) for r in cur.fetchall()}
@@ -0,0 +1,91 @@
+import uuid
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
+from util.async_db_pool import async_connection
+from locations.repository.place import AGGREGATE_DELTA_SQL, overall_rating_sql, _row_to_dict, _empty_place
+from locations.repository.place_async import AsyncPlaceRepository
+from locations.repository.trend_async import record_activity
+from util.pagination import page_size
+
+_AGGREGATE_DELTA_SQL = AGGREGATE_DELTA_SQL.format("$1", "$2", "0", "0")
+
+class AsyncBookmarkRepository:
+    """BookmarkRepository와 동일한 연산을 asyncpg로 제공"""
+
+    def __init__(self):
+        self.places = AsyncPlaceRepository()
+
+    async def add_bookmark(self, *, bookmark_id: uuid.UUID, user_id: uuid.UUID, place_id: uuid.UUID) -> Dict[str, Any]:
+        sql = """
+        INSERT INTO place_bookmark (bookmark_id, user_id, place_id)
+        VALUES ($1, $2, $3)
+        ON CONFLICT (user_id, place_id) DO NOTHING
+        RETURNING bookmark_id, user_id, place_id;
+        """
+        async with async_connection() as con:
+            async with con.transaction():
+                row = await con.fetchrow(sql, bookmark_id, user_id, place_id)  # None이면 이미 존재했던 것
+                place_row = None
+                if row:
+                    place_row = await con.fetchrow(_AGGREGATE_DELTA_SQL, place_id, 1)
+                    await record_activity(con, place_id, bookmarks=1)
+
+        refreshed = await self._place_after(place_id, place_row)
+        return {"bookmark": tuple(row) if row else None, "place": refreshed}
+
+    async def remove_bookmark(self, *, user_id: uuid.UUID, place_id: uuid.UUID) -> Dict[str, Any]:
+        sql = "DELETE FROM place_bookmark WHERE user_id = $1 AND place_id = $2;"
+        async with async_connection() as con:
+            async with con.transaction():
+                status = await con.execute(sql, user_id, place_id)
+                deleted = status.split()[-1] != "0"
+                place_row = None
+                if deleted:
+                    place_row = await con.fetchrow(_AGGREGATE_DELTA_SQL, place_id, -1)
+                    await record_activity(con, place_id, bookmarks=-1)
+
+        refreshed = await self._place_after(place_id, place_row)
+        return {"deleted": deleted, "place": refreshed}
+
+    async def _place_after(self, place_id: uuid.UUID, place_row) -> Dict[str, Any]:
+        if place_row:
+            return _row_to_dict(place_row)
+        return await self.places.get_place(place_id) or _empty_place(place_id, "", None)
+
+    async def list_user_bookmarks(self, user_id: uuid.UUID, *, limit: int = 50, after: Optional[Tuple[datetime, uuid.UUID]] = None) -> List[tuple]:
+        """BookmarkRepository.list_user_bookmarks와 같은 키셋 (준비된 문장이라 첫 페이지는 조건 없는 SQL로 분리)"""
+        params: list = [user_id, page_size(limit)]
+        keyset = ""
+        if after:
+            keyset = "AND (b.created_at, b.bookmark_id) < ($3, $4)"
+            params += [after[0], after[1]]
+        sql = f"""
+        SELECT b.bookmark_id, b.user_id, b.place_id,
+               p.name, p.address, {overall_rating_sql("p")} AS overall_rating, p.overall_bookmark,
+               b.created_at
+        FROM place_bookmark b
+        JOIN place p ON p.place_id = b.place_id
+        WHERE b.user_id = $1 {keyset}
+        ORDER BY b.created_at DESC, b.bookmark_id DESC
+        LIMIT $2;
+        """
+        async with async_connection() as con:
+            rows = await con.fetch(sql, *params)
+        return [tuple(r) for r in rows]
+
+    async def has_bookmark(self, *, user_id: uuid.UUID, place_id: uuid.UUID) -> bool:
+        sql = "SELECT EXISTS (SELECT 1 FROM place_bookmark WHERE user_id = $1 AND place_id = $2);"
+        async with async_connection() as con:
+            return bool(await con.fetchval(sql, user_id, place_id))
+
+    async def bookmarked_place_ids(self, user_id: uuid.UUID, place_ids: Iterable[uuid.UUID]) -> Set[uuid.UUID]:
+        """
+        place_ids 중 사용자가 북마크한 place_id 집합. (user_id, place_id) 유니크 인덱스를 타는 단일 쿼리.
+        """
+        ids = sorted({str(pid) for pid in place_ids if pid is not None})
+        if not ids:
+            return set()
+        sql = "SELECT place_id FROM place_bookmark WHERE user_id = $1 AND place_id = ANY($2::uuid[]);"
+        async with async_connection() as con:
+            rows = await con.fetch(sql, user_id, ids)
+        return {r["place_id"] for r in rows}
@@ -1,45 +1,40 @@
 from typing import Optional, Dict, Any
 from uuid import UUID, uuid4
-from locations.repository import get_connection
-from locations.repository.place import PlaceRepository
+from locations.repository import db_cursor
+from locations.repository.place import apply_aggregate_delta, overall_rating_sql
+from locations.repository.trend import record_activity
 
 class RatingRepository:
-    def add_rating(self, *, place_id: UUID, score: float, user_id: UUID) -> None:
+    def add_rating(self, *, place_id: UUID, score: float, user_id: UUID) -> Dict[str, Any]:
         """
         rating_id와 user_id를 포함해 저장합니다. score는 0.0~5.0 범위로 클램프.
+        같은 트랜잭션에서 place.rating_sum/rating_count에 델타를 더하고 갱신된 집계를 반환합니다.
         """
         s = max(0.0, min(5.0, float(score)))
         rid = str(uuid4())
-        sql = "INSERT INTO rating (rating_id, user_id, place_id, score) VALUES (%s, %s, %s, %s);"
+        sql = """
+        INSERT INTO rating (rating_id, user_id, place_id, score) VALUES (%s, %s, %s, %s)
+        RETURNING score;
+        """
         params = (rid, str(user_id), str(place_id), s)
 
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, params)
+            stored = int(cur.fetchone()[0])  # INT 컬럼에 반올림되어 저장된 값으로 델타 계산
+            apply_aggregate_delta(cur, place_id, rating_sum=stored, rating_count=1)
+            record_activity(cur, place_id, ratings=1)
             con.commit()
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            cur.close()
-            con.close()
 
-        # place 집계 즉시 갱신 (트리거가 있다면 중복이어도 문제 없음)
-        try:
-            PlaceRepository().refresh_aggregates(place_id)
-        except Exception:
-            pass
+        return self.get_rating_by_place_id(place_id) or {"place_id": place_id, "average_rating": 0.0, "total_ratings": 0}
 
     def get_rating_by_place_id(self, place_id: UUID) -> Optional[Dict[str, Any]]:
-        sql = """
-        SELECT
-            COALESCE(ROUND(AVG(score)::numeric, 1), 0)::float8 AS average_rating,
-            COUNT(*)::bigint AS total_ratings
-        FROM rating
+        """누적 합/개수로 평균을 계산 (rating 테이블을 훑지 않는다)"""
+        sql = f"""
+        SELECT {overall_rating_sql()}::float8 AS average_rating, rating_count
+        FROM place
         WHERE place_id = %s;
         """
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (str(place_id),))
             row = cur.fetchone()
             if not row:
@@ -47,31 +42,3 @@ class RatingRepository:
             avg = float(row[0] or 0.0)
             cnt = int(row[1] or 0)
             return {"place_id": place_id, "average_rating": avg, "total_ratings": cnt}
-        finally:
-            cur.close()
-            con.close()
-
-    def refresh_rating_aggregates(self, place_id: UUID) -> Dict[str, Any]:
-        sql = """
-        SELECT
-            COALESCE(ROUND(AVG(score)::numeric, 1), 0)::float8 AS average_rating,
-            COUNT(*)::bigint AS total_ratings
-        FROM rating
-        WHERE place_id = %s;
-        """
-        con, cur = get_connection()
-        try:
-            cur.execute(sql, (str(place_id),))
-            row = cur.fetchone()
-            avg = float(row[0] or 0.0)
-            cnt = int(row[1] or 0)
-        finally:
-            cur.close()
-            con.close()
-
-        try:
-            PlaceRepository().refresh_aggregates(place_id)
-        except Exception:
-            pass
-
-        return {"place_id": place_id, "average_rating": avg, "total_ratings": cnt}
\ No newline at end of file
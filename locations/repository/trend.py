@@ -0,0 +1,18 @@
+import uuid
+
+# 현재 시각의 시간 버킷에 활동을 더한다. 북마크/평점 쓰기와 같은 트랜잭션에서 실행해 원본과 어긋나지 않게 한다
+RECORD_ACTIVITY_SQL = """
+INSERT INTO place_activity_hourly (place_id, bucket, bookmarks, ratings)
+VALUES ({0}, date_trunc('hour', now()), {1}, {2})
+ON CONFLICT (place_id, bucket) DO UPDATE SET
+    bookmarks = place_activity_hourly.bookmarks + EXCLUDED.bookmarks,
+    ratings = place_activity_hourly.ratings + EXCLUDED.ratings;
+"""
+
+_RECORD_SQL = RECORD_ACTIVITY_SQL.format("%s", "%s", "%s")
+
+
+def record_activity(cur, place_id: uuid.UUID, *, bookmarks: int = 0, ratings: int = 0) -> None:
+    """열린 psycopg2 커서(트랜잭션)에 활동 카운터 증가를 추가. 커밋은 호출부가 한다"""
+    if bookmarks or ratings:
+        cur.execute(_RECORD_SQL, (str(place_id), bookmarks, ratings))
@@ -0,0 +1,92 @@
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from util.async_db_pool import async_connection
+from locations.repository.trend import RECORD_ACTIVITY_SQL
+
+_RECORD_SQL = RECORD_ACTIVITY_SQL.format("$1", "$2", "$3")
+
+TREND_COLUMNS = "place_id, bookmarks_24h, bookmarks_7d, ratings_24h, ratings_7d, score"
+
+# 최근 24시간 활동을 가장 크게, 7일 일평균을 보조로 반영한 지역 트렌드 정렬 점수
+_SCORE_SQL = "(b24 + 0.5 * r24) + (b7d + 0.5 * r7d) / 7.0"
+
+
+async def record_activity(con, place_id: uuid.UUID, *, bookmarks: int = 0, ratings: int = 0) -> None:
+    """열린 asyncpg 커넥션(트랜잭션)에 활동 카운터 증가를 추가"""
+    if bookmarks or ratings:
+        await con.execute(_RECORD_SQL, place_id, bookmarks, ratings)
+
+
+class AsyncTrendRepository:
+    """place_activity_hourly(시간 버킷) / place_trend(롤링 합계) 접근 (asyncpg)"""
+
+    async def refresh(self) -> int:
+        """
+        최근 7일 버킷을 place별로 합산해 place_trend에 반영하고, 창 밖으로 밀려난 place는 제거.
+        활동이 있었던 place만 다루므로 비용은 전체 place 수가 아닌 활동량에 비례한다.
+        취소(북마크 해제 등)는 현재 버킷에 음수로 기록되므로, 창 이전에 생긴 활동의 취소가
+        창 합계를 음수로 만들지 않도록 각 합계를 0에서 자른다.
+        반환: 갱신된 행 수
+        """
+        sql = f"""
+        WITH agg AS (
+            SELECT place_id,
+                   GREATEST(COALESCE(SUM(bookmarks) FILTER (WHERE bucket > date_trunc('hour', now()) - interval '24 hours'), 0), 0) AS b24,
+                   GREATEST(SUM(bookmarks), 0) AS b7d,
+                   GREATEST(COALESCE(SUM(ratings) FILTER (WHERE bucket > date_trunc('hour', now()) - interval '24 hours'), 0), 0) AS r24,
+                   GREATEST(SUM(ratings), 0) AS r7d
+            FROM place_activity_hourly
+            WHERE bucket > date_trunc('hour', now()) - interval '7 days'
+            GROUP BY place_id
+        ), up AS (
+            INSERT INTO place_trend (place_id, bookmarks_24h, bookmarks_7d, ratings_24h, ratings_7d, score, refreshed_at)
+            SELECT place_id, b24, b7d, r24, r7d, {_SCORE_SQL}, now() FROM agg
+            ON CONFLICT (place_id) DO UPDATE SET
+                bookmarks_24h = EXCLUDED.bookmarks_24h, bookmarks_7d = EXCLUDED.bookmarks_7d,
+                ratings_24h = EXCLUDED.ratings_24h, ratings_7d = EXCLUDED.ratings_7d,
+                score = EXCLUDED.score, refreshed_at = EXCLUDED.refreshed_at
+            RETURNING 1
+        ), gone AS (
+            DELETE FROM place_trend t
+            WHERE NOT EXISTS (SELECT 1 FROM agg WHERE agg.place_id = t.place_id)
+        )
+        SELECT COUNT(*) FROM up;
+        """
+        async with async_connection() as con:
+            return int(await con.fetchval(sql))
+
+    async def prune(self, keep_days: int = 8) -> int:
+        """집계 창보다 오래된 버킷 삭제"""
+        async with async_connection() as con:
+            status = await con.execute(
+                "DELETE FROM place_activity_hourly WHERE bucket < now() - make_interval(days => $1);", keep_days
+            )
+        return int(status.split()[-1])
+
+    async def load_all(self) -> List[Any]:
+        async with async_connection() as con:
+            return await con.fetch(f"SELECT {TREND_COLUMNS} FROM place_trend;")
+
+    async def trending_in_bbox(
+        self, *, min_lat: float, max_lat: float, min_lon: float, max_lon: float, limit: int = 20,
+        after: Optional[Tuple[float, uuid.UUID]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        바운딩 박스 안 트렌드 place를 점수순으로 (place_trend는 활동 place만 있어 작다)
+        after=(score, place_id)이면 그 다음부터 (점수 내림차순, 동점은 place_id 오름차순)
+        """
+        after_score, after_id = after if after else (None, None)
+        sql = f"""
+        SELECT t.place_id, t.bookmarks_24h, t.bookmarks_7d, t.ratings_24h, t.ratings_7d, t.score,
+               p.name, p.address, p.latitude, p.longitude, p.image_url
+        FROM place_trend t
+        JOIN place p ON p.place_id = t.place_id
+        WHERE p.latitude BETWEEN $1 AND $2 AND p.longitude BETWEEN $3 AND $4
+          AND ($6::float8 IS NULL OR t.score < $6 OR (t.score = $6 AND t.place_id > $7::uuid))
+        ORDER BY t.score DESC, t.place_id
+        LIMIT $5;
+        """
+        async with async_connection() as con:
+            rows = await con.fetch(sql, min_lat, max_lat, min_lon, max_lon, limit, after_score, after_id)
+        return [dict(r) for r in rows]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+import os
+from typing import Any, Optional
+
+from util.periodic import PeriodicTask
+
+_task: Optional[PeriodicTask] = None
+
+
+async def verify_place_aggregates(repo: Any) -> int:
+    """
+    place 집계(rating_sum, rating_count, overall_bookmark)를 원본과 대조해 어긋난 행만 보정.
+    repo: locations.repository.place_async.AsyncPlaceRepository 호환 객체
+    """
+    fixed = await repo.verify_aggregates()
+    if fixed:
+        print(f"[place] repaired aggregates for {fixed} places")
+    return fixed
+
+
+def start_aggregate_verifier(repo: Any) -> Optional[PeriodicTask]:
+    """
+    lifespan에서 호출. 시작 직후 한 번 실행해 새 컬럼을 채우고 이후 주기적으로 드리프트를 보정한다.
+    - PLACE_AGGREGATE_VERIFY_INTERVAL: 초, 기본 3600 (0이면 비활성)
+    """
+    global _task
+    interval = float(os.getenv("PLACE_AGGREGATE_VERIFY_INTERVAL", "3600"))
+    if interval <= 0:
+        return None
+    _task = PeriodicTask("place-aggregate-verify", interval, lambda: verify_place_aggregates(repo))
+    _task.start()
+    return _task
+
+
+async def stop_aggregate_verifier() -> None:
+    global _task
+    if _task is not None:
+        task, _task = _task, None
+        await task.stop()
@@ -0,0 +1,34 @@
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+
+def _max_age() -> timedelta:
+    """PLACE_DETAIL_MAX_AGE(초, 기본 7일): 좌표/이미지를 외부 API에서 다시 받아오는 주기"""
+    try:
+        seconds = float(os.getenv("PLACE_DETAIL_MAX_AGE", str(7 * 24 * 3600)))
+    except ValueError:
+        seconds = 7 * 24 * 3600.0
+    return timedelta(seconds=seconds)
+
+
+def has_coords(place: Dict[str, Any]) -> bool:
+    return place.get("latitude") is not None and place.get("longitude") is not None
+
+
+def needs_refresh(place: Optional[Dict[str, Any]], now: Optional[datetime] = None) -> bool:
+    """
+    place 레코드의 보조 정보(좌표/이미지)를 외부 API로 갱신해야 하는지 판단한다.
+    - fetched_at이 없으면(한 번도 조회하지 않은 기존 행) 갱신
+    - PLACE_DETAIL_MAX_AGE보다 오래되었으면 갱신
+    외부 API에 좌표/이미지가 없던 경우에도 fetched_at은 기록되므로, 빈 값 때문에 매 요청 재조회하지 않는다.
+    """
+    if not place:
+        return False
+    fetched_at = place.get("fetched_at")
+    if not isinstance(fetched_at, datetime):
+        return True
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return now - fetched_at > _max_age()
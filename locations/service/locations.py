@@ -2,12 +2,21 @@ import os
 import jwt
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
-from haversine import haversine, Unit
+from util.geo_distance import distances_m, within_radius
 from tourapi.client import TourAPIClient
+from tourapi.dependency import get_tourapi_client
 from uuid import uuid4, UUID
 
-from locations.repository.place import PlaceRepository
-from locations.repository.place_bookmark import BookmarkRepository
+from locations.repository.place_async import AsyncPlaceRepository
+from locations.repository.place_bookmark_async import AsyncBookmarkRepository
+from locations.repository.place import detail_row
+from locations.service.freshness import needs_refresh
+from locations.service.recommend_cache import Degraded, get_recommend_cache
+from locations.service.ranking import RankWeights, decode_cursor, encode_cursor, score, top_k
+from locations.service.trend import get_trend_store
+from catalog.repository.tour_item_async import AsyncTourItemRepository
+from catalog.service.mirror import CatalogMirror
+from rag.normalizers import items_or_empty
 from locations.constants import CONTENTTYPE
 from locations.model.response.response import RecommendResponse
 
@@ -44,8 +53,8 @@ def _to_int(v, default=0) -> int:
                 return default
     return default
 
-def _distance_int(meters: float) -> int:
-    return int(round(_to_float(meters, 0.0)))
+# 랭킹 후보 수 (TourAPI numOfRows). 페이지 크기와 별개로 넉넉히 받아 점수로 고른다
+RECOMMEND_CANDIDATES = int(os.getenv("RECOMMEND_CANDIDATES", "100"))
 
 def _parse_auth_user(authorization: Optional[str]) -> Optional[UUID]:
     if not authorization:
@@ -65,114 +74,203 @@ def _parse_auth_user(authorization: Optional[str]) -> Optional[UUID]:
     except Exception:
         return None
 
-async def recommend(typeId: int, longitude: float, latitude: float, authorization: Optional[str] = None) -> RecommendResponse:
-    max_distance_m = 10_000
-
-    api_key = os.getenv("TOURAPI_KEY")
-    if not api_key:
-        raise ValueError("TOURAPI_KEY 환경 변수가 설정되지 않았습니다.")
-    client = TourAPIClient(api_key)
-
-    place_repo = PlaceRepository()
-    bookmark_repo = BookmarkRepository()
-    current_user_id = _parse_auth_user(authorization)
-    type_name = next((k for k, v in CONTENTTYPE.items() if v == typeId), str(typeId))
-
-    api_resp: Dict[str, Any] = await client.get_location_based_list(
+async def _build_candidates(
+    client: TourAPIClient, typeId: int, latitude: float, longitude: float, radius_m: int
+) -> List[Dict[str, Any]]:
+    """
+    (위치, 반경) 기준 추천 후보: TourAPI/미러 조회 → place 해석/생성 → 상세 갱신.
+    사용자별 값(거리, 북마크 여부)은 담지 않으므로 같은 셀의 요청끼리 공유할 수 있다.
+    """
+    place_repo = AsyncPlaceRepository()
+    query = dict(
         arrange="Q",
         content_type_id=typeId,
         map_x=longitude,
         map_y=latitude,
-        radius=max_distance_m,
-    )
-
-    items = (
-        api_resp.get("response", {})
-                .get("body", {})
-                .get("items", {})
-                .get("item", [])
+        radius=radius_m,
+        num_of_rows=RECOMMEND_CANDIDATES,
     )
-    if not isinstance(items, list):
-        items = [items] if items else []
-
-    origin = (latitude, longitude)
-    results = []  # type: List[Dict[str, Any]]
+    # 로컬 카탈로그 미러 우선, 미준비/0건/오류면 라이브 TourAPI
+    items: List[Dict[str, Any]] = []
+    try:
+        mirror_resp = await CatalogMirror(AsyncTourItemRepository()).location_based_list(**query)
+        items = items_or_empty(mirror_resp) if mirror_resp else []
+    except Exception:
+        items = []
+    if not items:
+        api_resp: Dict[str, Any] = await client.get_location_based_list(**query)
+        items = items_or_empty(api_resp)
 
+    # 1) TourAPI 결과 필터링 (DB 접근 없음)
+    usable = []  # type: List[Dict[str, Any]]
     for item in items:
         if not item:
             continue
-
-        title = str(item.get("title", "")).strip()
         img = item.get("firstimage")
         dest_y = _to_float(item.get("mapy"))
         dest_x = _to_float(item.get("mapx"))
         if dest_x == 0.0 or dest_y == 0.0 or not img:
             continue
+        usable.append(item)
+
+    # 1-1) 반경 밖 항목 제외: 바운딩 박스 1차 필터 + 한 번의 벡터 연산 (입력 순서 유지)
+    keep, _ = within_radius(
+        latitude, longitude,
+        [_to_float(it.get("mapy")) for it in usable],
+        [_to_float(it.get("mapx")) for it in usable],
+        radius_m,
+    )
+    candidates = []  # type: List[Dict[str, Any]]
+    for i in keep.tolist():
+        item = usable[i]
+        img = str(item.get("firstimage"))
+        candidates.append({
+            "title": str(item.get("title", "")).strip(),
+            "image": img,
+            "tour_addr": str(item.get("addr1") or item.get("addr2") or "").strip(),
+            "details": {
+                "latitude": _to_float(item.get("mapy")),
+                "longitude": _to_float(item.get("mapx")),
+                "image_url": img,
+                "content_id": item.get("contentid"),
+            },
+        })
 
+    # 2) place 해석/생성: 항목 수와 무관하게 일정한 왕복 횟수
+    # 실패하면 place 정보 없이 응답하되, 그 목록은 셀 캐시에 남기지 않는다
+    degraded = False
+    try:
+        places = await place_repo.resolve_or_create_places(
+            [(c["tour_addr"] or None, c["title"] or None) for c in candidates],
+            [c["details"] for c in candidates],
+        )
+    except Exception:
+        places = [None] * len(candidates)
+        degraded = True
+
+    # 2-1) 좌표/이미지가 비었거나 오래된 기존 place는 방금 받은 TourAPI 값으로 한 번에 갱신
+    stale = {}
+    for c, p in zip(candidates, places):
+        if p and needs_refresh(p):
+            stale.setdefault(str(p["place_id"]), detail_row(p["place_id"], c["details"]))
+    if stale:
         try:
-            distance_m = haversine(origin, (dest_y, dest_x), unit=Unit.METERS)
+            await place_repo.update_details_bulk(list(stale.values()))
         except Exception:
-            continue
+            pass
 
-        tour_addr = str(item.get("addr1") or item.get("addr2") or "").strip()
+    # 랭킹 입력은 빌드 시점 값으로 고정 (같은 캐시 세대 안에서는 페이지 사이 점수가 바뀌지 않는다)
+    trends = get_trend_store()
+    out = []  # type: List[Dict[str, Any]]
+    seen = set()
+    for c, place_info in zip(candidates, places):
+        tour_addr = c["tour_addr"]
+        place_id = place_info.get("place_id") if place_info else None
+        # 서로 다른 TourAPI 항목이 같은 place로 해석되면 첫 항목만
+        if place_id is not None:
+            if str(place_id) in seen:
+                continue
+            seen.add(str(place_id))
+        counts = trends.get(place_id)
+        out.append({
+            "place_id": place_id,
+            "content_id": c["details"]["content_id"],
+            "place_name": c["title"],
+            "rating": _to_float(place_info.get("overall_rating"), 0.0) if place_info else 0.0,
+            "bookmark_cnt": _to_int(place_info.get("overall_bookmark"), 0) if place_info else 0,
+            "address": (place_info.get("address") or tour_addr or "") if place_info else tour_addr,
+            "image": c["image"],
+            "latitude": c["details"]["latitude"],
+            "longitude": c["details"]["longitude"],
+            "recent_bookmarks": counts.bookmarks_7d if counts else 0,
+        })
+    return Degraded(out) if degraded else out
 
-        place_info = None
-        if tour_addr:
-            place_info = place_repo.get_place_by_address(tour_addr)
-        if not place_info and title:
-            place_info = place_repo.get_place_by_name(title)
-        if not place_info:
-            try:
-                place_info = place_repo.create_place(
-                    place_id=uuid4(),
-                    name=title or "미상",
-                    address=tour_addr or None,
-                )
-            except Exception:
-                place_info = None
-
-        rating = 0.0
-        bookmark_cnt = 0
-        address = tour_addr
-        place_id_val = None
-        if place_info:
-            if isinstance(place_info, dict):
-                rating = _to_float(place_info.get("overall_rating"), 0.0)
-                bookmark_cnt = _to_int(place_info.get("overall_bookmark"), 0)
-                address = place_info.get("address") or tour_addr or ""
-                place_id_val = place_info.get("place_id")
-            else:
-                try:
-                    rating = _to_float(place_info[3], 0.0)
-                    bookmark_cnt = _to_int(place_info[4], 0)
-                    address = place_info[2] or tour_addr or ""
-                    place_id_val = place_info[0]
-                except Exception:
-                    rating = 0.0
-                    bookmark_cnt = 0
-                    address = tour_addr or ""
-                    place_id_val = None
-
-        trend = bookmark_cnt > 100
-
-        is_bookmarked = False
-        if current_user_id and (place_id_val is not None):
-            try:
-                pid = UUID(str(place_id_val))
-                is_bookmarked = bookmark_repo.has_bookmark(user_id=current_user_id, place_id=pid)
-            except Exception:
-                is_bookmarked = False
 
+def _rank_tie(c: Dict[str, Any]) -> str:
+    """후보마다 유일한 동점 구분 키 (place_id 중복 제거 후: place_id, 없으면 TourAPI contentid)"""
+    if c["place_id"] is not None:
+        return f"p:{c['place_id']}"
+    return f"c:{c['content_id'] or c['place_name']}"
+
+
+async def recommend(
+    typeId: int, longitude: float, latitude: float, authorization: Optional[str] = None, *,
+    client: Optional[TourAPIClient] = None, limit: int = 20, cursor: Optional[str] = None,
+) -> RecommendResponse:
+    """
+    랭킹 점수(거리 감쇠, 평점, 누적 북마크, 최근 7일 북마크) 내림차순으로 cursor 다음 limit개.
+    - cursor에 첫 페이지의 기준 좌표를 담아, 이후 페이지도 같은 좌표로 후보/거리 점수를 계산한다
+      (표시용 distance만 현재 좌표 기준)
+    - 평점/북마크/최근 북마크는 후보 캐시 빌드 시점 값이라 같은 캐시 세대 안에서는 점수가 고정된다.
+      페이지 사이에 셀 캐시가 만료되어 다시 빌드되면 순서가 달라질 수 있다
+    잘못된 cursor는 InvalidCursor.
+    """
+    max_distance_m = 10_000
+
+    # 앱 전역 공유 클라이언트 사용 (요청마다 생성/누수 방지)
+    client = client or get_tourapi_client()
+
+    bookmark_repo = AsyncBookmarkRepository()
+    current_user_id = _parse_auth_user(authorization)
+    type_name = next((k for k, v in CONTENTTYPE.items() if v == typeId), str(typeId))
+    after, (rank_lat, rank_lon) = decode_cursor(cursor) if cursor else (None, (latitude, longitude))
+
+    # 1) 사용자 무관 후보: 같은 geohash 셀의 요청끼리 공유 (캐시된 목록은 변경하지 않는다)
+    shared = await get_recommend_cache().candidates(
+        typeId, rank_lat, rank_lon, max_distance_m,
+        lambda lat, lon, radius: _build_candidates(client, typeId, lat, lon, radius),
+    )
+
+    # 2) 기준 좌표로 거리/반경 재계산 (후보 순서 유지)
+    keep, dists = within_radius(
+        rank_lat, rank_lon,
+        [c["latitude"] for c in shared],
+        [c["longitude"] for c in shared],
+        max_distance_m,
+    )
+    nearby = [(shared[i], d) for i, d in zip(keep.tolist(), dists.tolist())]
+
+    # 3) 랭킹: 전체 정렬 없이 힙으로 이번 페이지만 선택
+    weights = RankWeights.from_env()
+    trends = get_trend_store()
+    keys = [
+        (
+            score(weights, distance_m=d, rating=c["rating"], bookmark_cnt=c["bookmark_cnt"], recent_bookmarks=c["recent_bookmarks"]),
+            _rank_tie(c),
+        )
+        for c, d in nearby
+    ]
+    page, next_key = top_k(nearby, keys, limit, after)
+    next_cursor = encode_cursor(next_key, (rank_lat, rank_lon)) if next_key else None
+    if (rank_lat, rank_lon) != (latitude, longitude) and page:
+        shown = distances_m(latitude, longitude, [c["latitude"] for c, _ in page], [c["longitude"] for c, _ in page])
+        page = [(c, max(0, int(d))) for (c, _), d in zip(page, shown.tolist())]
+
+    # 4) 북마크 여부: 이번 페이지만 한 번에 조회
+    bookmarked_ids = set()
+    if current_user_id:
+        try:
+            bookmarked_ids = await bookmark_repo.bookmarked_place_ids(
+                current_user_id, [UUID(str(c["place_id"])) for c, _ in page if c["place_id"]]
+            )
+        except Exception:
+            bookmarked_ids = set()
+
+    results = []  # type: List[Dict[str, Any]]
+    for c, distance_m in page:
+        place_id_val = c["place_id"]
+        is_bookmarked = place_id_val is not None and UUID(str(place_id_val)) in bookmarked_ids
         results.append({
             "place_id": place_id_val or str(uuid4()),
-            "place_name": title,
-            "rating": float(rating),
-            "trend": bool(trend),
-            "bookmark_cnt": int(bookmark_cnt),
-            "distance": _distance_int(distance_m),
-            "address": address,
-            "image": str(img),
+            "place_name": c["place_name"],
+            "rating": float(c["rating"]),
+            "trend": trends.is_trending(place_id_val),
+            "bookmark_cnt": int(c["bookmark_cnt"]),
+            "distance": distance_m,
+            "address": c["address"],
+            "image": c["image"],
             "bookmarked": bool(is_bookmarked),
         })
 
-    return RecommendResponse(type=type_name, items=results)
\ No newline at end of file
+    return RecommendResponse(type=type_name, items=results, next_cursor=next_cursor)
@@ -1,25 +1,51 @@
+import asyncio
+import os
 from typing import Any, Dict, Optional
 from uuid import uuid4, UUID  # UUID 추가
 from urllib.parse import unquote
 import re
 from fastapi import HTTPException
-import os
-from httpx import AsyncClient  # Kakao Local REST 호출용
-from haversine import haversine  # 거리 계산
-
-from locations.repository.place import PlaceRepository
+from util.geo_distance import distance_m  # 거리 계산
+
+from locations.repository.place_async import AsyncPlaceRepository
+from locations.service.freshness import needs_refresh, has_coords
+from util.fanout import FAILED, Deadline, bounded, value
+from tourapi.client import TourAPIClient
+from tourapi.dependency import get_tourapi_client
+from kakao.client import KakaoLocalClient
+from kakao.dependency import get_kakao_client
 from locations.model.response.place import PlaceResponse, PlaceDetailResponse
 
 # 새로 import: JWT 디코딩과 북마크 조회
 import jwt
 from util.jwt_config import get_jwt_config
-from locations.repository.place_bookmark import BookmarkRepository
+from locations.repository.place_bookmark_async import AsyncBookmarkRepository
 
 class PlaceService:
-    def __init__(self) -> None:
-        self.repo = PlaceRepository()
-        self.bookmarks = BookmarkRepository()
+    def __init__(self, tour: Optional[TourAPIClient] = None, kakao: Optional[KakaoLocalClient] = None) -> None:
+        self._tour = tour
+        self._kakao = kakao
+        self.repo = AsyncPlaceRepository()
+        self.bookmarks = AsyncBookmarkRepository()
         self.jwt_conf = get_jwt_config()
+        # 외부 호출 1건당 타임아웃 / 요청 전체 데드라인 (초)
+        self.call_timeout = float(os.getenv("PLACE_CALL_TIMEOUT", "3"))
+        self.request_deadline = float(os.getenv("PLACE_REQUEST_DEADLINE", "8"))
+
+    def _bounded(self, aw, deadline: Deadline, default: Any = None):
+        return bounded(aw, timeout=self.call_timeout, deadline=deadline, default=default)
+
+    @property
+    def tour(self) -> TourAPIClient:
+        if self._tour is None:
+            self._tour = get_tourapi_client()
+        return self._tour
+
+    @property
+    def kakao(self) -> KakaoLocalClient:
+        if self._kakao is None:
+            self._kakao = get_kakao_client()
+        return self._kakao
 
     def _normalize_name(self, raw: str) -> str:
         s = unquote(raw or "").strip()
@@ -47,6 +73,10 @@ class PlaceService:
                 "address": row.get("address"),
                 "overall_rating": float(row.get("overall_rating", 0.0) or 0.0),
                 "overall_bookmark": int(row.get("overall_bookmark", 0) or 0),
+                "latitude": row.get("latitude"),
+                "longitude": row.get("longitude"),
+                "image_url": row.get("image_url"),
+                "fetched_at": row.get("fetched_at"),
                 "image": row.get("image") or row.get("image_url"),
                 "distance": row.get("distance") or row.get("distance_meters"),
                 "trend": row.get("trend"),
@@ -83,28 +113,16 @@ class PlaceService:
         """
         Kakao Local 검색 API(키워드)로 장소를 조회합니다.
         이미지는 제공되지 않으므로 빈 문자열을 반환합니다.
+        결과가 없으면 None, 호출 실패는 예외로 전파합니다.
         """
-        api_key = os.getenv("KAKAO_REST_API_KEY")
-        if not api_key or not keyword.strip():
-            return None
-
-        headers = {"Authorization": f"KakaoAK {api_key}"}
-        params = {"query": keyword, "size": 1, "page": 1}
-
-        try:
-            async with AsyncClient(timeout=10.0) as client:
-                r = await client.get("https://dapi.kakao.com/v2/local/search/keyword.json",
-                                     params=params, headers=headers)
-                r.raise_for_status()
-                data = r.json()
-        except Exception:
+        if not keyword.strip():
             return None
 
-        docs = data.get("documents") or []
-        if not docs:
+        # 공유 클라이언트 + 키워드 캐시 (적중 시 외부 호출 없음)
+        first = await self.kakao.search_keyword_first(keyword)
+        if not first:
             return None
 
-        first = docs[0]
         title = (first.get("place_name") or keyword).strip()
         address = (first.get("road_address_name") or first.get("address_name") or "").strip()
         # Kakao 좌표: x=경도, y=위도
@@ -126,129 +144,78 @@ class PlaceService:
             "latitude": y,
         }
 
+    def _first_item(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        items = (
+            data.get("response", {})
+                .get("body", {})
+                .get("items", {})
+                .get("item", [])
+        )
+        if not isinstance(items, list):
+            items = [items] if items else []
+        return (items[0] or None) if items else None
+
+    async def _search_tourapi(self, keyword: str) -> Optional[Dict[str, Any]]:
+        """TourAPI 키워드 검색 첫 항목. 결과가 없으면 None, 호출 실패는 예외로 전파."""
+        if not keyword.strip():
+            return None
+        data = await self.tour.get_search_keyword(keyword=keyword, arrange="Q", num_of_rows=1, page_no=1)
+        return self._first_item(data)
+
     async def _fetch_image_from_tourapi(self, keyword: str) -> str:
         """
         TourAPI 검색으로 대표 이미지(firstimage/firstimage2)를 조회합니다.
-        실패 시 공백 문자열 반환.
+        이미지가 없으면 공백 문자열, 호출 실패는 예외로 전파.
         """
-        api_key = os.getenv("TOURAPI_KEY")
-        if not api_key or not keyword.strip():
+        first = await self._search_tourapi(keyword) or {}
+        return (first.get("firstimage") or first.get("firstimage2") or "").strip()
+
+    async def _fetch_overview(self, content_id: Any) -> str:
+        """detailCommon2 개요(overview). 실패 시 공백 문자열."""
+        if not content_id:
             return ""
-        base = "http://apis.data.go.kr/B551011/KorService2/searchKeyword2"
-        params = {
-            "serviceKey": api_key,
-            "_type": "json",
-            "MobileOS": "ETC",
-            "MobileApp": "Nomadly",
-            "keyword": keyword,
-            "numOfRows": 1,
-            "pageNo": 1,
-            "arrange": "Q",
-        }
         try:
-            async with AsyncClient(timeout=10.0) as client:
-                r = await client.get(base, params=params)
-                r.raise_for_status()
-                data = r.json()
-            items = (
-                data.get("response", {})
-                    .get("body", {})
-                    .get("items", {})
-                    .get("item", [])
-            )
-            if not isinstance(items, list):
-                items = [items] if items else []
-            if not items:
-                return ""
-            first = items[0] or {}
-            img = (first.get("firstimage") or first.get("firstimage2") or "").strip()
-            return img
+            ddata = await self.tour.get_detail_common(content_id=content_id)
+            return ((self._first_item(ddata) or {}).get("overview") or "")
         except Exception:
             return ""
 
-    async def _fetch_detail_from_tourapi(self, keyword: str) -> Optional[Dict[str, Any]]:
-        """
-        TourAPI 키워드 검색으로 좌표를 찾고, detailCommon2로 overview(개요)를 보조 조회합니다.
-        """
-        api_key = os.getenv("TOURAPI_KEY")
-        if not api_key or not keyword.strip():
+    def _tour_detail(self, it: Optional[Dict[str, Any]], keyword: str, overview: str = "") -> Optional[Dict[str, Any]]:
+        """TourAPI 검색 항목 + overview를 상세 응답용 dict로 변환 (좌표 없으면 None)"""
+        if not it:
             return None
-        base = "http://apis.data.go.kr/B551011/KorService2/searchKeyword2"
-        params = {
-            "serviceKey": api_key,
-            "_type": "json",
-            "MobileOS": "ETC",
-            "MobileApp": "Nomadly",
-            "keyword": keyword,
-            "numOfRows": 1,
-            "pageNo": 1,
-            "arrange": "Q",
-        }
+        name = (it.get("title") or keyword).strip()
+        addr = (it.get("addr1") or it.get("addr2") or "").strip()
         try:
-            async with AsyncClient(timeout=10.0) as client:
-                r = await client.get(base, params=params)
-                r.raise_for_status()
-                data = r.json()
-            items = (data.get("response", {}).get("body", {}).get("items", {}).get("item", [])) or []
-            if not isinstance(items, list):
-                items = [items]
-            if not items:
-                return None
-            it = items[0] or {}
-            name = (it.get("title") or keyword).strip()
-            addr = (it.get("addr1") or it.get("addr2") or "").strip()
-            try:
-                lon = float(it.get("mapx")) if it.get("mapx") is not None else None
-                lat = float(it.get("mapy")) if it.get("mapy") is not None else None
-            except Exception:
-                lon, lat = None, None
+            lon = float(it.get("mapx")) if it.get("mapx") is not None else None
+            lat = float(it.get("mapy")) if it.get("mapy") is not None else None
+        except Exception:
+            lon, lat = None, None
+        if lon is None or lat is None:
+            return None
+        desc = self._one_line(overview or addr or name)
+        return {"name": name, "longitude": lon, "latitude": lat, "description": desc}
 
-            # detailCommon2로 overview 보강 (가능하면)
-            overview = ""
-            content_id = it.get("contentid") or it.get("contentId")
-            if content_id:
-                try:
-                    detail_base = "http://apis.data.go.kr/B551011/KorService2/detailCommon2"
-                    detail_params = {
-                        "serviceKey": api_key,
-                        "_type": "json",
-                        "MobileOS": "ETC",
-                        "MobileApp": "Nomadly",
-                        "contentId": content_id,
-                        "overviewYN": "Y",
-                        "defaultYN": "N",
-                    }
-                    async with AsyncClient(timeout=10.0) as client:
-                        dr = await client.get(detail_base, params=detail_params)
-                        dr.raise_for_status()
-                        ddata = dr.json()
-                    ditem = (
-                        ddata.get("response", {})
-                             .get("body", {})
-                             .get("items", {})
-                             .get("item", [])
-                    )
-                    if not isinstance(ditem, list):
-                        ditem = [ditem] if ditem else []
-                    if ditem:
-                        overview = (ditem[0] or {}).get("overview") or ""
-                except Exception:
-                    overview = ""
+    def _content_id(self, it: Optional[Dict[str, Any]]) -> Any:
+        return (it or {}).get("contentid") or (it or {}).get("contentId")
 
-            desc = self._one_line(overview or addr or name)
-            if lon is None or lat is None:
-                return None
-            return {"name": name, "longitude": lon, "latitude": lat, "description": desc}
+    async def _bookmarked_by_address(self, user_id: Optional[UUID], address: str) -> bool:
+        if not user_id or not address:
+            return False
+        try:
+            by_addr = await self.repo.get_place_by_address(address)
+            if not by_addr:
+                return False
+            return await self.bookmarks.has_bookmark(user_id=user_id, place_id=UUID(str(by_addr["place_id"])))
         except Exception:
-            return None
+            return False
 
     def _compute_distance_m(self, origin_lon: float, origin_lat: float, dest_lon: float, dest_lat: float) -> int:
         """
         경위도(경도, 위도)로부터 거리(m)를 정수로 반환
         """
         try:
-            meters = haversine((origin_lat, origin_lon), (dest_lat, dest_lon), unit="m")
-            return int(round(float(meters)))
+            return distance_m(origin_lat, origin_lon, dest_lat, dest_lon)
         except Exception:
             return 0
 
@@ -281,6 +248,51 @@ class PlaceService:
             "bookmarked": bool(bookmarked),
         }
 
+    def _distance_from(self, place_dict: Dict[str, Any], longitude: Optional[float], latitude: Optional[float]) -> Optional[int]:
+        if longitude is None or latitude is None or not has_coords(place_dict):
+            return None
+        return self._compute_distance_m(longitude, latitude, float(place_dict["longitude"]), float(place_dict["latitude"]))
+
+    async def _ensure_details(self, place_dict: Dict[str, Any], source: Optional[Dict[str, Any]] = None, image: Optional[str] = None) -> Dict[str, Any]:
+        """
+        DB에 저장된 좌표/이미지가 신선하면 그대로 사용하고,
+        비었거나 오래된 경우에만 Kakao/TourAPI로 다시 받아 place에 저장한다.
+        source/image: 이미 조회한 Kakao 결과/TourAPI 이미지가 있으면 재사용 (FAILED면 실패한 조회)
+        조회 중 하나라도 시간 초과/실패(FAILED)면 저장하지 않아 fetched_at이 그대로 남고,
+        다음 요청에서 다시 조회한다. 이번 응답에는 받은 값만 반영한다.
+        """
+        if not needs_refresh(place_dict):
+            return place_dict
+        name = place_dict.get("name") or ""
+        deadline = Deadline(self.request_deadline)
+        # Kakao 좌표와 TourAPI 이미지는 서로 독립이므로 동시에 조회
+        source, image = await asyncio.gather(
+            value(source) if source is not None else self._bounded(self._fetch_from_kakao(name), deadline, default=FAILED),
+            value(image) if image is not None else self._bounded(self._fetch_image_from_tourapi(name), deadline, default=FAILED),
+        )
+        complete = source is not FAILED and image is not FAILED
+        source = source if source is not FAILED else None
+        image = image if image is not FAILED else None
+        source = source or {}
+        details = {
+            "latitude": source.get("latitude"),
+            "longitude": source.get("longitude"),
+            "image_url": image or None,
+        }
+        updated = None
+        if complete:
+            try:
+                updated = await self.repo.update_details(UUID(str(place_dict["place_id"])), details)
+            except Exception:
+                updated = None
+        merged = dict(place_dict)
+        if updated:
+            merged.update(self._row_to_place_dict(updated) or {})
+        else:
+            merged.update({k: v for k, v in details.items() if v is not None})
+            merged["image"] = merged.get("image_url")
+        return merged
+
     async def get_or_create_place(self, place_name: str, longitude: Optional[float] = None, latitude: Optional[float] = None, *, authorization: Optional[str] = None) -> PlaceResponse:
         norm_name = self._normalize_name(place_name)
         if not norm_name:
@@ -289,79 +301,75 @@ class PlaceService:
         current_user: Optional[UUID] = self._parse_auth_user(authorization)
 
         # 1) DB 우선 조회 (이름)
-        row = self.repo.get_place_by_name(norm_name)
+        row = await self.repo.get_place_by_name(norm_name)
         place_dict = self._row_to_place_dict(row)
         if place_dict:
-            # 거리 계산 위해 Kakao에서 좌표만 보조 조회
-            distance_override = None
-            if longitude is not None and latitude is not None:
-                kakao = await self._fetch_from_kakao(norm_name) or {}
-                dx, dy = kakao.get("longitude"), kakao.get("latitude")
-                if isinstance(dx, (int, float)) and isinstance(dy, (int, float)):
-                    distance_override = self._compute_distance_m(longitude, latitude, dx, dy)
+            # 좌표/이미지는 DB 값 사용 (비었거나 오래된 경우에만 외부 조회 후 저장)
+            place_dict = await self._ensure_details(place_dict)
+            distance_override = self._distance_from(place_dict, longitude, latitude)
             # 북마크 여부
             bookmarked = False
             if current_user:
                 try:
-                    bookmarked = self.bookmarks.has_bookmark(user_id=current_user, place_id=UUID(str(place_dict["place_id"])))
+                    bookmarked = await self.bookmarks.has_bookmark(user_id=current_user, place_id=UUID(str(place_dict["place_id"])))
                 except Exception:
                     bookmarked = False
             payload = self._to_response_payload(place_dict, norm_name, distance_override=distance_override, bookmarked=bookmarked)
-            if not payload.get("image"):
-                payload["image"] = await self._fetch_image_from_tourapi(payload["place_name"]) or ""
             return PlaceResponse(**payload)
 
-        # 2) Kakao Local 조회
-        source = await self._fetch_from_kakao(norm_name)
+        # 2) Kakao Local 조회 + TourAPI 이미지 동시 조회 (신규 생성 시 이미지도 함께 저장)
+        deadline = Deadline(self.request_deadline)
+        source, image = await asyncio.gather(
+            self._bounded(self._fetch_from_kakao(norm_name), deadline),
+            self._bounded(self._fetch_image_from_tourapi(norm_name), deadline, default=FAILED),
+        )
         if not source:
             raise HTTPException(status_code=404, detail="외부 데이터 없음")
 
         # 2-1) 주소 중복 체크: 동일 주소의 place가 있으면 그 레코드를 반환
         addr = (source.get("address") or "").strip()
         if addr:
-            by_addr = self.repo.get_place_by_address(addr)
+            by_addr = await self.repo.get_place_by_address(addr)
             if by_addr:
                 by_addr_dict = self._row_to_place_dict(by_addr) or {}
-                # 거리 계산 (Kakao 좌표 사용)
-                distance_override = None
-                if longitude is not None and latitude is not None:
-                    dx, dy = source.get("longitude"), source.get("latitude")
-                    if isinstance(dx, (int, float)) and isinstance(dy, (int, float)):
-                        distance_override = self._compute_distance_m(longitude, latitude, dx, dy)
+                # 방금 받은 Kakao 좌표를 재사용해 필요 시 DB 보강
+                by_addr_dict = await self._ensure_details(by_addr_dict, source, image)
+                distance_override = self._distance_from(by_addr_dict, longitude, latitude)
                 # 북마크 여부
                 bookmarked = False
                 if current_user:
                     try:
-                        bookmarked = self.bookmarks.has_bookmark(user_id=current_user, place_id=UUID(str(by_addr_dict.get("place_id"))))
+                        bookmarked = await self.bookmarks.has_bookmark(user_id=current_user, place_id=UUID(str(by_addr_dict.get("place_id"))))
                     except Exception:
                         bookmarked = False
                 payload = self._to_response_payload(by_addr_dict, norm_name, distance_override=distance_override, bookmarked=bookmarked)
-                if not payload.get("image"):
-                    payload["image"] = await self._fetch_image_from_tourapi(payload["place_name"]) or ""
                 return PlaceResponse(**payload)
 
-        # 3) DB에 최소 정보 생성 (주소 중복 없을 때만)
+        # 3) DB 생성 (주소 중복 없을 때만): 좌표/이미지도 함께 저장해 다음 조회부터 외부 호출 생략
+        # 이미지 조회가 실패했으면 fetched_at을 비워 두어 다음 조회에서 다시 받는다
+        image_ok = image is not FAILED
+        source["image"] = (image if image_ok else "") or ""
         new_place_id = uuid4()
         try:
-            self.repo.create_place(
+            await self.repo.create_place(
                 place_id=new_place_id,
                 name=source.get("name") or norm_name,
                 address=source.get("address"),
+                details={
+                    "latitude": source.get("latitude"),
+                    "longitude": source.get("longitude"),
+                    "image_url": source["image"] or None,
+                },
+                fetched=image_ok,
             )
         except Exception:
             pass
 
         # 4) 거리 계산
-        distance_override = None
-        if longitude is not None and latitude is not None:
-            dx, dy = source.get("longitude"), source.get("latitude")
-            if isinstance(dx, (int, float)) and isinstance(dy, (int, float)):
-                distance_override = self._compute_distance_m(longitude, latitude, dx, dy)
+        distance_override = self._distance_from(source, longitude, latitude)
 
         # 북마크 여부(새로 생성된 경우는 기본 False)
         payload = self._to_response_payload(source, norm_name, place_id=str(new_place_id), distance_override=distance_override, bookmarked=False)
-        if not payload.get("image"):
-            payload["image"] = await self._fetch_image_from_tourapi(payload["place_name"]) or ""
         return PlaceResponse(**payload)
 
     async def get_place_detail(self, q: str, longitude: Optional[float] = None, latitude: Optional[float] = None, *, authorization: Optional[str] = None) -> PlaceDetailResponse:
@@ -369,6 +377,8 @@ class PlaceService:
         DB 비의존 상세 조회:
         - Kakao Local → 좌표/주소로 한줄 설명 구성, TourAPI overview 있으면 우선 사용
         - 실패 시 TourAPI 키워드 검색으로 보조
+        - 독립 호출은 동시에 수행하고, 호출별 타임아웃(PLACE_CALL_TIMEOUT)과
+          요청 데드라인(PLACE_REQUEST_DEADLINE) 안에서 끝나지 않은 호출은 없는 결과로 처리
         """
         key = (q or "").strip()
         if not key:
@@ -376,27 +386,28 @@ class PlaceService:
 
         current_user: Optional[UUID] = self._parse_auth_user(authorization)
 
-        # 1) Kakao Local 우선
-        kakao = await self._fetch_from_kakao(key)
-        if (kakao and kakao.get("longitude") is not None and kakao.get("latitude") is not None):
+        deadline = Deadline(self.request_deadline)
+
+        # 1) Kakao Local과 TourAPI 키워드 검색은 서로 독립이므로 동시에 조회
+        kakao, tour_item = await asyncio.gather(
+            self._bounded(self._fetch_from_kakao(key), deadline),
+            self._bounded(self._search_tourapi(key), deadline),
+        )
+
+        # 2) 2단계 팬아웃: detailCommon2 overview + (Kakao 주소 기준) 북마크 여부
+        kakao_ok = bool(kakao and kakao.get("longitude") is not None and kakao.get("latitude") is not None)
+        addr = (kakao or {}).get("address") or ""
+        content_id = self._content_id(tour_item)
+        overview, bookmarked = await asyncio.gather(
+            self._bounded(self._fetch_overview(content_id), deadline, default="") if content_id else value(""),
+            # Kakao 기반은 DB place_id가 없으므로, 동일 주소의 place가 있으면 그 기준으로 평가
+            self._bounded(self._bookmarked_by_address(current_user, addr), deadline, default=False) if kakao_ok else value(False),
+        )
+
+        if kakao_ok:
             name = kakao.get("name") or key
-            addr = kakao.get("address") or ""
-
-            # TourAPI로 overview 보강 시도
-            overview_detail = await self._fetch_detail_from_tourapi(name) or {}
+            overview_detail = self._tour_detail(tour_item, name, overview) or {}
             desc = overview_detail.get("description") or self._one_line(f"{name} · {addr}" if addr else name)
-
-            # bookmarked: Kakao 기반은 DB place_id가 없으므로 false. 다만 DB에 존재하는 동일 이름/주소가 있으면 그 기준으로 재평가 가능.
-            bookmarked = False
-            if current_user and addr:
-                try:
-                    by_addr = self.repo.get_place_by_address(addr)
-                    if by_addr:
-                        pid = UUID(str((by_addr or {})["place_id"]))
-                        bookmarked = self.bookmarks.has_bookmark(user_id=current_user, place_id=pid)
-                except Exception:
-                    bookmarked = False
-
             return PlaceDetailResponse(
                 place_name=name,
                 longitude=float(kakao["longitude"]),
@@ -405,8 +416,8 @@ class PlaceService:
                 bookmarked=bool(bookmarked)
             )
 
-        # 2) TourAPI 보조 (좌표 + overview)
-        tour = await self._fetch_detail_from_tourapi(key)
+        # TourAPI 보조 (좌표 + overview)
+        tour = self._tour_detail(tour_item, key, overview)
         if tour:
             # TourAPI만으로는 DB 매칭이 어려워 기본 False
             return PlaceDetailResponse(
@@ -0,0 +1,101 @@
+from __future__ import annotations
+import heapq
+import math
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from util import pagination
+
+SortKey = Tuple[float, str]
+Origin = Tuple[float, float]
+
+
+class RankWeights:
+    """
+    추천 점수 가중치와 정규화 기준.
+    각 신호를 0~1로 맞춘 뒤 가중합한다.
+    - distance: 반감기(distance_half_life_m)마다 절반으로 줄어드는 거리 감쇠
+    - rating: overall_rating / 5
+    - bookmark: log(1 + 누적 북마크) / log(1 + bookmark_saturation), 1에서 포화
+    - velocity: 최근 북마크 수 / velocity_saturation, 1에서 포화
+    """
+    def __init__(
+        self,
+        distance: float = 0.4,
+        rating: float = 0.25,
+        bookmark: float = 0.2,
+        velocity: float = 0.15,
+        *,
+        distance_half_life_m: float = 3_000.0,
+        bookmark_saturation: float = 1_000.0,
+        velocity_saturation: float = 20.0,
+    ) -> None:
+        self.distance = distance
+        self.rating = rating
+        self.bookmark = bookmark
+        self.velocity = velocity
+        self.distance_half_life_m = distance_half_life_m
+        self.bookmark_saturation = bookmark_saturation
+        self.velocity_saturation = velocity_saturation
+
+    @classmethod
+    def from_env(cls) -> "RankWeights":
+        """
+        - RANK_W_DISTANCE / RANK_W_RATING / RANK_W_BOOKMARK / RANK_W_VELOCITY: 기본 0.4 / 0.25 / 0.2 / 0.15
+        - RANK_DISTANCE_HALF_LIFE: m, 기본 3000
+        - RANK_BOOKMARK_SATURATION: 기본 1000
+        - RANK_VELOCITY_SATURATION: 기본 20
+        """
+        return cls(
+            distance=float(os.getenv("RANK_W_DISTANCE", "0.4")),
+            rating=float(os.getenv("RANK_W_RATING", "0.25")),
+            bookmark=float(os.getenv("RANK_W_BOOKMARK", "0.2")),
+            velocity=float(os.getenv("RANK_W_VELOCITY", "0.15")),
+            distance_half_life_m=float(os.getenv("RANK_DISTANCE_HALF_LIFE", "3000")),
+            bookmark_saturation=float(os.getenv("RANK_BOOKMARK_SATURATION", "1000")),
+            velocity_saturation=float(os.getenv("RANK_VELOCITY_SATURATION", "20")),
+        )
+
+
+def score(w: RankWeights, *, distance_m: float, rating: float, bookmark_cnt: int, recent_bookmarks: int) -> float:
+    decay = 0.5 ** (max(0.0, distance_m) / w.distance_half_life_m) if w.distance_half_life_m > 0 else 0.0
+    pop = min(1.0, math.log1p(max(0, bookmark_cnt)) / math.log1p(w.bookmark_saturation)) if w.bookmark_saturation > 0 else 0.0
+    vel = min(1.0, max(0, recent_bookmarks) / w.velocity_saturation) if w.velocity_saturation > 0 else 0.0
+    return (
+        w.distance * decay
+        + w.rating * min(1.0, max(0.0, rating) / 5.0)
+        + w.bookmark * pop
+        + w.velocity * vel
+    )
+
+
+def encode_cursor(key: SortKey, origin: Origin) -> str:
+    """마지막 항목의 정렬 키 + 점수를 계산한 기준 좌표"""
+    return pagination.encode_cursor(key[0], key[1], origin[0], origin[1])
+
+
+def decode_cursor(cursor: str) -> Tuple[SortKey, Origin]:
+    """(정렬 키, 기준 좌표). 잘못된 cursor는 InvalidCursor"""
+    if not cursor:
+        raise pagination.InvalidCursor("유효하지 않은 cursor입니다.")
+    s, tie, lat, lon = pagination.decode_cursor(cursor, float, str, float, float)
+    return (s, tie), (lat, lon)
+
+
+def top_k(
+    items: Sequence[Dict[str, Any]],
+    keys: Sequence[SortKey],
+    limit: int,
+    after: Optional[SortKey] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[SortKey]]:
+    """
+    (점수, 동점 구분 키) 내림차순으로 after 다음 limit개를 고른다.
+    동점 구분 키는 항목마다 유일해야 페이지 경계에서 빠지거나 겹치지 않는다.
+    전체 정렬 대신 heapq.nlargest(limit + 1)로 O(n log k); 한 개 더 뽑아 다음 페이지 유무를 판단.
+    반환: (페이지 항목, 다음 페이지의 after 또는 None)
+    """
+    pool = [(k, i) for i, k in enumerate(keys) if after is None or k < after]
+    picked = heapq.nlargest(max(0, limit) + 1, pool, key=lambda p: p[0])
+    page = picked[:limit]
+    next_key = page[-1][0] if len(picked) > limit and page else None
+    return [items[i] for _, i in page], next_key
@@ -18,8 +18,6 @@ class RatingService:
         if current_user_id != req.user_id:
             raise HTTPException(status_code=403, detail="요청 사용자와 세션 사용자가 일치하지 않습니다.")
         try:
-            self.repo.add_rating(place_id=req.place_id, score=req.score, user_id=req.user_id)
-            updated = self.repo.refresh_rating_aggregates(req.place_id)
-            return updated
+            return self.repo.add_rating(place_id=req.place_id, score=req.score, user_id=req.user_id)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"평점 추가 중 오류 발생: {str(e)}")
@@ -0,0 +1,107 @@
+from __future__ import annotations
+import math
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from util import geohash
+from util.cache import BoundedTTLCache, MISSING
+from util.geo_distance import M_PER_DEG_LAT
+from util.singleflight import SingleFlight
+
+# locationBasedList2가 허용하는 최대 반경
+MAX_SEARCH_RADIUS_M = 20_000
+
+Candidates = List[Dict[str, Any]]
+
+
+class Degraded(list):
+    """
+    일부 조회가 실패해 보강(place 해석 등)이 빠진 후보 목록.
+    이번 요청과 합쳐진 동시 요청에만 쓰고 캐시하지 않는다 (다음 요청이 다시 빌드)
+    """
+
+
+BuildFn = Callable[[float, float, int], Awaitable[Candidates]]
+
+
+class RecommendCache:
+    """
+    추천 후보 캐시: (contentTypeId, geohash 셀) → 사용자와 무관한 후보 목록.
+    - 같은 셀의 요청은 셀 중심에서 (반경 + 셀 반대각선)으로 한 번만 조회/보강하고 결과를 공유
+    - 거리와 북마크 여부는 호출부가 요청마다 실제 위치/사용자로 다시 계산한다
+    - 같은 키의 동시 미스는 한 번의 빌드로 합친다
+    - 캐시된 목록은 여러 요청이 공유하므로 호출부에서 변경하지 않아야 한다
+    - build가 Degraded를 반환하면 캐시하지 않는다
+    ttl_seconds <= 0이면 캐시 없이 요청 좌표 그대로 빌드한다.
+    """
+    def __init__(self, precision: int = 6, ttl_seconds: float = 300.0, max_entries: int = 2048) -> None:
+        self.precision = precision
+        self.ttl_seconds = ttl_seconds
+        self._cache = BoundedTTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._flight = SingleFlight()
+        self.degraded = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def cell_query(self, lat: float, lon: float, radius_m: float) -> Tuple[str, float, float, int]:
+        """(셀, 중심 위도, 중심 경도, 셀 안 어디서든 radius_m 원을 덮는 조회 반경)"""
+        cell = geohash.encode(lat, lon, self.precision)
+        c_lat, c_lon = geohash.decode(cell)
+        dlat, dlon = geohash.cell_size(self.precision)
+        half_h = dlat * M_PER_DEG_LAT / 2
+        half_w = dlon * M_PER_DEG_LAT * math.cos(math.radians(c_lat)) / 2
+        search = min(MAX_SEARCH_RADIUS_M, int(math.ceil(radius_m + math.hypot(half_h, half_w))))
+        return cell, c_lat, c_lon, search
+
+    async def candidates(self, type_id: int, lat: float, lon: float, radius_m: int, build: BuildFn) -> Candidates:
+        if not self.enabled:
+            return await build(lat, lon, radius_m)
+        cell, c_lat, c_lon, search = self.cell_query(lat, lon, radius_m)
+        key = (type_id, cell, radius_m)
+        cached = self._cache.get(key)
+        if cached is not MISSING:
+            return cached
+
+        async def _load() -> Candidates:
+            result = await build(c_lat, c_lon, search)
+            if isinstance(result, Degraded):
+                self.degraded += 1
+            else:
+                self._cache.set(key, result)
+            return result
+
+        return await self._flight.do(key, _load)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "precision": self.precision,
+            "ttl_seconds": self.ttl_seconds,
+            **self._cache.stats(),
+            "degraded": self.degraded,
+            "singleflight": self._flight.stats(),
+        }
+
+
+_cache: Optional[RecommendCache] = None
+
+
+def get_recommend_cache() -> RecommendCache:
+    """
+    프로세스 공유 인스턴스 (첫 호출 시 환경변수로 생성)
+    - RECOMMEND_CACHE_PRECISION: geohash 자리수, 기본 6 (≈1.2km × 0.6km 셀)
+    - RECOMMEND_CACHE_TTL: 초, 기본 300 (0이면 비활성)
+    - RECOMMEND_CACHE_SIZE: 최대 셀 수, 기본 2048
+    """
+    global _cache
+    if _cache is None:
+        _cache = RecommendCache(
+            precision=int(os.getenv("RECOMMEND_CACHE_PRECISION", "6")),
+            ttl_seconds=float(os.getenv("RECOMMEND_CACHE_TTL", "300")),
+            max_entries=int(os.getenv("RECOMMEND_CACHE_SIZE", "2048")),
+        )
+    return _cache
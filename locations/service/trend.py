@@ -0,0 +1,144 @@
+from __future__ import annotations
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from util.geo_distance import bbox, within_radius
+from util.periodic import PeriodicTask
+
+
+class TrendCounts:
+    __slots__ = ("bookmarks_24h", "bookmarks_7d", "ratings_24h", "ratings_7d", "score")
+
+    def __init__(self, bookmarks_24h: int = 0, bookmarks_7d: int = 0, ratings_24h: int = 0, ratings_7d: int = 0, score: float = 0.0) -> None:
+        self.bookmarks_24h = bookmarks_24h
+        self.bookmarks_7d = bookmarks_7d
+        self.ratings_24h = ratings_24h
+        self.ratings_7d = ratings_7d
+        self.score = score
+
+
+class TrendStore:
+    """
+    place_trend 스냅샷을 메모리에 두고 place별 O(1) 조회.
+    트렌드 판정: 최근 24시간 북마크가 min_24h 이상이고, 그 전 6일 일평균의 ratio배 이상
+    """
+    def __init__(self, *, min_24h: int = 3, ratio: float = 2.0) -> None:
+        self.min_24h = min_24h
+        self.ratio = ratio
+        self._counts: Dict[str, TrendCounts] = {}
+        self.loaded_at: Optional[float] = None
+
+    def replace(self, rows: Iterable[Any]) -> None:
+        """place_trend 전체 행으로 교체 (부분 갱신 중간 상태가 보이지 않도록 새 dict로 바꿔 끼운다)"""
+        self._counts = {
+            str(r["place_id"]): TrendCounts(
+                int(r["bookmarks_24h"]), int(r["bookmarks_7d"]),
+                int(r["ratings_24h"]), int(r["ratings_7d"]), float(r["score"]),
+            )
+            for r in rows
+        }
+        self.loaded_at = time.time()
+
+    def get(self, place_id: Any) -> Optional[TrendCounts]:
+        return self._counts.get(str(place_id)) if place_id is not None else None
+
+    def is_trending(self, place_id: Any) -> bool:
+        c = self.get(place_id)
+        if c is None or c.bookmarks_24h < self.min_24h:
+            return False
+        prior_daily = max(0, c.bookmarks_7d - c.bookmarks_24h) / 6.0
+        return c.bookmarks_24h >= self.ratio * prior_daily
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"places": len(self._counts), "loaded_at": self.loaded_at}
+
+
+_store: Optional[TrendStore] = None
+
+
+def get_trend_store() -> TrendStore:
+    """
+    프로세스 공유 인스턴스 (첫 호출 시 환경변수로 생성)
+    - TREND_MIN_24H: 기본 3
+    - TREND_RATIO: 기본 2.0
+    """
+    global _store
+    if _store is None:
+        _store = TrendStore(
+            min_24h=int(os.getenv("TREND_MIN_24H", "3")),
+            ratio=float(os.getenv("TREND_RATIO", "2.0")),
+        )
+    return _store
+
+
+class TrendRefresher:
+    """
+    주기 작업: place_trend 롤링 합계 갱신 → 메모리 스토어 교체.
+    오래된 시간 버킷 정리는 prune_interval마다 한 번.
+    repo: locations.repository.trend_async.AsyncTrendRepository 호환 객체
+    """
+    def __init__(self, repo: Any, store: Optional[TrendStore] = None, *, prune_interval: float = 3600.0) -> None:
+        self.repo = repo
+        self.store = store if store is not None else get_trend_store()
+        self.prune_interval = prune_interval
+        self._pruned_at: Optional[float] = None
+
+    async def refresh(self) -> None:
+        await self.repo.refresh()
+        if self._pruned_at is None or time.monotonic() - self._pruned_at >= self.prune_interval:
+            await self.repo.prune()
+            self._pruned_at = time.monotonic()
+        self.store.replace(await self.repo.load_all())
+
+
+_task: Optional[PeriodicTask] = None
+
+
+def start_trend_refresh(repo: Any) -> Optional[PeriodicTask]:
+    """
+    lifespan에서 호출.
+    - TREND_ENABLED: 기본 1
+    - TREND_REFRESH_INTERVAL: 초, 기본 300
+    """
+    global _task
+    if os.getenv("TREND_ENABLED", "1").lower() in ("0", "false", "no"):
+        return None
+    refresher = TrendRefresher(repo)
+    _task = PeriodicTask("place-trend", float(os.getenv("TREND_REFRESH_INTERVAL", "300")), refresher.refresh)
+    _task.start()
+    return _task
+
+
+async def stop_trend_refresh() -> None:
+    global _task
+    if _task is not None:
+        task, _task = _task, None
+        await task.stop()
+
+
+async def trending_near(repo: Any, latitude: float, longitude: float, radius_m: float, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    반경 안 트렌드 place를 점수순으로. 박스 모서리(반경 밖) 항목을 걸러내고도 limit개가 차도록
+    (score, place_id) 키셋으로 박스 안을 이어 읽는다.
+    각 항목에 distance(m, 정수) 포함.
+    """
+    min_lat, min_lon, max_lat, max_lon = bbox(latitude, longitude, radius_m)
+    batch = limit * 2
+    out: List[Dict[str, Any]] = []
+    after = None
+    while len(out) < limit:
+        rows = await repo.trending_in_bbox(
+            min_lat=min_lat, max_lat=max_lat, min_lon=min_lon, max_lon=max_lon, limit=batch, after=after,
+        )
+        keep, dists = within_radius(
+            latitude, longitude, [r["latitude"] for r in rows], [r["longitude"] for r in rows], radius_m
+        )
+        out.extend(dict(rows[i], distance=d) for i, d in zip(keep.tolist(), dists.tolist()))
+        if len(rows) < batch:
+            break
+        after = (rows[-1]["score"], rows[-1]["place_id"])
+    return out[:limit]
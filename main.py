@@ -1,4 +1,5 @@
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.security import HTTPBearer
 from dotenv import load_dotenv
@@ -12,15 +13,55 @@ from locations.controller.locations import router as locations
 from locations.controller.place_bookmark import router as place_bookmark
 from locations.controller.rating import router as rating
 from locations.controller.place import router as place
-from locations.repository import apply_rating_trigger_migration
+from migrations import run_migrations
+from locations.repository.place_async import AsyncPlaceRepository
+from locations.service.aggregates import start_aggregate_verifier, stop_aggregate_verifier
+from util.db_pool import close_pool
+from util.async_db_pool import close_async_pool
+from tourapi.dependency import init_tourapi_client, close_tourapi_client
+from kakao.dependency import init_kakao_client, close_kakao_client
+from catalog.repository.tour_item_async import AsyncTourItemRepository
+from catalog.service.spatial import start_spatial_index, stop_spatial_index
+from locations.repository.trend_async import AsyncTrendRepository
+from locations.service.trend import start_trend_refresh, stop_trend_refresh
 from mypage.controller.mypage import router as mypage
 from board.controller.document import router as document
 from board.controller.like import router as actions
+from board.service.like import start_like_reconcile, stop_like_reconcile
 from plan.controller.plan import router as plan_ai_router
 # Initialize JWT configuration on startup (like Spring @Configuration)
 from util.jwt_config import jwt_config
 print(f"🚀 Application starting with JWT configuration...")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스키마 마이그레이션 (배포 파이프라인에서 `python -m migrations`로 따로 돌리면 MIGRATE_ON_STARTUP=0)
+    # 실패하면 반쯤 적용된 스키마로 트래픽을 받지 않도록 예외를 그대로 올려 기동을 중단한다
+    if os.getenv("MIGRATE_ON_STARTUP", "1").lower() not in ("0", "false", "no"):
+        run_migrations()
+    try:
+        init_tourapi_client()
+    except ValueError as e:
+        print(f"TourAPI client not initialized: {e}")
+    init_kakao_client()
+    # 카탈로그 미러 공간 인덱스는 백그라운드로 적재 (완료 전에는 DB 조회로 대체)
+    start_spatial_index(AsyncTourItemRepository())
+    # place 트렌드 롤링 합계 주기 갱신 (첫 적재 전에는 모두 trend=False)
+    start_trend_refresh(AsyncTrendRepository())
+    # 게시글 좋아요 수는 증감으로 유지하고, 드리프트는 주기적으로 보정
+    start_like_reconcile()
+    # place 평점/북마크 집계는 델타로 유지하고, 원본과의 드리프트는 주기적으로 보정
+    start_aggregate_verifier(AsyncPlaceRepository())
+    yield
+    await stop_aggregate_verifier()
+    await stop_like_reconcile()
+    await stop_trend_refresh()
+    await stop_spatial_index()
+    await close_kakao_client()
+    await close_tourapi_client()
+    await close_async_pool()
+    close_pool()
+
 # Swagger UI에서 Authorization 헤더를 테스트할 수 있도록 보안 스키마 설정
 app = FastAPI(
     title="Nomadly API",
@@ -29,6 +70,7 @@ app = FastAPI(
     swagger_ui_parameters={
         "persistAuthorization": True,  # 새로고침 후에도 토큰 유지
     },
+    lifespan=lifespan,
 )
 
 # Bearer 토큰 보안 스키마를 OpenAPI 스펙에 추가
@@ -58,14 +100,6 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
-@app.on_event("startup")
-def _apply_db_triggers():
-    try:
-        apply_rating_trigger_migration()
-    except Exception as e:
-        # 필요 시 로깅
-        print(f"DB trigger migration skipped: {e}")
-
 origins = [
     "https://nomadly.bitworkspace.kr"
 ]
@@ -0,0 +1,123 @@
+# migrations/__init__.py
+"""
+버전 관리되는 스키마 마이그레이션.
+
+- migrations/versions/mNNNN_<이름>.py 파일마다 upgrade(cur) 하나 (NNNN이 버전, 오름차순 적용)
+- 적용 이력은 schema_migrations 테이블에 기록하고, 이미 적용된 버전은 건너뛴다
+- 버전마다 별도 트랜잭션. 실패하면 그 버전만 롤백되고 이후 버전은 실행하지 않는다
+- 여러 프로세스가 동시에 실행해도 버전마다 트랜잭션 advisory lock으로 한 번만 적용된다
+
+실행: python -m migrations (CLI) 또는 lifespan의 run_migrations() (MIGRATE_ON_STARTUP)
+"""
+from __future__ import annotations
+import importlib
+import os
+import pkgutil
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+_VERSION_RE = re.compile(r"^m(\d{4})_(\w+)$")
+
+# pg_advisory_lock 키 (임의의 고정 값)
+_LOCK_KEY = 7_316_404_221
+
+SCHEMA_MIGRATIONS_SQL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INT PRIMARY KEY,
+    name VARCHAR(200) NOT NULL,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+"""
+
+
+class Migration:
+    def __init__(self, version: int, name: str, upgrade: Callable[[Any], None]) -> None:
+        self.version = version
+        self.name = name
+        self.upgrade = upgrade
+
+    def __repr__(self) -> str:
+        return f"Migration({self.version:04d}_{self.name})"
+
+
+def discover() -> List[Migration]:
+    """migrations.versions 아래 모듈을 버전 순으로 (모듈 import만 하고 DB에는 접속하지 않는다)"""
+    from migrations import versions
+
+    found: Dict[int, Migration] = {}
+    for info in pkgutil.iter_modules(versions.__path__):
+        m = _VERSION_RE.match(info.name)
+        if not m:
+            continue
+        version = int(m.group(1))
+        if version in found:
+            raise RuntimeError(f"중복된 마이그레이션 버전: {version:04d}")
+        module = importlib.import_module(f"{versions.__name__}.{info.name}")
+        found[version] = Migration(version, m.group(2), module.upgrade)
+    return [found[v] for v in sorted(found)]
+
+
+def _applied(cur) -> Dict[int, Any]:
+    cur.execute("SELECT version, applied_at FROM schema_migrations;")
+    return {int(v): at for v, at in cur.fetchall()}
+
+
+def _lock(cur, lock_timeout_ms: int) -> None:
+    """현재 트랜잭션 안에서 마이그레이션 락 획득 (커밋/롤백 시 자동 해제). lock_timeout 초과 시 예외"""
+    cur.execute("SELECT set_config('lock_timeout', %s, true);", (f"{lock_timeout_ms}ms",))
+    cur.execute("SELECT pg_advisory_xact_lock(%s);", (_LOCK_KEY,))
+
+
+def run_migrations(target: Optional[int] = None, *, migrations: Optional[List[Migration]] = None) -> List[Migration]:
+    """
+    미적용 마이그레이션을 target 버전까지(없으면 전부) 적용하고 적용한 목록을 반환.
+    - MIGRATION_LOCK_TIMEOUT: 락 대기 초, 기본 60 (넘으면 예외)
+    기본 DSN은 pgbouncer transaction 모드라 세션 락은 커밋마다 다른 백엔드로 흩어질 수 있다.
+    그래서 버전마다 그 트랜잭션 안에서 xact 락을 잡고, 락을 잡은 뒤 적용 여부를 다시 확인한다.
+    """
+    from user.repository import db_cursor
+
+    pending_all = migrations if migrations is not None else discover()
+    lock_timeout_ms = int(float(os.getenv("MIGRATION_LOCK_TIMEOUT", "60")) * 1000)
+    applied_now: List[Migration] = []
+    with db_cursor() as (con, cur):
+        _lock(cur, lock_timeout_ms)
+        cur.execute(SCHEMA_MIGRATIONS_SQL)
+        con.commit()
+        done = _applied(cur)
+        con.commit()
+        for m in pending_all:
+            if m.version in done or (target is not None and m.version > target):
+                continue
+            try:
+                _lock(cur, lock_timeout_ms)
+                # 락을 기다리는 동안 다른 프로세스가 적용했을 수 있다
+                if m.version in _applied(cur):
+                    con.commit()
+                    continue
+                m.upgrade(cur)
+                cur.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s);",
+                    (m.version, m.name),
+                )
+                con.commit()
+            except Exception:
+                con.rollback()
+                raise
+            applied_now.append(m)
+            print(f"[migrations] applied {m.version:04d}_{m.name}")
+    return applied_now
+
+
+def migration_status(*, migrations: Optional[List[Migration]] = None) -> List[Dict[str, Any]]:
+    """버전별 적용 여부/시각"""
+    from user.repository import db_cursor
+
+    known = migrations if migrations is not None else discover()
+    with db_cursor() as (con, cur):
+        cur.execute("SELECT to_regclass('schema_migrations') IS NOT NULL;")
+        done = _applied(cur) if cur.fetchone()[0] else {}
+    return [
+        {"version": m.version, "name": m.name, "applied": m.version in done, "applied_at": done.get(m.version)}
+        for m in known
+    ]
@@ -0,0 +1,36 @@
+"""
+스키마 마이그레이션 CLI.
+
+    python -m migrations                 # 미적용 마이그레이션 모두 적용 (= up)
+    python -m migrations up --target 3   # 0003까지만 적용
+    python -m migrations status          # 버전별 적용 여부(JSON)
+"""
+from __future__ import annotations
+import argparse
+import json
+
+from dotenv import load_dotenv
+
+
+def main() -> None:
+    load_dotenv()
+    parser = argparse.ArgumentParser(prog="python -m migrations", description="스키마 마이그레이션")
+    parser.add_argument("command", nargs="?", default="up", choices=["up", "status"])
+    parser.add_argument("--target", type=int, default=None, help="이 버전까지만 적용")
+    args = parser.parse_args()
+
+    from migrations import migration_status, run_migrations
+    from util.db_pool import close_pool
+
+    try:
+        if args.command == "up":
+            applied = run_migrations(args.target)
+            print(json.dumps({"applied": [f"{m.version:04d}_{m.name}" for m in applied]}, ensure_ascii=False))
+        else:
+            print(json.dumps(migration_status(), ensure_ascii=False, default=str, indent=2))
+    finally:
+        close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+기존 리포지토리 패키지들이 import 시점에 만들던 기본 테이블.
+이미 운영 중인 DB에는 모두 있으므로 IF NOT EXISTS로 그대로 통과한다.
+- board.plan_id: 게시글 조회가 읽는 컬럼이지만 기존 생성문에 빠져 있어 추가
+- like.board_id: board.id(UUID)를 참조하므로 UUID (기존 INT 정의로는 FK 생성이 실패)
+"""
+
+SQL = """
+CREATE TABLE IF NOT EXISTS "user" (
+    id UUID PRIMARY KEY,
+    username TEXT UNIQUE NOT NULL,
+    profile TEXT NOT NULL,
+    password TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS interest (
+    id SERIAL PRIMARY KEY,
+    user_id UUID NOT NULL,
+    interest TEXT NOT NULL,
+    FOREIGN KEY (user_id) REFERENCES "user"(id)
+);
+
+CREATE TABLE IF NOT EXISTS public.plan (
+    id UUID PRIMARY KEY,
+    start_date TIMESTAMP,
+    end_date TIMESTAMP,
+    private boolean default true,
+    author UUID REFERENCES "user"(id) ON DELETE SET NULL
+);
+
+CREATE TABLE IF NOT EXISTS public.plan_item (
+    id UUID PRIMARY KEY,
+    plan_id UUID REFERENCES plan(id) ON DELETE CASCADE,
+    todo VARCHAR(100) NOT NULL,
+    place VARCHAR(100),
+    time TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS board (
+    id UUID PRIMARY KEY,
+    author UUID NOT NULL,
+    likes INT DEFAULT 0,
+    title TEXT NOT NULL,
+    content TEXT,
+    plan_id UUID,
+    FOREIGN KEY (author) REFERENCES "user"(id)
+);
+ALTER TABLE board ADD COLUMN IF NOT EXISTS plan_id UUID;
+
+CREATE TABLE IF NOT EXISTS "like" (
+    id UUID PRIMARY KEY,
+    user_id UUID NOT NULL,
+    board_id UUID NOT NULL,
+    liked_at TIMESTAMPTZ DEFAULT now(),
+    FOREIGN KEY (user_id) REFERENCES "user"(id) ON DELETE CASCADE,
+    FOREIGN KEY (board_id) REFERENCES board(id) ON DELETE CASCADE,
+    UNIQUE (user_id, board_id)
+);
+
+CREATE TABLE IF NOT EXISTS place (
+    place_id UUID PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    address VARCHAR(255),
+    overall_rating DECIMAL(2,1) DEFAULT 0,
+    overall_bookmark BIGINT DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS place_bookmark (
+    bookmark_id UUID PRIMARY KEY,
+    user_id UUID NOT NULL,
+    place_id UUID NOT NULL,
+    UNIQUE(user_id, place_id),
+    FOREIGN KEY(user_id) REFERENCES "user"(id),
+    FOREIGN KEY(place_id) REFERENCES place(place_id)
+);
+
+CREATE TABLE IF NOT EXISTS rating (
+    rating_id UUID PRIMARY KEY,
+    user_id UUID NOT NULL,
+    place_id UUID NOT NULL,
+    score INT CHECK(score >= 1 AND score <= 5),
+    UNIQUE(user_id, place_id),
+    FOREIGN KEY(user_id) REFERENCES "user"(id),
+    FOREIGN KEY(place_id) REFERENCES place(place_id)
+);
+"""
+
+
+def upgrade(cur) -> None:
+    cur.execute(SQL)
@@ -0,0 +1,29 @@
+"""
+place에 외부 조회 결과(좌표/이미지/TourAPI contentid) 컬럼과 정규화된 (이름, 주소) 유니크 인덱스 추가.
+기존 중복 데이터로 유니크 인덱스 생성이 실패하면 인덱스만 건너뛴다 (일괄 upsert는 재조회로 대체 동작).
+"""
+
+COLUMNS_SQL = """
+ALTER TABLE place
+    ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS image_url TEXT,
+    ADD COLUMN IF NOT EXISTS content_id VARCHAR(20),
+    ADD COLUMN IF NOT EXISTS fetched_at TIMESTAMPTZ;
+"""
+
+UNIQUE_INDEX_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS ux_place_name_address
+ON place (LOWER(TRIM(name)), LOWER(TRIM(COALESCE(address, ''))));
+"""
+
+
+def upgrade(cur) -> None:
+    cur.execute(COLUMNS_SQL)
+    cur.execute("SAVEPOINT place_unique_index;")
+    try:
+        cur.execute(UNIQUE_INDEX_SQL)
+    except Exception as e:
+        cur.execute("ROLLBACK TO SAVEPOINT place_unique_index;")
+        print(f"⚠️ ux_place_name_address skipped: {e}")
+    cur.execute("RELEASE SAVEPOINT place_unique_index;")
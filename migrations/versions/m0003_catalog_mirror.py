@@ -0,0 +1,55 @@
+"""
+TourAPI areaBasedList2 / areaBasedSyncList2 항목의 로컬 미러(tour_item)와
+동기화 워터마크(modifiedtime) + 진행/지연 지표(catalog_sync_state).
+"""
+
+SQL = """
+CREATE TABLE IF NOT EXISTS tour_item (
+    content_id VARCHAR(20) PRIMARY KEY,
+    content_type_id INT NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    addr1 VARCHAR(255),
+    addr2 VARCHAR(255),
+    zipcode VARCHAR(10),
+    tel VARCHAR(255),
+    area_code INT,
+    sigungu_code INT,
+    cat1 VARCHAR(10),
+    cat2 VARCHAR(10),
+    cat3 VARCHAR(20),
+    lcls1 VARCHAR(10),
+    lcls2 VARCHAR(10),
+    lcls3 VARCHAR(20),
+    l_dong_regn_cd INT,
+    l_dong_signgu_cd INT,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    first_image TEXT,
+    first_image2 TEXT,
+    created_time VARCHAR(14),
+    modified_time VARCHAR(14),
+    synced_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS ix_tour_item_lat_lon ON tour_item (latitude, longitude);
+CREATE INDEX IF NOT EXISTS ix_tour_item_type ON tour_item (content_type_id);
+
+CREATE TABLE IF NOT EXISTS catalog_sync_state (
+    name VARCHAR(50) PRIMARY KEY,
+    watermark VARCHAR(14),
+    last_full_at TIMESTAMPTZ,
+    last_incremental_at TIMESTAMPTZ,
+    run_mode VARCHAR(20),
+    run_status VARCHAR(20),
+    run_started_at TIMESTAMPTZ,
+    run_finished_at TIMESTAMPTZ,
+    run_error TEXT,
+    pages_done INT DEFAULT 0,
+    pages_total INT DEFAULT 0,
+    items_upserted BIGINT DEFAULT 0,
+    items_deleted BIGINT DEFAULT 0
+);
+"""
+
+
+def upgrade(cur) -> None:
+    cur.execute(SQL)
@@ -0,0 +1,13 @@
+"""
+북마크 생성 시각. 기존 행은 NULL로 두어 한꺼번에 "최근"으로 잡히지 않게 한다.
+"""
+
+SQL = """
+ALTER TABLE place_bookmark ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ;
+ALTER TABLE place_bookmark ALTER COLUMN created_at SET DEFAULT now();
+CREATE INDEX IF NOT EXISTS ix_place_bookmark_place_created ON place_bookmark (place_id, created_at);
+"""
+
+
+def upgrade(cur) -> None:
+    cur.execute(SQL)
@@ -0,0 +1,30 @@
+"""
+트렌드: place별 시간 단위 활동 카운터(북마크 추가 +1 / 해제 -1, 평점 등록 건수)와
+최근 7일 안에 활동이 있는 place의 24시간/7일 롤링 합계.
+"""
+
+SQL = """
+CREATE TABLE IF NOT EXISTS place_activity_hourly (
+    place_id UUID NOT NULL,
+    bucket TIMESTAMPTZ NOT NULL,
+    bookmarks INT NOT NULL DEFAULT 0,
+    ratings INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (place_id, bucket)
+);
+CREATE INDEX IF NOT EXISTS ix_place_activity_hourly_bucket ON place_activity_hourly (bucket);
+
+CREATE TABLE IF NOT EXISTS place_trend (
+    place_id UUID PRIMARY KEY,
+    bookmarks_24h INT NOT NULL DEFAULT 0,
+    bookmarks_7d INT NOT NULL DEFAULT 0,
+    ratings_24h INT NOT NULL DEFAULT 0,
+    ratings_7d INT NOT NULL DEFAULT 0,
+    score DOUBLE PRECISION NOT NULL DEFAULT 0,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS ix_place_trend_score ON place_trend (score DESC);
+"""
+
+
+def upgrade(cur) -> None:
+    cur.execute(SQL)
@@ -0,0 +1,23 @@
+"""
+평점 집계를 행 단위 AVG 트리거에서 누적 합/개수(rating_sum, rating_count) 델타로 전환.
+평균은 읽을 때 계산하고 overall_rating 컬럼은 더 이상 쓰지 않는다.
+기존 값은 여기서 한 번 채우고, 이후 드리프트는 집계 검증 작업이 보정한다.
+"""
+
+SQL = """
+DROP TRIGGER IF EXISTS trg_rating_refresh_place ON rating;
+DROP FUNCTION IF EXISTS refresh_place_overall_rating();
+
+ALTER TABLE place
+    ADD COLUMN IF NOT EXISTS rating_sum BIGINT NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS rating_count BIGINT NOT NULL DEFAULT 0;
+
+UPDATE place p
+SET rating_sum = r.s, rating_count = r.n
+FROM (SELECT place_id, SUM(score) AS s, COUNT(*) AS n FROM rating GROUP BY place_id) r
+WHERE p.place_id = r.place_id;
+"""
+
+
+def upgrade(cur) -> None:
+    cur.execute(SQL)
@@ -0,0 +1,26 @@
+"""
+리포지토리 조회가 타는 보조 인덱스.
+- place: get_place_by_name / get_place_by_address의 LOWER(TRIM(..)) 비교용 함수 인덱스
+  (이름은 ux_place_name_address가 같은 식으로 시작하므로, 그 인덱스가 없을 때만 따로 만든다)
+- FK 조회: plan_item.plan_id, plan.author, "like".board_id, interest.user_id, rating.place_id
+- place_bookmark.user_id는 UNIQUE(user_id, place_id)가 이미 앞 컬럼으로 덮는다
+마이그레이션은 트랜잭션 안에서 돌기 때문에 CONCURRENTLY 없이 만든다.
+"""
+
+SQL = """
+CREATE INDEX IF NOT EXISTS ix_place_lower_address ON place (LOWER(TRIM(address)));
+CREATE INDEX IF NOT EXISTS ix_plan_item_plan_id ON plan_item (plan_id);
+CREATE INDEX IF NOT EXISTS ix_plan_author ON plan (author);
+CREATE INDEX IF NOT EXISTS ix_like_board_id ON "like" (board_id);
+CREATE INDEX IF NOT EXISTS ix_interest_user_id ON interest (user_id);
+CREATE INDEX IF NOT EXISTS ix_rating_place_id ON rating (place_id);
+"""
+
+NAME_INDEX_SQL = "CREATE INDEX IF NOT EXISTS ix_place_lower_name ON place (LOWER(TRIM(name)));"
+
+
+def upgrade(cur) -> None:
+    cur.execute(SQL)
+    cur.execute("SELECT to_regclass('ux_place_name_address') IS NULL;")
+    if cur.fetchone()[0]:
+        cur.execute(NAME_INDEX_SQL)
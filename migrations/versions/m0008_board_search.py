@@ -0,0 +1,29 @@
+"""
+게시글 검색: 제목/본문을 글자 2-gram 토큰으로 쪼갠 tsvector와 GIN 인덱스.
+- 한국어는 형태소 사전 없이도 2-gram이면 "서울", "맛집" 같은 두 글자 단어까지 잡힌다 (pg_trgm은 3글자 미만 검색어에 인덱스를 못 쓴다)
+- 제목은 가중치 A, 본문은 B로 넣어 ts_rank가 제목 일치를 더 높게 친다
+- 검색어도 같은 함수로 쪼갠다 (m0010 board_tsquery())
+"""
+
+FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION board_bigrams(src TEXT) RETURNS TEXT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT COALESCE(string_agg(CASE WHEN char_length(w) = 1 THEN w ELSE substr(w, i, 2) END, ' '), '')
+    FROM regexp_split_to_table(lower(COALESCE(src, '')), '[^[:alnum:]가-힣]+') AS w
+    CROSS JOIN LATERAL generate_series(1, GREATEST(char_length(w) - 1, 1)) AS i
+    WHERE w <> ''
+$$;
+"""
+
+COLUMN_SQL = """
+ALTER TABLE board ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', board_bigrams(title)), 'A')
+    || setweight(to_tsvector('simple', board_bigrams(content)), 'B')
+) STORED;
+CREATE INDEX IF NOT EXISTS ix_board_search_vector ON board USING gin (search_vector);
+"""
+
+
+def upgrade(cur) -> None:
+    cur.execute(FUNCTION_SQL)
+    cur.execute(COLUMN_SQL)
@@ -0,0 +1,29 @@
+"""
+목록 키셋 페이지네이션용 정렬 키와 인덱스 (최신순, 동점은 id).
+- board / plan: created_at 추가 (기존 행은 적용 시각, 순서는 id로 구분)
+- place_bookmark.created_at / "like".liked_at: 기존 NULL은 1970-01-01로 채우고 NOT NULL
+  (북마크는 m0004처럼 "최근"으로 잡히지 않도록 과거 값)
+- 인덱스는 오름차순으로 두고 역방향 스캔으로 최신순을 읽는다
+- ix_plan_author는 (author, created_at, id)가 대신한다
+"""
+
+SQL = """
+ALTER TABLE board ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT now();
+CREATE INDEX IF NOT EXISTS ix_board_created ON board (created_at, id);
+
+ALTER TABLE plan ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT now();
+CREATE INDEX IF NOT EXISTS ix_plan_author_created ON plan (author, created_at, id);
+DROP INDEX IF EXISTS ix_plan_author;
+
+UPDATE place_bookmark SET created_at = to_timestamp(0) WHERE created_at IS NULL;
+ALTER TABLE place_bookmark ALTER COLUMN created_at SET NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_place_bookmark_user_created ON place_bookmark (user_id, created_at, bookmark_id);
+
+UPDATE "like" SET liked_at = to_timestamp(0) WHERE liked_at IS NULL;
+ALTER TABLE "like" ALTER COLUMN liked_at SET NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_like_user_liked ON "like" (user_id, liked_at, id);
+"""
+
+
+def upgrade(cur) -> None:
+    cur.execute(SQL)
@@ -0,0 +1,24 @@
+"""
+게시글 검색어 → tsquery를 DB에서 만든다.
+- 저장된 search_vector와 같은 board_bigrams()로 쪼개므로, 구분자 규칙(자모, 다른 문자권 글자 등)이 어긋날 수 없다
+- 2-gram은 AND, 한 글자 토큰은 입력 중인 단어의 앞부분일 수 있어 접두 일치(:*)
+- 토큰이 없으면(공백/기호뿐) NULL → 어떤 행과도 일치하지 않는다
+"""
+
+SQL = """
+CREATE OR REPLACE FUNCTION board_tsquery(src TEXT) RETURNS tsquery
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT to_tsquery('simple', string_agg(
+        quote_literal(t) || CASE WHEN char_length(t) = 1 THEN ':*' ELSE '' END, ' & ' ORDER BY n))
+    FROM (
+        SELECT t, min(n) AS n
+        FROM regexp_split_to_table(board_bigrams(src), ' ') WITH ORDINALITY AS s(t, n)
+        WHERE t <> ''
+        GROUP BY t
+    ) terms
+$$;
+"""
+
+
+def upgrade(cur) -> None:
+    cur.execute(SQL)
@@ -1,28 +1,48 @@
 import uuid
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 
-from mypage.model.mypage import PlanDetailResponse, MyPlansResponse
+from mypage.model.mypage import PlanDetailResponse, MyPlansResponse, MyPlansListResponse, \
+    MyBookmarkListResponse, MyLikeBoardListResponse
 from mypage.service import mypage as service
 from user.controller.user import get_current_user_id
+from util.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor
 
 router = APIRouter(prefix="/api/me")
 
-@router.get("/plans", response_model=List[MyPlansResponse])
+LimitQuery = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="한 번에 받을 항목 수")
+CursorQuery = Query(None, description="이전 응답의 next_cursor (첫 페이지는 생략)")
+
+@router.get("/plans", response_model=MyPlansListResponse)
 def get_plans(
+        limit: int = LimitQuery,
+        cursor: Optional[str] = CursorQuery,
         user_id: uuid.UUID = Depends(get_current_user_id)
     ):
-    return service.get_plans(user_id)
+    try:
+        return service.get_plans(user_id, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/bookmark/place")
+@router.get("/bookmark/place", response_model=MyBookmarkListResponse)
 def get_bookmark_place(
+        limit: int = LimitQuery,
+        cursor: Optional[str] = CursorQuery,
         user_id: uuid.UUID = Depends(get_current_user_id)
     ):
-    return service.get_bookmark_place(user_id)
+    try:
+        return service.get_bookmark_place(user_id, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/like/board")
+@router.get("/like/board", response_model=MyLikeBoardListResponse)
 def get_like_boards(
+        limit: int = LimitQuery,
+        cursor: Optional[str] = CursorQuery,
         user_id: uuid.UUID = Depends(get_current_user_id)
     ):
-    return service.get_like_boards(user_id)
\ No newline at end of file
+    try:
+        return service.get_like_boards(user_id, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
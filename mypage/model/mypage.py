@@ -1,7 +1,7 @@
 import uuid
-from typing import List
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 class PlanDetailResponse(BaseModel):
     todo: str
@@ -25,4 +25,16 @@ class MyLikeBoardResponse(BaseModel):
     board_id: uuid.UUID
     title: str
     content: str
-    likes: int
\ No newline at end of file
+    likes: int
+
+class MyPlansListResponse(BaseModel):
+    plans: List[MyPlansResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
+
+class MyBookmarkListResponse(BaseModel):
+    plans: List[MyBookmarkResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
+
+class MyLikeBoardListResponse(BaseModel):
+    boards: List[MyLikeBoardResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
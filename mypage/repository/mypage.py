@@ -1,56 +1,84 @@
 import uuid
+from datetime import datetime
+from typing import Optional, Tuple
 
-from user.repository import get_connection
+from user.repository import db_cursor
+from locations.repository.place import overall_rating_sql
 
-def get_plans(user_id: uuid.UUID):
-    con, cur = get_connection()
-    try:
+# 모든 목록은 최신순 키셋 페이지네이션: after=(정렬 시각, id)이면 그 다음부터 limit개
+After = Optional[Tuple[datetime, uuid.UUID]]
+
+
+def _after_params(after: After):
+    after_at, after_id = after if after else (None, None)
+    return after_at, after_at, after_id and str(after_id)
+
+
+def get_plans(user_id: uuid.UUID, *, limit: int, after: After = None):
+    """
+    일정이 하나 이상 있는 plan을 created_at, id 내림차순으로 limit개 고른 뒤 항목과 조인
+    반환 행: (plan_id, start_date, end_date, todo, place, time, created_at)
+    """
+    with db_cursor() as (con, cur):
         cur.execute(
             """
-            select 
+            select
                 p.id, p.start_date, p.end_date,
-                i.todo, i.place, i."time"
-            from plan p join plan_item i
+                i.todo, i.place, i."time", p.created_at
+            from (
+                select id, start_date, end_date, created_at
+                from plan
+                where author = %s
+                  and exists (select 1 from plan_item where plan_id = plan.id)
+                  and (%s::timestamptz is null or (created_at, id) < (%s::timestamptz, %s::uuid))
+                order by created_at desc, id desc
+                limit %s
+            ) p join plan_item i
             on p.id = i.plan_id
-            where p.author = %s;
-            """, (str(user_id),)
+            order by p.created_at desc, p.id desc, i."time";
+            """, (str(user_id), *_after_params(after), limit)
         )
         return cur.fetchall()
-    finally:
-        cur.close()
-        con.close()
 
-def get_bookmark_place(user_id: uuid.UUID):
-    con, cur = get_connection()
-    try:
+def get_bookmark_place(user_id: uuid.UUID, *, limit: int, after: After = None):
+    """
+    북마크한 시각 내림차순
+    반환 행: (place_id, name, address, overall_bookmark, overall_rating, created_at, bookmark_id)
+    """
+    with db_cursor() as (con, cur):
         cur.execute(
-            """
-            select 
+            f"""
+            select
                 p.place_id, p."name", p.address,
-                p.overall_bookmark, p.overall_rating
-            from place p join place_bookmark b
+                p.overall_bookmark, {overall_rating_sql("p")} as overall_rating,
+                b.created_at, b.bookmark_id
+            from place_bookmark b join place p
             on p.place_id = b.place_id
-            where b.user_id = %s;
-            """, (str(user_id),)
+            where b.user_id = %s
+              and (%s::timestamptz is null or (b.created_at, b.bookmark_id) < (%s::timestamptz, %s::uuid))
+            order by b.created_at desc, b.bookmark_id desc
+            limit %s;
+            """, (str(user_id), *_after_params(after), limit)
         )
         return cur.fetchall()
-    finally:
-        cur.close()
-        con.close()
 
 
-def get_like_boards(user_id: uuid.UUID):
-    con, cur = get_connection()
-    try:
+def get_like_boards(user_id: uuid.UUID, *, limit: int, after: After = None):
+    """
+    좋아요한 시각 내림차순
+    반환 행: (board_id, title, content, likes, liked_at, like_id)
+    """
+    with db_cursor() as (con, cur):
         cur.execute(
             """
-            select 
-                b.plan_id, b.title, b.content, b.likes
-            from board b join "like" l
-            on b.id = l.board_id and l.user_id = %s;
-            """, (str(user_id),)
+            select
+                b.id, b.title, b.content, b.likes, l.liked_at, l.id
+            from "like" l join board b
+            on b.id = l.board_id
+            where l.user_id = %s
+              and (%s::timestamptz is null or (l.liked_at, l.id) < (%s::timestamptz, %s::uuid))
+            order by l.liked_at desc, l.id desc
+            limit %s;
+            """, (str(user_id), *_after_params(after), limit)
         )
         return cur.fetchall()
-    finally:
-        cur.close()
-        con.close()
\ No newline at end of file
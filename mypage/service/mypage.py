@@ -1,48 +1,67 @@
 import uuid
+from datetime import datetime
+from typing import Optional
 
 from mypage.model.mypage import PlanDetailResponse, MyBookmarkResponse, \
     MyLikeBoardResponse, MyPlansResponse
 from mypage.repository import mypage as repository
+from util.pagination import DEFAULT_PAGE_SIZE, decode_cursor, page_size, paginate
 
+# 목록 cursor는 모두 (정렬 시각, id). 잘못된 cursor는 InvalidCursor
 
-def get_plans(user_id: uuid.UUID):
-    rows = repository.get_plans(user_id)
-    print(rows)
 
-    result = []
+def _after(cursor: Optional[str]):
+    return decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+
+
+def get_plans(user_id: uuid.UUID, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None):
+    limit = page_size(limit)
+    # 한 개 더 읽어 다음 페이지 유무를 판단 (plan 단위, 행은 plan_item 단위)
+    rows = repository.get_plans(user_id, limit=limit + 1, after=_after(cursor))
+
+    # plan_id → (created_at, 응답), 조회 순서 유지
+    plans = {}
     for row in rows:
-        if uuid.UUID(row[0]) not in result:
-            result.append(MyPlansResponse(
-                plan_id=uuid.UUID(row[0]),
+        plan_id = uuid.UUID(row[0])
+        if plan_id not in plans:
+            plans[plan_id] = (row[6], MyPlansResponse(
+                plan_id=plan_id,
                 start_time=str(row[1]),
                 end_time=str(row[2]),
-                plan=[PlanDetailResponse(todo=row[3], place=row[4], time=str(row[5]))]
+                plan=[]
             ))
-        elif uuid.UUID(row[0]) in result:
-            temp = result.pop(result.index(uuid.UUID(row[0])))
-            temp["plan"].append(PlanDetailResponse(todo=row[3], place=row[4], time=str(row[5])))
+        plans[plan_id][1].plan.append(PlanDetailResponse(todo=row[3], place=row[4], time=str(row[5])))
 
-    return {"plans" : result}
+    page, next_cursor = paginate(list(plans.items()), limit, key=lambda item: (item[1][0], item[0]))
+    return {"plans": [plan for _, (_, plan) in page], "next_cursor": next_cursor}
 
 
-def get_bookmark_place(user_id: uuid.UUID):
-    rows = repository.get_bookmark_place(user_id)
+def get_bookmark_place(user_id: uuid.UUID, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None):
+    limit = page_size(limit)
+    rows = repository.get_bookmark_place(user_id, limit=limit + 1, after=_after(cursor))
+    page, next_cursor = paginate(rows, limit, key=lambda row: (row[5], row[6]))
     return {
         "plans" : [
                 MyBookmarkResponse(
                     place_id = uuid.UUID(row[0]), name = row[1], address = row[2]
                     , overall_bookmark = row[3], overall_rating = row[4]
                 )
-                for row in rows
-        ]
+                for row in page
+        ],
+        "next_cursor": next_cursor
     }
 
 
-def get_like_boards(user_id: uuid.UUID):
-    rows = repository.get_like_boards(user_id)
-    return [
-        MyLikeBoardResponse(
-            board_id = uuid.UUID(row[0]), title = row[1], content = row[2], likes = row[3]
-        )
-        for row in rows
-    ]
\ No newline at end of file
+def get_like_boards(user_id: uuid.UUID, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None):
+    limit = page_size(limit)
+    rows = repository.get_like_boards(user_id, limit=limit + 1, after=_after(cursor))
+    page, next_cursor = paginate(rows, limit, key=lambda row: (row[4], row[5]))
+    return {
+        "boards": [
+            MyLikeBoardResponse(
+                board_id = uuid.UUID(row[0]), title = row[1], content = row[2], likes = row[3]
+            )
+            for row in page
+        ],
+        "next_cursor": next_cursor
+    }
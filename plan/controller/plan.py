@@ -7,6 +7,8 @@ from plan.model.request.visibility import VisibilityUpdateRequest
 from plan.model.response.plan import AIPlanResponse
 from plan.model.response.visibility import VisibilityUpdateResponse
 from plan.service.plan import generate_ai_plan, update_plan_visibility
+from tourapi.client import TourAPIClient
+from tourapi.dependency import get_tourapi_client
 from uuid import UUID
 import os, jwt
 
@@ -18,6 +20,7 @@ async def ai_auto_complete(
     req: AIPlanRequest,
     Accept_Timezone: str | None = Header(default=None, alias="Accept-Timezone"),
     Authorization: str | None = Header(default=None),
+    tour: TourAPIClient = Depends(get_tourapi_client),
 ):
     """
     AI 일정 자동완성.
@@ -35,7 +38,7 @@ async def ai_auto_complete(
             except Exception:
                 owner_user_id = None
 
-        return await generate_ai_plan(req, Accept_Timezone, owner_user_id=owner_user_id)
+        return await generate_ai_plan(req, Accept_Timezone, owner_user_id=owner_user_id, tour_client=tour)
     except Exception as e:
         # 사용자에게 너무 내부적인 에러를 드러내지 않도록 메시지는 간결하게
         raise HTTPException(status_code=500, detail=f"failed to generate plan: {e}")
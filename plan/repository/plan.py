@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 from datetime import datetime
 
-from user.repository import get_connection
+from user.repository import db_cursor
 
 
 class PlanRepository:
@@ -21,20 +21,13 @@ class PlanRepository:
         - author: 소유 사용자 id (nullable)
         """
         plan_id = uuid4()
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(
                 "INSERT INTO plan (id, start_date, end_date, private, author) VALUES (%s, %s, %s, %s, %s);",
                 (str(plan_id), start_date, end_date, bool(private), str(author) if author else None),
             )
             con.commit()
             return plan_id
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            cur.close()
-            con.close()
 
     def bulk_insert_items(self, *, plan_id: UUID, items: List[Dict[str, Any]]) -> None:
         """
@@ -43,8 +36,7 @@ class PlanRepository:
         """
         if not items:
             return
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             params = []
             for it in items:
                 iid = str(uuid4())
@@ -57,18 +49,11 @@ class PlanRepository:
                 params,
             )
             con.commit()
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            cur.close()
-            con.close()
 
     def get_plan_by_id(self, plan_id: UUID) -> Optional[Dict[str, Any]]:
         """plan_id로 plan 조회"""
         sql = "SELECT id, start_date, end_date, private, author FROM plan WHERE id = %s;"
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (str(plan_id),))
             row = cur.fetchone()
             if not row:
@@ -80,22 +65,12 @@ class PlanRepository:
                 "private": row[3],
                 "author": row[4]
             }
-        finally:
-            cur.close()
-            con.close()
 
     def update_plan_visibility(self, *, plan_id: UUID, private: bool) -> bool:
         """plan의 공개 여부(private) 변경"""
         sql = "UPDATE plan SET private = %s WHERE id = %s;"
-        con, cur = get_connection()
-        try:
+        with db_cursor() as (con, cur):
             cur.execute(sql, (bool(private), str(plan_id)))
             updated = cur.rowcount > 0
             con.commit()
             return updated
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            cur.close()
-            con.close()
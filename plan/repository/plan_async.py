@@ -0,0 +1,73 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+from datetime import datetime
+
+from util.async_db_pool import async_connection
+
+
+class AsyncPlanRepository:
+    """PlanRepository와 동일한 연산을 asyncpg로 제공"""
+
+    async def create_plan(
+        self,
+        *,
+        start_date: datetime,
+        end_date: datetime,
+        private: bool = True,
+        author: Optional[UUID] = None,
+    ) -> UUID:
+        """
+        plan 레코드 생성 후 plan_id 반환.
+        - start_date/end_date: UTC naive TIMESTAMP로 저장
+        - author: 소유 사용자 id (nullable)
+        """
+        plan_id = uuid4()
+        async with async_connection() as con:
+            await con.execute(
+                "INSERT INTO plan (id, start_date, end_date, private, author) VALUES ($1, $2, $3, $4, $5);",
+                plan_id, start_date, end_date, bool(private), author,
+            )
+        return plan_id
+
+    async def bulk_insert_items(self, *, plan_id: UUID, items: List[Dict[str, Any]]) -> None:
+        """
+        items: [{todo:str, place:str, time: datetime}, ...]
+        - time: UTC naive TIMESTAMP
+        """
+        if not items:
+            return
+        params = []
+        for it in items:
+            todo = str(it.get("todo", "") or "")
+            place = str(it.get("place", "") or "")
+            t: Optional[datetime] = it.get("time")
+            params.append((uuid4(), plan_id, todo, place, t))
+        async with async_connection() as con:
+            async with con.transaction():
+                await con.executemany(
+                    "INSERT INTO plan_item (id, plan_id, todo, place, time) VALUES ($1, $2, $3, $4, $5);",
+                    params,
+                )
+
+    async def get_plan_by_id(self, plan_id: UUID) -> Optional[Dict[str, Any]]:
+        """plan_id로 plan 조회"""
+        sql = "SELECT id, start_date, end_date, private, author FROM plan WHERE id = $1;"
+        async with async_connection() as con:
+            row = await con.fetchrow(sql, plan_id)
+        if not row:
+            return None
+        return {
+            "id": row["id"],
+            "start_date": row["start_date"],
+            "end_date": row["end_date"],
+            "private": row["private"],
+            "author": row["author"]
+        }
+
+    async def update_plan_visibility(self, *, plan_id: UUID, private: bool) -> bool:
+        """plan의 공개 여부(private) 변경"""
+        sql = "UPDATE plan SET private = $1 WHERE id = $2;"
+        async with async_connection() as con:
+            status = await con.execute(sql, bool(private), plan_id)
+        return status.split()[-1] != "0"
@@ -5,12 +5,17 @@ from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 from typing import Dict, Any, List
 from rag import ToolExecutor, TOOL_SCHEMAS
+from rag.cache import get_tool_cache
 from rag.openai_adapter import OpenAIChatTools
 from util.openai_client import openai_async_client
 from plan.model.request.plan import PlanRequest as AIPlanRequest
 from plan.model.response.plan import AIPlanResponse
 from uuid import UUID
-from plan.repository.plan import PlanRepository
+from plan.repository.plan_async import AsyncPlanRepository
+from tourapi.client import TourAPIClient
+from tourapi.dependency import get_tourapi_client
+from catalog.repository.tour_item_async import AsyncTourItemRepository
+from catalog.service.mirror import CatalogMirror
 
 # 시스템 프롬프트: 주소 포함, 모호성 제거, 도구 사용 필수
 SYSTEM_PROMPT = """You are an itinerary planner that MUST use the provided TourAPI tools to gather places.
@@ -43,11 +48,17 @@ def _date_range_days(start: datetime, end: datetime) -> int:
 def _fmt_ok(s: str) -> bool:
     return bool(re.match(r"^\d{4}-\d{2}-\d{2}-\d{2}-\d{2}$", s))
 
-async def generate_ai_plan(req: AIPlanRequest, accept_tz: str | None, owner_user_id: UUID | None = None) -> AIPlanResponse:
-    # LLM 클라이언트/어댑터/도구 실행기
+async def generate_ai_plan(req: AIPlanRequest, accept_tz: str | None, owner_user_id: UUID | None = None, *, tour_client: TourAPIClient | None = None) -> AIPlanResponse:
+    # LLM 클라이언트/어댑터/도구 실행기 (TourAPI는 앱 전역 공유 클라이언트 사용)
     client = openai_async_client()
     adapter = OpenAIChatTools(model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"), client=client)
-    executor = ToolExecutor(api_key=os.environ["TOURAPI_KEY"])
+    executor = ToolExecutor(
+        client=tour_client or get_tourapi_client(),
+        max_concurrency=int(os.getenv("RAG_TOOL_CONCURRENCY", "4")),
+        call_timeout=float(os.getenv("RAG_TOOL_TIMEOUT", "15")),
+        mirror=CatalogMirror(AsyncTourItemRepository()),
+        cache=get_tool_cache(),
+    )
 
     # 타임존
     client_tz = accept_tz or "UTC"
@@ -160,11 +171,11 @@ async def generate_ai_plan(req: AIPlanRequest, accept_tz: str | None, owner_user
     print(owner_user_id)
     # 생성 플랜을 DB에 저장(옵션): plan.author = owner_user_id
     if owner_user_id is not None:
-        repo = PlanRepository()
+        repo = AsyncPlanRepository()
         # 날짜 범위 → UTC naive(TIMESTAMP)
         start_utc_naive = start_dt.astimezone(timezone.utc).replace(tzinfo=None)
         end_utc_naive = end_dt.astimezone(timezone.utc).replace(tzinfo=None)
-        plan_id = repo.create_plan(
+        plan_id = await repo.create_plan(
             start_date=start_utc_naive,
             end_date=end_utc_naive,
             private=True,
@@ -188,7 +199,7 @@ async def generate_ai_plan(req: AIPlanRequest, accept_tz: str | None, owner_user
                     "place": str(item.get("place", "")),
                     "time": utc_naive,
                 })
-        repo.bulk_insert_items(plan_id=plan_id, items=items_to_save)
+        await repo.bulk_insert_items(plan_id=plan_id, items=items_to_save)
 
     return AIPlanResponse.model_validate(out)
 
@@ -203,10 +214,10 @@ async def update_plan_visibility(plan_id: UUID, visibility: str, current_user_id
     """
     from fastapi import HTTPException
     
-    repo = PlanRepository()
+    repo = AsyncPlanRepository()
     
     # 1) plan 존재 여부 및 소유자 확인
-    plan = repo.get_plan_by_id(plan_id)
+    plan = await repo.get_plan_by_id(plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="Plan not found")
     
@@ -217,6 +228,6 @@ async def update_plan_visibility(plan_id: UUID, visibility: str, current_user_id
     
     # 3) visibility 변환 및 업데이트
     private = (visibility == "private")
-    success = repo.update_plan_visibility(plan_id=plan_id, private=private)
+    success = await repo.update_plan_visibility(plan_id=plan_id, private=private)
     
     return success
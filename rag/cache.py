@@ -1,28 +1,51 @@
 from __future__ import annotations
-import time, json, asyncio
-from typing import Any, Dict, Tuple
+import os
+from typing import Any, Dict, Optional
+
+from util.cache import MISSING, ShardedTTLCache, canonical_key
+
 
 class TTLCache:
-    def __init__(self, ttl_seconds: int = 120) -> None:
-        self._ttl = ttl_seconds
-        self._data: Dict[str, Tuple[float, Any]] = {}
-        self._lock = asyncio.Lock()
-
-    def _key(self, name: str, payload: Dict[str, Any]) -> str:
-        return f"{name}:{json.dumps(payload, sort_keys=True, ensure_ascii=False)}"
-
-    async def get(self, name: str, payload: Dict[str, Any]) -> Any | None:
-        k = self._key(name, payload)
-        async with self._lock:
-            v = self._data.get(k)
-            if not v: return None
-            ts, val = v
-            if time.time() - ts > self._ttl:
-                self._data.pop(k, None)
-                return None
-            return val
-
-    async def set(self, name: str, payload: Dict[str, Any], value: Any) -> None:
-        k = self._key(name, payload)
-        async with self._lock:
-            self._data[k] = (time.time(), value)
+    """
+    도구 호출 결과 캐시 (도구 이름 + 인자 단위).
+    util.cache.ShardedTTLCache 위에서 동작하므로 크기/바이트 상한, LRU 퇴출, 만료 스윕이 적용된다.
+    await 없이 동작하므로 이벤트 루프에서 락이 필요 없다.
+    """
+    def __init__(self, ttl_seconds: int = 120, *, max_entries: int = 512, max_bytes: Optional[int] = 8 * 1024 * 1024, shards: int = 8) -> None:
+        self._cache = ShardedTTLCache(max_entries, ttl_seconds, max_bytes=max_bytes, shards=shards)
+
+    def get(self, name: str, payload: Dict[str, Any]) -> Any:
+        """미스면 MISSING"""
+        return self._cache.get(canonical_key(name, payload))
+
+    def set(self, name: str, payload: Dict[str, Any], value: Any) -> None:
+        self._cache.set(canonical_key(name, payload), value)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+_tool_cache: Optional[TTLCache] = None
+
+
+def get_tool_cache() -> TTLCache:
+    """
+    프로세스 공유 도구 캐시 (첫 호출 시 환경변수로 생성). 요청마다 만드는 ToolExecutor에 주입해 요청 간에 재사용한다.
+    - RAG_TOOL_CACHE_TTL: 초, 기본 120
+    - RAG_TOOL_CACHE_SIZE: 최대 항목 수, 기본 512
+    - RAG_TOOL_CACHE_BYTES: 최대 바이트(근사), 기본 8MB
+    """
+    global _tool_cache
+    if _tool_cache is None:
+        _tool_cache = TTLCache(
+            ttl_seconds=int(os.getenv("RAG_TOOL_CACHE_TTL", "120")),
+            max_entries=int(os.getenv("RAG_TOOL_CACHE_SIZE", "512")),
+            max_bytes=int(os.getenv("RAG_TOOL_CACHE_BYTES", str(8 * 1024 * 1024))),
+        )
+    return _tool_cache
+
+
+__all__ = ["TTLCache", "MISSING", "get_tool_cache"]
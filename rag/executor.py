@@ -1,10 +1,11 @@
 from __future__ import annotations
+import asyncio
 import json
 from typing import Any, Dict, List
-from .cache import TTLCache
+from .cache import TTLCache, MISSING
 from .errors import map_error, UserFacingError
 from .normalizers import items_or_empty
-from .paging import paginate
+from .paging import paginate, paginate_concurrent
 
 from tourapi.client import TourAPIClient
 
@@ -12,30 +13,65 @@ class ToolExecutor:
     """
     LLM tool_calls를 받아 TourAPIClient 메서드를 실행하고,
     LLM이 이해할 수 있는 tool 메시지(OpenAI 호환)로 변환한다.
+    - 한 응답의 tool_calls는 최대 max_concurrency개씩 동시에 실행
+    - call_timeout(초)을 넘긴 호출은 오류 메시지로 대체 (다른 호출은 계속 진행)
+    - mirror(catalog.service.mirror.CatalogMirror)가 있으면 위치 기반 목록/키워드 검색은 로컬 미러 우선
+    - cache를 주입받으면(rag.cache.get_tool_cache()) 요청 간에 공유, 없으면 이 실행기 전용 캐시(cache_ttl)
     """
-    def __init__(self, api_key: str, *, app_name: str = "Nomadly", timeout: float = 10.0, cache_ttl: int = 120) -> None:
-        self._client = TourAPIClient(api_key=api_key, app_name=app_name, timeout=timeout)
-        self._cache = TTLCache(ttl_seconds=cache_ttl)
+    def __init__(self, api_key: str | None = None, *, client: TourAPIClient | None = None, app_name: str = "Nomadly", timeout: float = 10.0, cache_ttl: int = 120, max_concurrency: int = 4, call_timeout: float = 15.0, mirror: Any = None, cache: TTLCache | None = None) -> None:
+        # client를 주입받으면 공유 클라이언트로 사용하고 close()에서 닫지 않는다.
+        if client is None:
+            if not api_key:
+                raise ValueError("api_key 또는 client가 필요합니다.")
+            client = TourAPIClient(api_key=api_key, app_name=app_name, timeout=timeout)
+            self._owns_client = True
+        else:
+            self._owns_client = False
+        self._client = client
+        self._cache = cache if cache is not None else TTLCache(ttl_seconds=cache_ttl)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency는 1 이상이어야 합니다.")
+        self._max_concurrency = max_concurrency
+        self._call_timeout = call_timeout
+        self._mirror = mirror
 
     async def close(self) -> None:
-        await self._client.close()
+        if self._owns_client:
+            await self._client.close()
 
     async def _dispatch(self, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
         if name == "get_location_based_list":
-            return await self._call_with_cache(name, args, self._client.get_location_based_list)
+            fn = self._mirror_first("location_based_list", self._client.get_location_based_list)
+            return await self._call_with_cache(name, args, fn)
         if name == "get_search_keyword":
-            return await self._call_with_cache(name, args, self._client.get_search_keyword)
+            fn = self._mirror_first("search_keyword", self._client.get_search_keyword)
+            return await self._call_with_cache(name, args, fn)
         if name == "get_detail_common":
             return await self._call_with_cache(name, args, self._client.get_detail_common)
         raise UserFacingError(f"지원하지 않는 도구: {name}")
 
+    def _mirror_first(self, mirror_method: str, live_fn):
+        """미러 결과가 없거나(미준비/미지원 인자/0건) 실패하면 라이브 TourAPI 호출"""
+        if self._mirror is None:
+            return live_fn
+
+        async def call(**args):
+            try:
+                res = await getattr(self._mirror, mirror_method)(**args)
+            except Exception:
+                res = None
+            if res is not None and items_or_empty(res):
+                return res
+            return await live_fn(**args)
+        return call
+
     async def _call_with_cache(self, name: str, args: Dict[str, Any], fn) -> Dict[str, Any]:
-        cached = await self._cache.get(name, args)
-        if cached is not None:
+        cached = self._cache.get(name, args)
+        if cached is not MISSING:
             return cached
         try:
             res = await fn(**args)
-            await self._cache.set(name, args, res)
+            self._cache.set(name, args, res)
             return res
         except Exception as e:
             raise map_error(e)
@@ -52,31 +88,57 @@ class ToolExecutor:
         if not message:
             return out
         tool_calls = getattr(message, "tool_calls", None) or []
+        if not tool_calls:
+            return out
 
-        for tc in tool_calls:
-            name = tc.function.name
-            try:
-                args = json.loads(tc.function.arguments or "{}")
-            except json.JSONDecodeError:
-                args = {}
-            try:
-                res = await self._dispatch(name, args)
-                content = json.dumps(res, ensure_ascii=False)
-            except UserFacingError as ue:
-                content = json.dumps({"error": str(ue)}, ensure_ascii=False)
-
+        sem = asyncio.Semaphore(self._max_concurrency)
+        results = await asyncio.gather(
+            *(self._run_tool_call(tc, sem) for tc in tool_calls),
+            return_exceptions=True,
+        )
+        # gather는 입력 순서를 보존하므로 tool_call_id 순서 그대로 반환된다
+        for tc, res in zip(tool_calls, results):
+            if isinstance(res, BaseException):
+                if isinstance(res, asyncio.CancelledError):
+                    raise res
+                content = json.dumps({"error": "도구 실행 중 오류가 발생했습니다."}, ensure_ascii=False)
+            else:
+                content = res
             out.append({
                 "role": "tool",
                 "tool_call_id": getattr(tc, "id", None),
-                "name": name,
+                "name": tc.function.name,
                 "content": content,
             })
         return out
 
-    async def run_paged(self, name: str, args: Dict[str, Any], *, max_pages: int = 3) -> List[Dict[str, Any]]:
+    async def _run_tool_call(self, tc: Any, sem: asyncio.Semaphore) -> str:
+        """tool_call 하나를 실행해 tool 메시지 content(JSON 문자열)를 반환"""
+        name = tc.function.name
+        try:
+            args = json.loads(tc.function.arguments or "{}")
+        except json.JSONDecodeError:
+            args = {}
+        async with sem:
+            try:
+                res = await asyncio.wait_for(self._dispatch(name, args), self._call_timeout)
+                return json.dumps(res, ensure_ascii=False)
+            except UserFacingError as ue:
+                return json.dumps({"error": str(ue)}, ensure_ascii=False)
+            except asyncio.TimeoutError:
+                return json.dumps({"error": f"도구 호출 시간 초과({self._call_timeout:g}s)"}, ensure_ascii=False)
+
+    async def run_paged(self, name: str, args: Dict[str, Any], *, max_pages: int = 3, window: int = 4) -> List[Dict[str, Any]]:
+        """
+        여러 페이지의 items를 모은다. window > 1이면 첫 페이지 이후 페이지를 window개씩 동시에 가져온다.
+        """
         async def fetch(p):
             return await self._dispatch(name, p)
+        pages = (
+            paginate_concurrent(fetch, args, max_pages=max_pages, window=window)
+            if window > 1 else paginate(fetch, args, max_pages=max_pages)
+        )
         collected: List[Dict[str, Any]] = []
-        async for page in paginate(fetch, args, max_pages=max_pages):
+        async for page in pages:
             collected.extend(items_or_empty(page))
         return collected
@@ -1,5 +1,19 @@
 from __future__ import annotations
-from typing import AsyncIterator, Callable, Dict, Any
+import asyncio
+import math
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, Dict, Any, Optional, Tuple
+
+def page_info(res: Any, page: int, size: Optional[int]) -> Optional[Tuple[int, int, int]]:
+    """응답 body에서 (pageNo, numOfRows, totalCount). 형식이 다르면 None"""
+    try:
+        body = res["response"]["body"]
+        total = int(body.get("totalCount", 0))
+        page_no = int(body.get("pageNo", page))
+        num_rows = int(body.get("numOfRows", size or 10))
+        return page_no, num_rows, total
+    except Exception:
+        return None
 
 async def paginate(
     fetch: Callable[[Dict[str, Any]], Any],
@@ -14,13 +28,58 @@ async def paginate(
         params[page_param] = page
         res = await fetch(params)
         yield res
-        try:
-            body = res["response"]["body"]
-            total = int(body.get("totalCount", 0))
-            page_no = int(body.get("pageNo", page))
-            num_rows = int(body.get("numOfRows", size or 10))
-            if page_no * num_rows >= total:
-                break
-        except Exception:
+        info = page_info(res, page, size)
+        if info is None:
+            break
+        page_no, num_rows, total = info
+        if page_no * num_rows >= total:
             break
         page += 1
+
+async def paginate_concurrent(
+    fetch: Callable[[Dict[str, Any]], Any],
+    base_params: Dict[str, Any],
+    *, page_param: str = "page_no", size_param: str = "num_of_rows",
+    start_page: int = 1, max_pages: int = 5, window: int = 4
+) -> AsyncIterator[Any]:
+    """
+    첫 페이지의 totalCount로 남은 페이지 번호를 구한 뒤, 최대 window개씩 동시에 가져온다.
+    결과는 페이지 순서대로 yield하며 max_pages 상한은 paginate와 같다.
+    fetch는 호출마다 별도의 params dict를 받는다.
+    """
+    if window < 1:
+        raise ValueError("window는 1 이상이어야 합니다.")
+    params = dict(base_params)
+    first_page = params.get(page_param, start_page) or start_page
+    size = params.get(size_param)
+    params[page_param] = first_page
+    first = await fetch(params)
+    yield first
+
+    info = page_info(first, first_page, size)
+    if info is None:
+        return
+    page_no, num_rows, total = info
+    if num_rows <= 0 or page_no * num_rows >= total:
+        return
+    last_page = min(math.ceil(total / num_rows), first_page + max_pages - 1)
+
+    def _start(page: int) -> "asyncio.Task[Any]":
+        p = dict(base_params)
+        p[page_param] = page
+        return asyncio.ensure_future(fetch(p))
+
+    pending: Deque["asyncio.Task[Any]"] = deque()
+    next_page = page_no + 1
+    try:
+        while next_page <= last_page or pending:
+            while next_page <= last_page and len(pending) < window:
+                pending.append(_start(next_page))
+                next_page += 1
+            yield await pending.popleft()
+    finally:
+        # 소비자가 중간에 멈추거나 오류가 나면 남은 요청은 취소하고, 취소가 끝날 때까지 기다린다
+        # (기다리지 않으면 태스크 예외가 회수되지 않고 연결 정리가 제너레이터 종료 뒤로 밀린다)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from locations.service.aggregates import start_aggregate_verifier, stop_aggregate_verifier, verify_place_aggregates
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakePlaceRepo:
+    def __init__(self, drift):
+        self.drift = drift
+        self.calls = 0
+
+    async def verify_aggregates(self):
+        self.calls += 1
+        fixed, self.drift = self.drift, 0
+        return fixed
+
+
+async def test_verify_reports_repaired_rows_once():
+    repo = FakePlaceRepo(drift=3)
+    assert await verify_place_aggregates(repo) == 3
+    assert await verify_place_aggregates(repo) == 0
+
+
+async def test_verifier_runs_at_startup_and_can_be_disabled(monkeypatch):
+    repo = FakePlaceRepo(drift=1)
+    monkeypatch.setenv("PLACE_AGGREGATE_VERIFY_INTERVAL", "3600")
+    assert start_aggregate_verifier(repo) is not None
+    await asyncio.sleep(0.01)
+    await stop_aggregate_verifier()
+    assert repo.calls == 1
+
+    monkeypatch.setenv("PLACE_AGGREGATE_VERIFY_INTERVAL", "0")
+    assert start_aggregate_verifier(repo) is None
@@ -0,0 +1,97 @@
+import os
+import uuid
+
+import pytest
+
+from board.service import document as service
+from util.pagination import InvalidCursor
+
+pytestmark = pytest.mark.asyncio
+
+USER = uuid.uuid4()
+
+
+@pytest.fixture
+def db():
+    """board_bigrams()/board_tsquery()만 만들어 쓰고 되돌린다 (TEST_DATABASE_URL 필요)"""
+    if not os.getenv("TEST_DATABASE_URL"):
+        pytest.skip("TEST_DATABASE_URL not set")
+    import psycopg2
+    from migrations.versions.m0008_board_search import FUNCTION_SQL
+    from migrations.versions.m0010_board_tsquery import SQL as TSQUERY_SQL
+
+    con = psycopg2.connect(os.environ["TEST_DATABASE_URL"])
+    try:
+        with con.cursor() as cur:
+            cur.execute(FUNCTION_SQL)
+            cur.execute(TSQUERY_SQL)
+            yield cur
+    finally:
+        con.rollback()
+        con.close()
+
+
+def _one(cur, sql, *params):
+    cur.execute(sql, params)
+    return cur.fetchone()[0]
+
+
+async def test_bigrams_split_words_and_keep_single_characters(db):
+    assert _one(db, "SELECT board_bigrams(%s)", "서울 야경 투어!") == "서울 야경 투어"
+    assert _one(db, "SELECT board_bigrams(%s)", "제주도, 한 달 살기") == "제주 주도 한 달 살기"
+    assert _one(db, "SELECT board_bigrams(%s)", "Seoul_Trip") == "se eo ou ul tr ri ip"
+    assert _one(db, "SELECT board_bigrams(%s)", None) == "" and _one(db, "SELECT board_bigrams(%s)", "  !! ") == ""
+
+
+async def test_tsquery_ands_bigrams_and_prefixes_single_characters(db):
+    q = "SELECT board_tsquery(%s)::text"
+    assert _one(db, q, "부산 맛집") == "'부산' & '맛집'"
+    assert _one(db, q, "해운대") == "'해운' & '운대'"
+    # 입력 중인 한 글자는 접두 일치, 중복 토큰은 한 번만
+    assert _one(db, q, "서울 서") == "'서울' & '서':*"
+    assert _one(db, q, "아아아") == "'아아'"
+    # 따옴표/연산자는 구분자로 버려져 tsquery 문법을 깨지 않는다
+    assert _one(db, q, "it's & | !") == "'it' & 's':*"
+    assert _one(db, q, "   ") is None and _one(db, q, "?!") is None
+
+
+@pytest.mark.parametrize("text, keyword", [
+    ("ㅋㅋ 후기 abcㄱㄴ", "ㅋㅋ"),
+    ("ㅋㅋ 후기 abcㄱㄴ", "bcㄱ"),
+    ("Café ㅎㅎ Ωμέγα 서울", "café ωμ"),
+    ("Café ㅎㅎ Ωμέγα 서울", "ㅎ 서울"),
+])
+async def test_query_and_stored_vector_use_the_same_split(db, text, keyword):
+    # 저장 쪽(search_vector)과 검색어 쪽이 같은 board_bigrams() 규칙을 쓰므로 자모/다른 문자권이 섞여도 일치
+    assert _one(db, "SELECT to_tsvector('simple', board_bigrams(%s)) @@ board_tsquery(%s)", text, keyword) is True
+
+
+@pytest.fixture
+def fake_search(monkeypatch):
+    rows = [(uuid.UUID(int=i), f"제목 {i}", "내용", False, i, 1.0 - i / 10) for i in range(5)]
+    calls = []
+
+    def search_boards(keyword, user_id, *, limit, after=None):
+        calls.append((keyword, after))
+        pool = [r for r in rows if after is None or (r[5], r[0]) < after]
+        return pool[:limit]
+
+    monkeypatch.setattr(service.repository, "search_boards", search_boards)
+    return calls
+
+
+async def test_search_pages_with_cursor(fake_search):
+    first = service.search_boards("제목", USER, limit=2)
+    assert [b.likes for b in first["plans"]] == [0, 1] and first["next_cursor"]
+    second = service.search_boards("제목", USER, limit=2, cursor=first["next_cursor"])
+    assert [b.likes for b in second["plans"]] == [2, 3]
+    last = service.search_boards("제목", USER, limit=2, cursor=second["next_cursor"])
+    assert [b.likes for b in last["plans"]] == [4] and last["next_cursor"] is None
+    assert fake_search[1] == ("제목", (0.9, uuid.UUID(int=1)))
+
+
+async def test_blank_search_skips_query_and_bad_cursor_raises(fake_search):
+    assert service.search_boards("   ", USER) == {"plans": [], "next_cursor": None}
+    assert fake_search == []
+    with pytest.raises(InvalidCursor):
+        service.search_boards("제목", USER, cursor="not-a-cursor")
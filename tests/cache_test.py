@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+import rag.cache
+from rag.cache import TTLCache, MISSING, get_tool_cache
+from rag.executor import ToolExecutor
+from util.cache import ShardedTTLCache, canonical_key
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_canonical_key_ignores_argument_order():
+    a = canonical_key("get_search_keyword", {"keyword": "경복궁", "page_no": 1, "opts": {"x": [1, 2]}})
+    b = canonical_key("get_search_keyword", {"opts": {"x": [1, 2]}, "page_no": 1, "keyword": "경복궁"})
+    assert a == b and hash(a) == hash(b)
+    assert a != canonical_key("get_search_keyword", {"keyword": "경복궁", "page_no": 2})
+
+
+async def test_sharded_cache_is_bounded_and_counts_evictions():
+    cache = ShardedTTLCache(max_entries=16, ttl_seconds=60, shards=4)
+    for i in range(100):
+        cache.set(i, {"v": "x" * 10})
+    stats = cache.stats()
+    assert len(cache) <= 16
+    assert stats["evictions"] == 100 - len(cache)
+    assert stats["bytes"] > 0
+
+
+async def test_expired_entries_are_swept_without_being_read():
+    cache = ShardedTTLCache(max_entries=64, ttl_seconds=0.01, shards=2, sweep_interval=0.0)
+    for i in range(10):
+        cache.set(i, i)
+    time.sleep(0.02)
+    assert cache.purge_expired() == 10
+    assert len(cache) == 0
+    assert cache.stats()["expirations"] == 10
+
+
+async def test_tool_executor_serves_repeated_calls_from_cache():
+    calls = []
+
+    class FakeClient:
+        async def get_search_keyword(self, **kw):
+            calls.append(kw)
+            return {"response": {"body": {"items": {"item": []}}}}
+
+    ex = ToolExecutor(client=FakeClient())
+    await ex._dispatch("get_search_keyword", {"keyword": "경복궁", "page_no": 1})
+    await ex._dispatch("get_search_keyword", {"page_no": 1, "keyword": "경복궁"})
+    assert len(calls) == 1
+    assert ex._cache.stats()["hits"] == 1
+    assert TTLCache().get("x", {}) is MISSING
+
+
+async def test_shared_tool_cache_survives_across_executors(monkeypatch):
+    monkeypatch.setattr(rag.cache, "_tool_cache", None)
+    calls = []
+
+    class FakeClient:
+        async def get_detail_common(self, **kw):
+            calls.append(kw)
+            return {"response": {"body": {"items": {"item": [{"contentid": kw["content_id"]}]}}}}
+
+    # 요청마다 새 실행기를 만들어도 공유 캐시를 주입하면 이전 요청 결과를 재사용
+    for _ in range(3):
+        ex = ToolExecutor(client=FakeClient(), cache=get_tool_cache())
+        await ex._dispatch("get_detail_common", {"content_id": "126508"})
+    assert len(calls) == 1 and get_tool_cache() is get_tool_cache()
+    assert get_tool_cache().stats()["hits"] == 2
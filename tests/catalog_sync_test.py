@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from catalog.items import parse_item, TOUR_ITEM_COLUMNS
+from catalog.service import mirror as mirror_mod
+from catalog.service.mirror import CatalogMirror
+from catalog.service.sync import CatalogSync, sync_metrics
+
+pytestmark = pytest.mark.asyncio
+
+LAT, LON = TOUR_ITEM_COLUMNS.index("latitude"), TOUR_ITEM_COLUMNS.index("longitude")
+
+
+def _item(cid, modified="20250101120000", **kw):
+    base = {
+        "contentid": str(cid), "contenttypeid": "12", "title": f"place {cid}",
+        "addr1": "서울", "mapx": "126.97", "mapy": "37.57", "firstimage": "http://img",
+        "modifiedtime": modified,
+    }
+    base.update(kw)
+    return base
+
+
+def _page(items, page_no, rows, total):
+    return {"response": {"header": {"resultCode": "0000"}, "body": {
+        "items": {"item": items}, "pageNo": page_no, "numOfRows": rows, "totalCount": total}}}
+
+
+class FakeRepo:
+    def __init__(self):
+        self.items = {}
+        self.state = {}
+        self.run_started = datetime.now(timezone.utc)
+
+    async def upsert_items(self, rows):
+        for r in rows:
+            self.items[r[0]] = r
+        return len(rows)
+
+    async def delete_items(self, ids):
+        n = sum(1 for i in ids if self.items.pop(i, None))
+        return n
+
+    async def delete_synced_before(self, ts):
+        return 0
+
+    async def count(self):
+        return len(self.items)
+
+    async def get_state(self, name):
+        return dict(self.state) or None
+
+    async def start_run(self, name, mode):
+        self.state.update(run_mode=mode, run_status="running")
+        return self.run_started
+
+    async def update_progress(self, name, **kw):
+        self.state.update(pages_done=kw["pages_done"], pages_total=kw["pages_total"])
+
+    async def finish_run(self, name, mode, *, watermark):
+        self.state["run_status"] = "ok"
+        self.state["last_full_at" if mode == "full" else "last_incremental_at"] = datetime.now(timezone.utc)
+        if watermark and (not self.state.get("watermark") or watermark > self.state["watermark"]):
+            self.state["watermark"] = watermark
+
+    async def fail_run(self, name, error):
+        self.state.update(run_status="failed", run_error=error)
+
+    async def find_in_bbox(self, *, min_lat, max_lat, min_lon, max_lon, filters=None, image_only=False):
+        return [r for r in self.items.values() if min_lat <= r[LAT] <= max_lat and min_lon <= r[LON] <= max_lon]
+
+
+class FakeClient:
+    def __init__(self):
+        self.full = [_item(i, modified=f"2025010{i}000000") for i in range(1, 6)]
+        self.sync = []
+        self.sync_args = []
+
+    async def get_area_based_list(self, arrange=None, num_of_rows=10, page_no=1):
+        chunk = self.full[(page_no - 1) * num_of_rows: page_no * num_of_rows]
+        return _page(chunk, page_no, num_of_rows, len(self.full))
+
+    async def get_area_based_sync_list(self, modified_time=None, arrange=None, num_of_rows=10, page_no=1):
+        self.sync_args.append(modified_time)
+        return _page(self.sync, page_no, num_of_rows, len(self.sync))
+
+
+async def test_parse_item_skips_incomplete_rows():
+    assert parse_item({"title": "x"}) is None
+    row = parse_item(_item(1, mapx="0"))
+    assert row[0] == "1" and row[LON] is None
+
+
+async def test_full_then_incremental_applies_showflag_and_advances_watermark():
+    repo, client = FakeRepo(), FakeClient()
+    sync = CatalogSync(client, repo, page_size=2, window=2)
+
+    full = await sync.full_load()
+    assert full["pages"] == 3 and len(repo.items) == 5
+    assert repo.state["watermark"] == "20250105000000"
+
+    client.sync = [
+        _item(2, modified="20250106090000", showflag="0"),
+        _item(9, modified="20250106100000", showflag="1"),
+    ]
+    inc = await sync.incremental()
+    assert client.sync_args == ["20250105"]
+    assert inc["upserted"] == 1 and inc["deleted"] == 1
+    assert "2" not in repo.items and "9" in repo.items
+    assert repo.state["watermark"] == "20250106100000"
+
+    status = await sync.status()
+    assert status["items"] == 5 and status["run_status"] == "ok"
+    assert status["watermark_lag_s"] > 0
+
+
+async def test_incremental_requires_a_full_load_first():
+    with pytest.raises(ValueError):
+        await CatalogSync(FakeClient(), FakeRepo()).incremental()
+
+
+async def test_sync_metrics_reports_lag():
+    now = datetime(2025, 1, 2, 3, 0, tzinfo=timezone.utc)
+    m = sync_metrics({"watermark": "20250102110000", "last_full_at": now - timedelta(hours=1),
+                      "pages_done": 5, "pages_total": 10}, 42, now=now)
+    assert m["watermark_lag_s"] == 3600  # 11:00 KST = 02:00 UTC
+    assert m["since_last_sync_s"] == 3600
+    assert m["progress"] == 0.5
+
+
+async def test_mirror_serves_location_list_only_when_synced():
+    mirror_mod._ready_cache.clear()
+    repo = FakeRepo()
+    await repo.upsert_items([parse_item(_item(1)), parse_item(_item(2, mapx="127.5", mapy="36.0"))])
+    m = CatalogMirror(repo)
+    args = dict(map_x=126.97, map_y=37.57, radius=1000, arrange="Q", content_type_id=12)
+    assert await m.location_based_list(**args) is None  # 전체 적재 전
+
+    mirror_mod._ready_cache.clear()
+    repo.state["last_full_at"] = datetime.now(timezone.utc)
+    resp = await m.location_based_list(**args)
+    items = resp["response"]["body"]["items"]["item"]
+    assert [i["contentid"] for i in items] == ["1"]
+    assert await m.location_based_list(**args, lcls1="XX") is not None
+    assert await m.location_based_list(**args, unknown_filter=1) is None
+    mirror_mod._ready_cache.clear()
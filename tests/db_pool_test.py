@@ -0,0 +1,117 @@
+import threading
+import time
+
+import pytest
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+
+from util.db_pool import ConnectionPool, PoolTimeoutError
+
+
+class _FakeCursor:
+    def __init__(self, con):
+        self.con = con
+
+    def execute(self, sql, params=None):
+        if self.con.broken:
+            raise Exception("server closed the connection unexpectedly")
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.broken = False
+        self.status = TRANSACTION_STATUS_IDLE
+        self.rollbacks = 0
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def get_transaction_status(self):
+        return self.status
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.status = TRANSACTION_STATUS_IDLE
+
+    def commit(self):
+        self.status = TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+def _pool(**kw):
+    made = []
+
+    def connect():
+        c = _FakeConnection()
+        made.append(c)
+        return c
+
+    return ConnectionPool(connect, **kw), made
+
+
+def test_close_returns_connection_for_reuse():
+    pool, made = _pool(max_size=2)
+    con = pool.getconn()
+    con.close()
+    con2 = pool.getconn()
+    assert con2.raw is made[0]
+    assert len(made) == 1
+    assert pool.stats()["checkouts"] == 2
+
+
+def test_uncommitted_transaction_is_rolled_back_on_release():
+    pool, made = _pool(max_size=1)
+    con = pool.getconn()
+    made[0].status = TRANSACTION_STATUS_INTRANS
+    con.close()
+    assert made[0].rollbacks == 1
+    assert pool.stats()["idle"] == 1
+
+
+def test_checkout_times_out_when_exhausted():
+    pool, _ = _pool(max_size=1, checkout_timeout=0.05)
+    held = pool.getconn()
+    with pytest.raises(PoolTimeoutError):
+        pool.getconn()
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["waits"] == 1
+    held.close()
+
+
+def test_waiter_gets_released_connection():
+    pool, _ = _pool(max_size=1, checkout_timeout=2.0)
+    held = pool.getconn()
+    threading.Timer(0.05, held.close).start()
+    con = pool.getconn()
+    assert con.closed == 0
+    con.close()
+
+
+def test_unhealthy_idle_connection_is_replaced():
+    pool, made = _pool(max_size=1, max_idle=0.0)
+    pool.getconn().close()
+    made[0].broken = True
+    con = pool.getconn()
+    assert con.raw is made[1]
+    assert pool.stats()["discarded_unhealthy"] == 1
+
+
+def test_expired_connection_is_discarded():
+    pool, made = _pool(max_size=1, max_lifetime=0.01)
+    con = pool.getconn()
+    time.sleep(0.02)
+    con.close()
+    assert made[0].closed == 1
+    assert pool.stats()["size"] == 0
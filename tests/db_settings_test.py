@@ -0,0 +1,19 @@
+from util import async_db_pool
+from util.db_settings import db_settings
+
+
+def test_database_url_wins(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql://u:p@db:5432/app")
+    assert db_settings() == {"dsn": "postgresql://u:p@db:5432/app"}
+    assert async_db_pool._dsn_kwargs() == {"dsn": "postgresql://u:p@db:5432/app"}
+
+
+def test_password_comes_only_from_env(monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("DB_PASSWORD", raising=False)
+    monkeypatch.setenv("DB_PORT", "5432")
+    settings = db_settings()
+    assert settings["password"] is None and settings["port"] == 5432
+    monkeypatch.setenv("DB_PASSWORD", "secret")
+    kwargs = async_db_pool._dsn_kwargs()
+    assert kwargs["password"] == "secret" and kwargs["database"] == settings["dbname"] and "dbname" not in kwargs
@@ -0,0 +1,69 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace as NS
+
+import pytest
+
+from rag.executor import ToolExecutor
+
+pytestmark = pytest.mark.asyncio
+
+
+def _resp(*calls):
+    tool_calls = [
+        NS(id=f"call_{i}", function=NS(name=name, arguments=json.dumps(args)))
+        for i, (name, args) in enumerate(calls)
+    ]
+    return NS(choices=[NS(message=NS(tool_calls=tool_calls))])
+
+
+class FakeClient:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def _work(self, delay, payload):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+            return payload
+        finally:
+            self.active -= 1
+
+    async def get_search_keyword(self, keyword, delay=0.05, **kw):
+        if keyword == "boom":
+            raise RuntimeError("radius")
+        return await self._work(delay, {"keyword": keyword})
+
+    async def get_detail_common(self, content_id, delay=0.05, **kw):
+        return await self._work(delay, {"content_id": content_id})
+
+
+async def test_tool_calls_run_concurrently_and_keep_order():
+    client = FakeClient()
+    ex = ToolExecutor(client=client, max_concurrency=3)
+    resp = _resp(*[("get_search_keyword", {"keyword": f"k{i}"}) for i in range(6)])
+    start = time.monotonic()
+    msgs = await ex.consume_tool_calls(resp)
+    elapsed = time.monotonic() - start
+    assert [m["tool_call_id"] for m in msgs] == [f"call_{i}" for i in range(6)]
+    assert [json.loads(m["content"])["keyword"] for m in msgs] == [f"k{i}" for i in range(6)]
+    assert client.peak == 3
+    assert elapsed < 0.25
+
+
+async def test_failures_and_timeouts_do_not_cancel_other_calls():
+    ex = ToolExecutor(client=FakeClient(), call_timeout=0.1)
+    msgs = await ex.consume_tool_calls(_resp(
+        ("get_search_keyword", {"keyword": "boom"}),
+        ("get_detail_common", {"content_id": 1, "delay": 1.0}),
+        ("unknown_tool", {}),
+        ("get_detail_common", {"content_id": 2}),
+    ))
+    contents = [json.loads(m["content"]) for m in msgs]
+    assert "error" in contents[0]
+    assert "시간 초과" in contents[1]["error"]
+    assert "error" in contents[2]
+    assert contents[3] == {"content_id": 2}
@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+import pytest
+
+from util.fanout import Deadline, bounded, value
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _sleep_then(seconds, result):
+    await asyncio.sleep(seconds)
+    return result
+
+
+async def test_fanout_latency_is_the_slowest_call_not_the_sum():
+    deadline = Deadline(1.0)
+    start = time.monotonic()
+    results = await asyncio.gather(
+        bounded(_sleep_then(0.05, "a"), timeout=0.5, deadline=deadline),
+        bounded(_sleep_then(0.05, "b"), timeout=0.5, deadline=deadline),
+        bounded(_sleep_then(0.05, "c"), timeout=0.5, deadline=deadline),
+    )
+    assert results == ["a", "b", "c"]
+    assert time.monotonic() - start < 0.14
+
+
+async def test_timeout_and_errors_fall_back_to_default():
+    async def boom():
+        raise RuntimeError("x")
+
+    slow, failed, ok = await asyncio.gather(
+        bounded(_sleep_then(1.0, "slow"), timeout=0.05, default="timeout"),
+        bounded(boom(), timeout=0.5, default="error"),
+        bounded(value("ok"), timeout=0.5),
+    )
+    assert (slow, failed, ok) == ("timeout", "error", "ok")
+
+
+async def test_expired_deadline_skips_call():
+    deadline = Deadline(0.0)
+    assert deadline.expired
+    assert await bounded(_sleep_then(0.01, "x"), timeout=1.0, deadline=deadline, default=None) is None
@@ -0,0 +1,46 @@
+import math
+import random
+
+import pytest
+from haversine import haversine, Unit
+
+from util.geo_distance import distance_m, distances_m, within_radius
+
+pytestmark = pytest.mark.asyncio
+
+ORIGIN = (37.5665, 126.9780)
+
+
+def _points(n=5000, seed=3):
+    rng = random.Random(seed)
+    lats = [rng.uniform(37.0, 38.2) for _ in range(n)]
+    lons = [rng.uniform(126.3, 127.7) for _ in range(n)]
+    return lats, lons
+
+
+async def test_distances_match_haversine_package():
+    lats, lons = _points(500)
+    got = distances_m(*ORIGIN, lats, lons).tolist()
+    for lat, lon, d in zip(lats, lons, got):
+        assert abs(d - haversine(ORIGIN, (lat, lon), unit=Unit.METERS)) <= 1
+    assert distance_m(*ORIGIN, *ORIGIN) == 0
+
+
+async def test_within_radius_matches_brute_force_and_keeps_order():
+    lats, lons = _points()
+    for radius in (500, 5_000, 20_000):
+        idx, dists = within_radius(*ORIGIN, lats, lons, radius)
+        expected = [
+            i for i, (lat, lon) in enumerate(zip(lats, lons))
+            if haversine(ORIGIN, (lat, lon), unit=Unit.METERS) <= radius
+        ]
+        assert idx.tolist() == expected
+        assert all(0 <= d <= radius for d in dists.tolist())
+
+
+async def test_invalid_coordinates_are_skipped():
+    idx, _ = within_radius(*ORIGIN, [math.nan, ORIGIN[0], None], [ORIGIN[1], math.nan, ORIGIN[1]], 1_000)
+    assert idx.tolist() == []
+    assert distances_m(*ORIGIN, [math.nan], [ORIGIN[1]]).tolist() == [-1]
+    empty_idx, empty_d = within_radius(*ORIGIN, [], [], 1_000)
+    assert empty_idx.size == 0 and empty_d.size == 0
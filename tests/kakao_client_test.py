@@ -0,0 +1,71 @@
+import httpx
+import pytest
+
+from kakao.client import KakaoLocalClient
+
+pytestmark = pytest.mark.asyncio
+
+
+def _client(handler, **kw):
+    c = KakaoLocalClient("test-key", **kw)
+    c.client = httpx.AsyncClient(base_url="https://dapi.kakao.com", transport=httpx.MockTransport(handler))
+    return c
+
+
+async def test_hot_keyword_is_served_from_cache():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.params["query"])
+        return httpx.Response(200, json={"documents": [{"place_name": "경복궁", "x": "126.97", "y": "37.57"}]})
+
+    c = _client(handler)
+    first = await c.search_keyword_first("경복궁")
+    again = await c.search_keyword_first("  경복궁 ")
+    assert first == again
+    assert calls == ["경복궁"]
+    assert c.stats()["cache"]["hits"] == 1
+    await c.close()
+
+
+async def test_misses_are_remembered_but_errors_are_raised_and_not_cached():
+    status = {"code": 500}
+    calls = []
+
+    def handler(request):
+        calls.append(1)
+        if status["code"] != 200:
+            return httpx.Response(status["code"])
+        return httpx.Response(200, json={"documents": []})
+
+    c = _client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        await c.search_keyword_first("없는곳")
+    status["code"] = 200
+    assert await c.search_keyword_first("없는곳") is None
+    assert await c.search_keyword_first("없는곳") is None
+    assert len(calls) == 2
+    await c.close()
+
+
+async def test_timeout_is_raised_not_reported_as_miss():
+    def handler(request):
+        raise httpx.ReadTimeout("slow", request=request)
+
+    c = _client(handler)
+    with pytest.raises(httpx.TimeoutException):
+        await c.search_keyword_first("경복궁")
+    assert len(c.cache) == 0
+    await c.close()
+
+
+async def test_cache_is_bounded():
+    def handler(request):
+        return httpx.Response(200, json={"documents": [{"place_name": request.url.params["query"]}]})
+
+    c = _client(handler, cache_size=2)
+    for kw in ("a", "b", "c"):
+        await c.search_keyword_first(kw)
+    assert len(c.cache) == 2
+    assert c.cache.evictions == 1
+    await c.close()
@@ -0,0 +1,100 @@
+import uuid
+from contextlib import contextmanager
+
+import pytest
+
+from board.repository import like
+
+BOARD = uuid.uuid4()
+USER = uuid.uuid4()
+
+
+class FakeDB:
+    """like/board 두 테이블만 흉내낸다. SQL 문장 종류로 분기해 CTE 한 문장의 결과를 재현"""
+
+    def __init__(self):
+        self.likes = set()  # (user_id, board_id)
+        self.boards = {}    # board_id -> likes
+        self.row = None
+        self.rowcount = 0
+        self.commits = 0
+
+    def execute(self, sql, params=None):
+        self.row = None
+        if 'INSERT INTO public."like"' in sql:
+            _, user_id, board_id = params
+            if (user_id, board_id) in self.likes:
+                return  # ON CONFLICT DO NOTHING → ins 비어 UPDATE 없음
+            self.likes.add((user_id, board_id))
+            self.boards[board_id] = (self.boards.get(board_id) or 0) + 1
+            self.row = (self.boards[board_id],)
+        elif 'DELETE FROM public."like"' in sql:
+            board_id, user_id = params
+            if (user_id, board_id) not in self.likes:
+                return
+            self.likes.discard((user_id, board_id))
+            self.boards[board_id] = max((self.boards.get(board_id) or 0) - 1, 0)  # GREATEST(..., 0)
+            self.row = (self.boards[board_id],)
+        elif "UPDATE board b" in sql:
+            self.rowcount = 0
+            for board_id, likes in self.boards.items():
+                cnt = sum(1 for _, b in self.likes if b == board_id)
+                if likes != cnt:
+                    self.boards[board_id] = cnt
+                    self.rowcount += 1
+
+    def fetchone(self):
+        return self.row
+
+    def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDB()
+    db.boards[str(BOARD)] = 0
+
+    @contextmanager
+    def db_cursor():
+        yield db, db
+
+    monkeypatch.setattr(like, "db_cursor", db_cursor)
+    return db
+
+
+def test_duplicate_like_does_not_increment(fake_db):
+    assert like.like_board(BOARD, USER) == 1
+    assert like.like_board(BOARD, USER) is None
+    assert fake_db.boards[str(BOARD)] == 1 and len(fake_db.likes) == 1
+
+
+def test_unlike_without_like_does_not_decrement(fake_db):
+    like.like_board(BOARD, USER)
+    assert like.delete_like_board(BOARD, uuid.uuid4()) is None
+    assert fake_db.boards[str(BOARD)] == 1
+    assert like.delete_like_board(BOARD, USER) == 0
+    assert like.delete_like_board(BOARD, USER) is None
+
+
+def test_unlike_floors_drifted_count_at_zero(fake_db):
+    fake_db.likes.add((str(USER), str(BOARD)))  # likes 컬럼이 이미 0으로 어긋난 상태
+    assert like.delete_like_board(BOARD, USER) == 0
+    assert fake_db.boards[str(BOARD)] == 0
+
+
+def test_reconcile_repairs_only_drifted_boards(fake_db):
+    other, third = str(uuid.uuid4()), str(uuid.uuid4())
+    fake_db.boards.update({other: 5, third: 1})
+    fake_db.likes.update({(str(USER), str(BOARD)), (str(USER), third)})
+    assert like.reconcile_like_counts() == 2
+    assert fake_db.boards == {str(BOARD): 1, other: 0, third: 1}
+    assert like.reconcile_like_counts() == 0
+
+
+def test_like_sql_keeps_guards():
+    # FakeDB가 흉내내는 보장이 실제 SQL에 남아 있는지
+    import inspect
+    assert "ON CONFLICT (user_id, board_id) DO NOTHING" in inspect.getsource(like.like_board)
+    assert "GREATEST(COALESCE(likes, 0) - 1, 0)" in inspect.getsource(like.delete_like_board)
+    assert "IS DISTINCT FROM" in inspect.getsource(like.reconcile_like_counts)
@@ -0,0 +1,103 @@
+from contextlib import contextmanager
+
+import pytest
+
+from migrations import Migration, discover, run_migrations
+
+
+class FakeDB:
+    def __init__(self, applied=()):
+        self.applied = {v: "t" for v in applied}
+        self.pending_rows = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.executed = []
+        self.locked = False
+        self.on_lock = None
+        self.unlocked_writes = 0
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql.strip().split()[0:3])
+        if "pg_advisory_xact_lock" in sql:
+            self.locked = True
+            if self.on_lock:
+                self.on_lock(self)
+        if sql.startswith("INSERT INTO schema_migrations"):
+            self.unlocked_writes += not self.locked
+            self.pending_rows.append(params[0])
+
+    def fetchall(self):
+        return list(self.applied.items())
+
+    def commit(self):
+        self.commits += 1
+        self.locked = False
+        for v in self.pending_rows:
+            self.applied[v] = "t"
+        self.pending_rows = []
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.locked = False
+        self.pending_rows = []
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    import user.repository
+
+    db = FakeDB(applied=[1])
+
+    @contextmanager
+    def db_cursor():
+        yield db, db
+
+    monkeypatch.setattr(user.repository, "db_cursor", db_cursor)
+    return db
+
+
+def _m(version, calls, fail=False):
+    def upgrade(cur):
+        if fail:
+            raise RuntimeError("boom")
+        calls.append(version)
+    return Migration(version, f"v{version}", upgrade)
+
+
+def test_discover_finds_versions_in_order_without_db():
+    found = discover()
+    versions = [m.version for m in found]
+    assert versions == sorted(versions) and versions[0] == 1
+    assert len(set(versions)) == len(versions)
+    assert all(callable(m.upgrade) for m in found)
+
+
+def test_applies_only_pending_up_to_target(fake_db):
+    calls = []
+    applied = run_migrations(3, migrations=[_m(1, calls), _m(2, calls), _m(3, calls), _m(4, calls)])
+    assert [m.version for m in applied] == [2, 3] and calls == [2, 3]
+    assert set(fake_db.applied) == {1, 2, 3}
+    assert run_migrations(migrations=[_m(1, calls), _m(2, calls), _m(3, calls), _m(4, calls)])[0].version == 4
+    # 세션 락 없이, 버전마다 자기 트랜잭션 안에서 xact 락을 잡고 적용
+    assert fake_db.unlocked_writes == 0
+    assert not any("pg_advisory_lock" in " ".join(e) or "pg_advisory_unlock" in " ".join(e) for e in fake_db.executed)
+
+
+def test_version_applied_by_another_process_while_waiting_is_skipped(fake_db):
+    calls = []
+
+    def other_process_applies_2(db):
+        if len([e for e in db.executed if "pg_advisory_xact_lock(%s);" in e]) == 2:
+            db.applied[2] = "t"
+
+    fake_db.on_lock = other_process_applies_2
+    applied = run_migrations(migrations=[_m(2, calls), _m(3, calls)])
+    assert [m.version for m in applied] == [3] and calls == [3]
+
+
+def test_failed_migration_rolls_back_and_stops(fake_db):
+    calls = []
+    with pytest.raises(RuntimeError):
+        run_migrations(migrations=[_m(2, calls), _m(3, calls, fail=True), _m(4, calls)])
+    assert calls == [2] and set(fake_db.applied) == {1, 2}
+    assert fake_db.rollbacks == 1 and not fake_db.locked
@@ -0,0 +1,68 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from mypage.service import mypage as service
+from util.pagination import MAX_PAGE_SIZE, InvalidCursor, decode_cursor, encode_cursor, page_size, paginate
+
+pytestmark = pytest.mark.asyncio
+
+T0 = datetime(2026, 10, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+USER = uuid.uuid4()
+
+
+async def test_cursor_round_trips_datetime_and_uuid():
+    pid = uuid.uuid4()
+    cursor = encode_cursor(T0, pid)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, datetime.fromisoformat, uuid.UUID) == (T0, pid)
+    assert decode_cursor(None, float) is None and decode_cursor("", float) is None
+
+
+@pytest.mark.parametrize("bad", ["not-a-cursor", encode_cursor(1.0), encode_cursor("x", "y"), encode_cursor(1.0, "nope")])
+async def test_bad_cursor_raises_invalid_cursor(bad):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(bad, float, uuid.UUID)
+
+
+async def test_page_size_is_bounded():
+    assert page_size(None) == 20
+    assert page_size(0) == 1 and page_size(5) == 5 and page_size(10_000) == MAX_PAGE_SIZE
+
+
+async def test_paginate_reads_one_extra_row():
+    rows = [(i, f"r{i}") for i in range(4)]
+    page, cursor = paginate(rows, 3, key=lambda r: (r[0], r[1]))
+    assert page == rows[:3] and decode_cursor(cursor, int, str) == (2, "r2")
+    assert paginate(rows[:3], 3, key=lambda r: r) == (rows[:3], None)
+    assert paginate([], 3, key=lambda r: r) == ([], None)
+
+
+@pytest.fixture
+def fake_plans(monkeypatch):
+    # plan 5개, 각 2개 항목. 최신순(created_at, id 내림차순)
+    plans = [(str(uuid.UUID(int=i)), T0 - timedelta(hours=i)) for i in range(5)]
+    calls = []
+
+    def get_plans(user_id, *, limit, after=None):
+        calls.append(after)
+        chosen = [p for p in plans if after is None or (p[1], uuid.UUID(p[0])) < after][:limit]
+        return [
+            (pid, "2026-10-01", "2026-10-02", f"todo{j}", "장소", f"2026-10-01 0{j}:00", at)
+            for pid, at in chosen for j in range(2)
+        ]
+
+    monkeypatch.setattr(service.repository, "get_plans", get_plans)
+    return calls
+
+
+async def test_plans_are_grouped_and_paged_by_plan(fake_plans):
+    first = service.get_plans(USER, limit=2)
+    assert [p.plan_id.int for p in first["plans"]] == [0, 1]
+    assert all(len(p.plan) == 2 for p in first["plans"])
+    second = service.get_plans(USER, limit=2, cursor=first["next_cursor"])
+    assert [p.plan_id.int for p in second["plans"]] == [2, 3]
+    assert fake_plans[1] == (T0 - timedelta(hours=1), uuid.UUID(int=1))
+    last = service.get_plans(USER, limit=2, cursor=second["next_cursor"])
+    assert [p.plan_id.int for p in last["plans"]] == [4] and last["next_cursor"] is None
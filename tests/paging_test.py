@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+import pytest
+
+from rag.paging import paginate, paginate_concurrent
+
+pytestmark = pytest.mark.asyncio
+
+
+def _fake_fetch(total=95, delay=0.05, calls=None):
+    async def fetch(params):
+        page = params["page_no"]
+        rows = params.get("num_of_rows", 10)
+        if calls is not None:
+            calls.append(page)
+        # 뒤 페이지가 먼저 끝나도 순서가 유지되는지 확인하기 위해 지연을 역순으로
+        await asyncio.sleep(delay / page)
+        return {"response": {"body": {"totalCount": total, "pageNo": page, "numOfRows": rows,
+                                      "items": {"item": [{"page": page}]}}}}
+    return fetch
+
+
+async def test_concurrent_pages_arrive_in_order_and_respect_max_pages():
+    calls = []
+    pages = [p async for p in paginate_concurrent(_fake_fetch(calls=calls), {"num_of_rows": 10}, max_pages=6, window=3)]
+    assert [p["response"]["body"]["pageNo"] for p in pages] == [1, 2, 3, 4, 5, 6]
+    assert sorted(calls) == [1, 2, 3, 4, 5, 6]
+
+
+async def test_concurrent_matches_sequential_and_stops_at_total():
+    seq = [p async for p in paginate(_fake_fetch(total=25, delay=0), {"num_of_rows": 10}, max_pages=10)]
+    conc = [p async for p in paginate_concurrent(_fake_fetch(total=25, delay=0), {"num_of_rows": 10}, max_pages=10)]
+    assert seq == conc
+    assert len(conc) == 3
+
+
+async def test_concurrent_is_faster_than_sequential():
+    start = time.monotonic()
+    async for _ in paginate(_fake_fetch(delay=0.2), {"num_of_rows": 10}, max_pages=5):
+        pass
+    sequential = time.monotonic() - start
+    start = time.monotonic()
+    async for _ in paginate_concurrent(_fake_fetch(delay=0.2), {"num_of_rows": 10}, max_pages=5, window=4):
+        pass
+    concurrent = time.monotonic() - start
+    assert concurrent < sequential
+
+
+async def test_early_close_waits_for_cancelled_pages():
+    started, finished = [], []
+
+    async def fetch(params):
+        page = params["page_no"]
+        started.append(page)
+        try:
+            if page > 2:
+                await asyncio.sleep(10)
+            return {"response": {"body": {"totalCount": 100, "pageNo": page, "numOfRows": 10}}}
+        finally:
+            finished.append(page)
+
+    gen = paginate_concurrent(fetch, {"num_of_rows": 10}, max_pages=5, window=3)
+    await gen.__anext__()
+    await gen.__anext__()
+    await gen.aclose()
+    # aclose가 돌아왔을 때 남은 요청(3, 4)은 취소 처리까지 끝나 있다
+    assert sorted(started) == [1, 2, 3, 4] and sorted(finished) == [1, 2, 3, 4]
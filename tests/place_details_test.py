@@ -0,0 +1,107 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from locations.service import place as place_module
+from locations.service.place import PlaceService
+
+pytestmark = pytest.mark.asyncio
+
+PID = uuid.uuid4()
+
+
+class FakeRepo:
+    def __init__(self):
+        self.updates = []
+        self.created = []
+
+    async def update_details(self, place_id, details):
+        self.updates.append((place_id, details))
+        return None
+
+    async def get_place_by_name(self, name):
+        return None
+
+    async def get_place_by_address(self, address):
+        return None
+
+    async def create_place(self, **kw):
+        self.created.append(kw)
+        return {}
+
+
+class FakeKakao:
+    def __init__(self, doc=None, error=None, delay=0.0):
+        self.doc, self.error, self.delay = doc, error, delay
+
+    async def search_keyword_first(self, keyword):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.doc
+
+
+class FakeTour:
+    def __init__(self, image="", error=None):
+        self.image, self.error = image, error
+
+    async def get_search_keyword(self, **kw):
+        if self.error:
+            raise self.error
+        item = {"firstimage": self.image} if self.image else {}
+        return {"response": {"body": {"items": {"item": [item] if item else []}}}}
+
+
+def _service(monkeypatch, kakao, tour, call_timeout=1.0):
+    monkeypatch.setattr(place_module, "get_jwt_config", lambda: None)
+    svc = PlaceService(tour=tour, kakao=kakao)
+    svc.repo = FakeRepo()
+    svc.call_timeout = call_timeout
+    return svc
+
+
+def _stale():
+    return {"place_id": str(PID), "name": "경복궁", "fetched_at": None}
+
+
+KAKAO_DOC = {"place_name": "경복궁", "x": "126.97", "y": "37.57"}
+
+
+async def test_complete_lookup_is_persisted_even_when_empty(monkeypatch):
+    svc = _service(monkeypatch, FakeKakao(doc=None), FakeTour(image=""))
+    await svc._ensure_details(_stale())
+    # 정상적인 '결과 없음'은 저장(fetched_at 갱신)해 매 요청 재조회하지 않는다
+    assert svc.repo.updates == [(PID, {"latitude": None, "longitude": None, "image_url": None})]
+
+
+@pytest.mark.parametrize("kakao, tour, got", [
+    (FakeKakao(error=RuntimeError("kakao down")), FakeTour(image="http://img"), {"image": "http://img"}),
+    (FakeKakao(doc=KAKAO_DOC, delay=0.5), FakeTour(image="http://img"), {"image": "http://img"}),
+    (FakeKakao(doc=KAKAO_DOC), FakeTour(error=RuntimeError("tour down")), {"latitude": 37.57, "longitude": 126.97}),
+])
+async def test_failed_or_timed_out_lookup_is_not_persisted(monkeypatch, kakao, tour, got):
+    svc = _service(monkeypatch, kakao, tour, call_timeout=0.05)
+    merged = await svc._ensure_details(_stale())
+    assert svc.repo.updates == []
+    # 받은 값은 이번 응답에만 반영, fetched_at은 그대로여서 다음 요청에서 다시 조회
+    assert merged["fetched_at"] is None
+    assert {k: merged.get(k) for k in got} == got
+
+
+async def test_fresh_place_skips_lookup(monkeypatch):
+    svc = _service(monkeypatch, FakeKakao(error=AssertionError("called")), FakeTour(error=AssertionError("called")))
+    fresh = dict(_stale(), fetched_at=datetime.now(timezone.utc))
+    assert await svc._ensure_details(fresh) is fresh and svc.repo.updates == []
+
+
+async def test_new_place_without_image_lookup_leaves_fetched_at_empty(monkeypatch):
+    svc = _service(monkeypatch, FakeKakao(doc=KAKAO_DOC), FakeTour(error=RuntimeError("tour down")))
+    await svc.get_or_create_place("경복궁")
+    assert svc.repo.created[0]["fetched"] is False
+    assert svc.repo.created[0]["details"]["latitude"] == 37.57
+
+    svc = _service(monkeypatch, FakeKakao(doc=KAKAO_DOC), FakeTour(image=""))
+    await svc.get_or_create_place("경복궁")
+    assert svc.repo.created[0]["fetched"] is True
@@ -0,0 +1,202 @@
+"""
+리포지토리 쿼리 실행 계획 회귀 테스트.
+TEST_DATABASE_URL(비워도 되는 로컬 Postgres)에 마이그레이션을 적용하고 실제 규모에 가깝게 채운 뒤,
+각 리포지토리 함수가 보내는 SQL을 EXPLAIN (FORMAT JSON)으로 바꿔 Seq Scan이 없는지 확인한다.
+주의: 대상 DB의 테이블을 TRUNCATE한다.
+"""
+import hashlib
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from uuid import UUID
+
+import psycopg2
+import pytest
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.skipif(not os.getenv("TEST_DATABASE_URL"), reason="TEST_DATABASE_URL not set"),
+]
+
+SEED_SQL = """
+TRUNCATE "user", interest, plan, plan_item, board, "like", place, place_bookmark, rating CASCADE;
+
+INSERT INTO "user" (id, username, profile, password)
+SELECT md5('u' || g)::uuid, 'user' || g, '', '' FROM generate_series(1, 5000) g;
+
+INSERT INTO interest (user_id, interest)
+SELECT md5('u' || (g % 5000 + 1))::uuid, 'interest' || (g % 30) FROM generate_series(1, 15000) g;
+
+INSERT INTO place (place_id, name, address)
+SELECT md5('p' || g)::uuid, '장소 ' || g, '서울시 어딘가 ' || g || '번길' FROM generate_series(1, 50000) g;
+
+INSERT INTO place_bookmark (bookmark_id, user_id, place_id)
+SELECT md5('pb' || g)::uuid, md5('u' || (g % 5000 + 1))::uuid, md5('p' || ((g * 7919) % 50000 + 1))::uuid
+FROM generate_series(1, 200000) g
+ON CONFLICT DO NOTHING;
+
+INSERT INTO rating (rating_id, user_id, place_id, score)
+SELECT md5('r' || g)::uuid, md5('u' || (g % 5000 + 1))::uuid, md5('p' || ((g * 104729) % 50000 + 1))::uuid, g % 5 + 1
+FROM generate_series(1, 100000) g
+ON CONFLICT DO NOTHING;
+
+INSERT INTO plan (id, start_date, end_date, private, author)
+SELECT md5('pl' || g)::uuid, now(), now(), g % 2 = 0, md5('u' || (g % 5000 + 1))::uuid
+FROM generate_series(1, 10000) g;
+
+INSERT INTO plan_item (id, plan_id, todo, place, time)
+SELECT md5('pi' || g)::uuid, md5('pl' || (g % 10000 + 1))::uuid, 'todo' || g, '장소 ' || g, now()
+FROM generate_series(1, 50000) g;
+
+INSERT INTO board (id, author, likes, title, content, plan_id)
+SELECT md5('b' || g)::uuid, md5('u' || (g % 5000 + 1))::uuid, 0, '제목 ' || g, '내용', md5('pl' || (g % 10000 + 1))::uuid
+FROM generate_series(1, 20000) g;
+
+INSERT INTO "like" (id, user_id, board_id)
+SELECT md5('l' || g)::uuid, md5('u' || (g % 5000 + 1))::uuid, md5('b' || ((g * 31) % 20000 + 1))::uuid
+FROM generate_series(1, 100000) g
+ON CONFLICT DO NOTHING;
+
+ANALYZE;
+"""
+
+
+def _md5_uuid(s: str) -> UUID:
+    return UUID(hashlib.md5(s.encode()).hexdigest())
+
+
+USER_ID = _md5_uuid("u42")
+PLACE_ID = _md5_uuid("p4242")
+PLAN_ID = _md5_uuid("pl42")
+BOARD_ID = _md5_uuid("b42")
+AFTER_AT = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+class _Explained(Exception):
+    """첫 쿼리의 계획만 필요하므로 execute 직후 함수 실행을 끊는다"""
+
+
+class ExplainingCursor:
+    def __init__(self, cur, plans):
+        self._cur = cur
+        self._plans = plans
+
+    def execute(self, sql, params=None):
+        self._cur.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+        self._plans.append(self._cur.fetchone()[0][0]["Plan"])
+        raise _Explained()
+
+
+def _node_types(plan):
+    yield plan["Node Type"]
+    for child in plan.get("Plans", []):
+        yield from _node_types(child)
+
+
+@pytest.fixture(scope="module")
+def seeded_con():
+    from util.db_pool import close_pool
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATABASE_URL", os.environ["TEST_DATABASE_URL"])
+        close_pool()
+        try:
+            from migrations import run_migrations
+            run_migrations()
+        finally:
+            close_pool()
+    con = psycopg2.connect(os.environ["TEST_DATABASE_URL"])
+    con.autocommit = True
+    with con.cursor() as cur:
+        cur.execute(SEED_SQL)
+    yield con
+    con.close()
+
+
+@pytest.fixture
+def explain(seeded_con, monkeypatch):
+    import board.repository.document
+    import board.repository.like
+    import locations.repository.place
+    import locations.repository.place_bookmark
+    import locations.repository.rating
+    import mypage.repository.mypage
+    import plan.repository.plan
+    import user.repository.interest
+
+    plans = []
+
+    @contextmanager
+    def db_cursor():
+        with seeded_con.cursor() as cur:
+            yield seeded_con, ExplainingCursor(cur, plans)
+
+    for module in (
+        board.repository.document, board.repository.like,
+        locations.repository.place, locations.repository.place_bookmark, locations.repository.rating,
+        mypage.repository.mypage, plan.repository.plan, user.repository.interest,
+    ):
+        monkeypatch.setattr(module, "db_cursor", db_cursor)
+
+    def run(fn):
+        with pytest.raises(_Explained):
+            fn()
+        return plans.pop()
+
+    return run
+
+
+def _queries():
+    from board.repository import document, like
+    from locations.repository.place import PlaceRepository
+    from locations.repository.place_bookmark import BookmarkRepository
+    from locations.repository.rating import RatingRepository
+    from mypage.repository import mypage
+    from plan.repository.plan import PlanRepository
+    from user.repository import interest
+
+    places = PlaceRepository()
+    bookmarks = BookmarkRepository()
+    return {
+        "place.get_place": lambda: places.get_place(PLACE_ID),
+        "place.get_place_by_name": lambda: places.get_place_by_name("장소 4242"),
+        "place.get_place_by_address": lambda: places.get_place_by_address("서울시 어딘가 4242번길"),
+        "place.find_places_bulk": lambda: places.find_places_bulk([("서울시 어딘가 1번길", "장소 1"), ("서울시 어딘가 2번길", "장소 2")]),
+        "bookmark.list_user_bookmarks": lambda: bookmarks.list_user_bookmarks(USER_ID),
+        "bookmark.has_bookmark": lambda: bookmarks.has_bookmark(user_id=USER_ID, place_id=PLACE_ID),
+        "bookmark.bookmarked_place_ids": lambda: bookmarks.bookmarked_place_ids(USER_ID, [PLACE_ID]),
+        "rating.get_rating_by_place_id": lambda: RatingRepository().get_rating_by_place_id(PLACE_ID),
+        "interest.get_interests_by_user_id": lambda: interest.get_interests_by_user_id(USER_ID),
+        "plan.get_plan_by_id": lambda: PlanRepository().get_plan_by_id(PLAN_ID),
+        "mypage.get_plans": lambda: mypage.get_plans(USER_ID, limit=21),
+        "mypage.get_bookmark_place": lambda: mypage.get_bookmark_place(USER_ID, limit=21),
+        "mypage.get_bookmark_place.after": lambda: mypage.get_bookmark_place(USER_ID, limit=21, after=(AFTER_AT, PLACE_ID)),
+        "mypage.get_like_boards": lambda: mypage.get_like_boards(USER_ID, limit=21),
+        "board.get_all_boards": lambda: document.get_all_boards(USER_ID, limit=21),
+        "board.get_all_boards.after": lambda: document.get_all_boards(USER_ID, limit=21, after=(AFTER_AT, BOARD_ID)),
+        "board.get_board_details": lambda: document.get_board_details(BOARD_ID, USER_ID),
+        "board.get_plan_by_id": lambda: document.get_plan_by_id(PLAN_ID),
+        "board.delete_like_board": lambda: like.delete_like_board(BOARD_ID, USER_ID),
+        "board.search_boards": lambda: document.search_boards("제목 12345", USER_ID, limit=20),
+    }
+
+
+@pytest.mark.parametrize("name", sorted(_queries()))
+async def test_repository_query_uses_index(explain, name):
+    plan = explain(_queries()[name])
+    nodes = list(_node_types(plan))
+    assert "Seq Scan" not in nodes, f"{name}: {nodes}"
+
+
+# 애플리케이션 쿼리는 없지만 ON DELETE CASCADE/FK 검사가 타는 조회
+@pytest.mark.parametrize("sql", [
+    "SELECT 1 FROM rating WHERE place_id = %s;",
+    'SELECT 1 FROM "like" WHERE board_id = %s;',
+    "SELECT 1 FROM plan_item WHERE plan_id = %s;",
+    "SELECT 1 FROM plan WHERE author = %s;",
+])
+async def test_foreign_key_lookup_uses_index(seeded_con, sql):
+    with seeded_con.cursor() as cur:
+        cur.execute("EXPLAIN (FORMAT JSON) " + sql, (str(PLACE_ID),))
+        nodes = list(_node_types(cur.fetchone()[0][0]["Plan"]))
+    assert "Seq Scan" not in nodes, f"{sql}: {nodes}"
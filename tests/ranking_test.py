@@ -0,0 +1,144 @@
+import random
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from locations.controller import locations as controller
+from locations.model.request.request import RecommendRequest
+from locations.service.ranking import RankWeights, decode_cursor, encode_cursor, score, top_k
+from locations.service.recommend_cache import RecommendCache
+from util.pagination import InvalidCursor
+
+pytestmark = pytest.mark.asyncio
+
+
+def _scored(n=200, seed=5):
+    rng = random.Random(seed)
+    w = RankWeights()
+    items = [
+        {
+            "id": f"p{i}",
+            "distance_m": rng.uniform(0, 10_000),
+            "rating": rng.uniform(0, 5),
+            "bookmark_cnt": rng.randint(0, 2_000),
+            "recent_bookmarks": rng.randint(0, 30),
+        }
+        for i in range(n)
+    ]
+    keys = [
+        (score(w, distance_m=it["distance_m"], rating=it["rating"],
+               bookmark_cnt=it["bookmark_cnt"], recent_bookmarks=it["recent_bookmarks"]), it["id"])
+        for it in items
+    ]
+    return items, keys
+
+
+async def test_score_signals_move_in_expected_direction():
+    w = RankWeights()
+    base = dict(distance_m=1_000, rating=3.0, bookmark_cnt=10, recent_bookmarks=1)
+    s = score(w, **base)
+    assert score(w, **dict(base, distance_m=5_000)) < s
+    assert score(w, **dict(base, rating=4.5)) > s
+    assert score(w, **dict(base, bookmark_cnt=500)) > s
+    assert score(w, **dict(base, recent_bookmarks=10)) > s
+    only_distance = RankWeights(distance=1, rating=0, bookmark=0, velocity=0)
+    assert score(only_distance, **dict(base, distance_m=3_000)) == pytest.approx(0.5)
+
+
+async def test_cursor_pages_match_full_sort():
+    items, keys = _scored()
+    expected = [items[i]["id"] for i in sorted(range(len(items)), key=lambda i: keys[i], reverse=True)]
+    seen, after = [], None
+    while True:
+        page, after = top_k(items, keys, 30, after)
+        seen += [it["id"] for it in page]
+        if after is None:
+            break
+    assert seen == expected
+
+
+async def test_last_page_has_no_cursor_and_bad_cursor_rejected():
+    items, keys = _scored(5)
+    page, after = top_k(items, keys, 5)
+    assert len(page) == 5 and after is None
+    with pytest.raises(InvalidCursor):
+        decode_cursor("not-a-cursor")
+
+
+async def test_cursor_carries_ranking_origin():
+    key, origin = (0.731, "2733967"), (37.5665, 126.978)
+    assert decode_cursor(encode_cursor(key, origin)) == (key, origin)
+
+
+class _FakeTour:
+    def __init__(self, items):
+        self.items = items
+
+    async def get_location_based_list(self, **query):
+        return {"response": {"body": {"items": {"item": self.items}}}}
+
+
+class _FakePlaces:
+    """같은 이름의 두 TourAPI 항목은 같은 place로 해석된다"""
+    async def resolve_or_create_places(self, pairs, details):
+        return [
+            {"place_id": str(uuid.uuid5(uuid.NAMESPACE_URL, name)), "overall_rating": 4.0, "overall_bookmark": 3,
+             "address": addr, "fetched_at": datetime.now(timezone.utc)}
+            for addr, name in pairs
+        ]
+
+    async def update_details_bulk(self, rows):
+        pass
+
+
+class _NoMirror:
+    def __init__(self, repo):
+        pass
+
+    async def location_based_list(self, **query):
+        return None
+
+
+async def test_recommend_pages_are_unique_when_user_moves(monkeypatch):
+    from locations.service import locations
+
+    items = [
+        {"title": f"p{i // 2 if i < 2 else i}", "firstimage": "img", "addr1": "addr", "contentid": str(1000 + i),
+         "mapy": 37.5665 + i * 1e-3, "mapx": 126.978}
+        for i in range(12)
+    ]
+    monkeypatch.setattr(locations, "AsyncPlaceRepository", _FakePlaces)
+    monkeypatch.setattr(locations, "CatalogMirror", _NoMirror)
+    monkeypatch.setattr(locations, "AsyncTourItemRepository", lambda: None)
+    monkeypatch.setattr(locations, "get_recommend_cache", lambda cache=RecommendCache(): cache)
+
+    client = _FakeTour(items)
+    seen, cursor = [], None
+    lat, lon = 37.5665, 126.978
+    while True:
+        resp = await locations.recommend(12, lon, lat, client=client, limit=3, cursor=cursor)
+        seen += [it.place_id for it in resp.items]
+        cursor = resp.next_cursor
+        # 페이지 사이에 사용자가 이동해도 같은 기준 좌표로 이어서 순위를 매긴다
+        lat += 2e-4
+        if cursor is None:
+            break
+    # contentid 1000/1001은 같은 place로 해석되어 한 번만
+    assert len(seen) == len(set(seen)) == 11
+
+
+@pytest.mark.parametrize("error, status", [
+    (InvalidCursor("유효하지 않은 cursor입니다."), 400),
+    (ValueError("could not convert string to float: 'x'"), 500),
+])
+async def test_only_invalid_cursor_becomes_bad_request(monkeypatch, error, status):
+    async def recommend(*args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(controller, "recommend", recommend)
+    req = RecommendRequest(type="관광지", origin={"longitude": 126.978, "latitude": 37.5665}, cursor="x")
+    with pytest.raises(HTTPException) as exc:
+        await controller.locations(req=req, credentials=None, tour=None)
+    assert exc.value.status_code == status
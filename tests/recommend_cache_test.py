@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from locations.service.recommend_cache import Degraded, RecommendCache
+from util.geo_distance import distance_m
+
+pytestmark = pytest.mark.asyncio
+
+
+def _builder(calls):
+    async def build(lat, lon, radius):
+        calls.append((lat, lon, radius))
+        await asyncio.sleep(0.01)
+        return [{"place_name": "p", "latitude": lat, "longitude": lon}]
+    return build
+
+
+async def test_nearby_requests_share_one_build():
+    cache = RecommendCache(precision=6)
+    calls = []
+    build = _builder(calls)
+    # 같은 셀 안에서 약 50m 떨어진 두 사용자 + 동시 요청
+    a, b = await asyncio.gather(
+        cache.candidates(12, 37.56650, 126.97800, 10_000, build),
+        cache.candidates(12, 37.56690, 126.97810, 10_000, build),
+    )
+    assert a is b and len(calls) == 1
+    await cache.candidates(12, 37.56650, 126.97800, 10_000, build)
+    assert len(calls) == 1
+    # 다른 콘텐츠 타입은 별도 키
+    await cache.candidates(39, 37.56650, 126.97800, 10_000, build)
+    assert len(calls) == 2
+
+
+async def test_search_radius_covers_every_point_in_cell():
+    cache = RecommendCache(precision=6)
+    lat, lon = 37.5665, 126.9780
+    cell, c_lat, c_lon, search = cache.cell_query(lat, lon, 10_000)
+    assert search > 10_000
+    # 요청 위치에서 반경 안인 점은 셀 중심 기준 조회 반경에도 들어간다
+    assert distance_m(c_lat, c_lon, lat, lon) + 10_000 <= search
+
+
+async def test_disabled_cache_builds_from_exact_origin():
+    cache = RecommendCache(ttl_seconds=0)
+    calls = []
+    await cache.candidates(12, 37.5665, 126.9780, 10_000, _builder(calls))
+    await cache.candidates(12, 37.5665, 126.9780, 10_000, _builder(calls))
+    assert calls == [(37.5665, 126.9780, 10_000)] * 2
+
+
+async def test_degraded_build_is_shared_but_not_cached():
+    cache = RecommendCache(precision=6)
+    calls = []
+
+    async def build(lat, lon, radius):
+        calls.append(radius)
+        await asyncio.sleep(0.01)
+        # 첫 빌드는 place 해석 실패로 보강이 빠진 결과
+        if len(calls) == 1:
+            return Degraded([{"place_id": None}])
+        return [{"place_id": "p1"}]
+
+    a, b = await asyncio.gather(
+        cache.candidates(12, 37.5665, 126.9780, 10_000, build),
+        cache.candidates(12, 37.5665, 126.9780, 10_000, build),
+    )
+    assert a is b and len(calls) == 1
+    # 실패한 목록은 캐시에 남지 않아 다음 요청이 다시 빌드하고, 정상 결과는 캐시된다
+    assert await cache.candidates(12, 37.5665, 126.9780, 10_000, build) == [{"place_id": "p1"}]
+    await cache.candidates(12, 37.5665, 126.9780, 10_000, build)
+    assert len(calls) == 2 and cache.stats()["degraded"] == 1
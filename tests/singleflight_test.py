@@ -0,0 +1,74 @@
+import asyncio
+
+import httpx
+import pytest
+
+from tourapi.client import TourAPIClient, BASE_URL
+from util.singleflight import SingleFlight
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_concurrent_identical_calls_share_one_execution():
+    sf = SingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.02)
+        return {"ok": True}
+
+    results = await asyncio.gather(*(sf.do("k", work) for _ in range(5)))
+    assert all(r == {"ok": True} for r in results)
+    assert len(runs) == 1
+    assert sf.stats() == {"calls": 1, "coalesced": 4, "inflight": 0}
+
+    # 완료 후에는 다시 실행 (캐시 아님)
+    await sf.do("k", work)
+    assert len(runs) == 2
+
+
+async def test_errors_are_shared_and_not_remembered():
+    sf = SingleFlight()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("down")
+
+    results = await asyncio.gather(sf.do("k", boom), sf.do("k", boom), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(sf) == 0
+
+
+async def test_cancelled_leader_does_not_cancel_followers():
+    sf = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.03)
+        return 42
+
+    leader = asyncio.ensure_future(sf.do("k", work))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(sf.do("k", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == 42
+
+
+async def test_tourapi_identical_requests_are_coalesced():
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"response": {"header": {"resultCode": "0000", "resultMsg": "OK"}, "body": {}}})
+
+    c = TourAPIClient("test-key")
+    c.client = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+    await asyncio.gather(
+        *(c.get_search_keyword(keyword="경복궁", arrange="Q", num_of_rows=1, page_no=1) for _ in range(3)),
+        c.get_search_keyword(keyword="창덕궁", arrange="Q", num_of_rows=1, page_no=1),
+    )
+    assert len(calls) == 2
+    assert c.stats()["singleflight"]["coalesced"] == 2
+    await c.close()
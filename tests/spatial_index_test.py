@@ -0,0 +1,115 @@
+import asyncio
+import random
+import threading
+from datetime import datetime, timezone
+
+import pytest
+from haversine import haversine, Unit
+
+from catalog.items import TOUR_ITEM_COLUMNS
+from catalog.service import spatial
+from util import geohash
+from util.spatial_index import GeoGridIndex
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_geohash_known_vector_and_roundtrip():
+    assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    lat, lon = geohash.decode(geohash.encode(37.5665, 126.9780, 9))
+    assert abs(lat - 37.5665) < 1e-4 and abs(lon - 126.9780) < 1e-4
+
+
+def _random_index(n=3000, seed=7):
+    rng = random.Random(seed)
+    idx = GeoGridIndex(precision=5)
+    pts = {}
+    for i in range(n):
+        lat, lon, t = rng.uniform(37.3, 37.8), rng.uniform(126.7, 127.3), rng.choice([12, 39])
+        idx.add(i, lat, lon, t)
+        pts[i] = (lat, lon, t)
+    return idx, pts
+
+
+async def test_radius_matches_brute_force():
+    idx, pts = _random_index()
+    origin = (37.5665, 126.9780)
+    got = [i for _, i in idx.radius(*origin, 3000, 12)]
+    want = sorted(
+        (haversine(origin, (lat, lon), unit=Unit.METERS), i)
+        for i, (lat, lon, t) in pts.items() if t == 12
+    )
+    want = [i for d, i in want if d <= 3000]
+    assert got == want and got
+
+
+async def test_nearest_matches_brute_force_and_handles_updates():
+    idx, pts = _random_index()
+    origin = (37.5, 127.0)
+    want = sorted((haversine(origin, (lat, lon), unit=Unit.METERS), i) for i, (lat, lon, t) in pts.items())[:5]
+    assert [i for _, i in idx.nearest(*origin, 5)] == [i for _, i in want]
+
+    nearest_id = want[0][1]
+    assert idx.remove(nearest_id)
+    assert nearest_id not in [i for _, i in idx.nearest(*origin, 5)]
+    idx.add("moved", origin[0], origin[1], 39, payload={"title": "x"})
+    assert idx.nearest(*origin, 1, 39)[0][1] == "moved"
+    assert idx.payload("moved") == {"title": "x"}
+    assert len(idx) == len(pts)
+
+
+class _FakeCatalogRepo:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetch_since(self, since=None):
+        return list(self.rows)
+
+
+def _catalog_row(content_id, lat, lon, synced_at):
+    row = [None] * (len(TOUR_ITEM_COLUMNS) + 1)
+    row[TOUR_ITEM_COLUMNS.index("content_id")] = content_id
+    row[TOUR_ITEM_COLUMNS.index("content_type_id")] = 12
+    row[TOUR_ITEM_COLUMNS.index("latitude")] = lat
+    row[TOUR_ITEM_COLUMNS.index("longitude")] = lon
+    row[-1] = synced_at
+    return tuple(row)
+
+
+async def test_loader_rebuilds_off_loop_and_refreshes_in_chunks(monkeypatch):
+    monkeypatch.setattr(spatial, "_index", None)
+    monkeypatch.setattr(spatial, "_REFRESH_CHUNK", 2)
+    at = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    repo = _FakeCatalogRepo([_catalog_row(str(i), 37.5 + i * 1e-3, 127.0, at) for i in range(5)])
+    loader = spatial.SpatialIndexLoader(repo)
+
+    threads, chunks = [], []
+    apply = loader._apply
+
+    def recording_apply(index, rows):
+        threads.append(threading.get_ident())
+        chunks.append(len(rows))
+        apply(index, rows)
+
+    loader._apply = recording_apply
+    built = await loader.rebuild()
+    # 전체 재적재는 스레드에서 새 인덱스를 채운 뒤 교체
+    assert threads[0] != threading.get_ident()
+    assert spatial.get_spatial_index() is built and len(built) == 5
+
+    # 증분 갱신은 루프에서 청크 단위로, 청크 사이에 다른 태스크가 돈다
+    ticks = []
+    stop = False
+
+    async def ticker():
+        while not stop:
+            ticks.append(len(chunks))
+            await asyncio.sleep(0)
+
+    t = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    await loader.refresh()
+    stop = True
+    await t
+    assert chunks[1:] == [2, 2, 1] and all(tid == threading.get_ident() for tid in threads[1:])
+    assert {2, 3} <= set(ticks)
@@ -0,0 +1,75 @@
+import httpx
+import pytest
+
+from tourapi.client import TourAPIClient, BASE_URL
+from util.cache import BoundedTTLCache
+
+pytestmark = pytest.mark.asyncio
+
+OK = {"response": {"header": {"resultCode": "0000", "resultMsg": "OK"}, "body": {"items": {"item": []}}}}
+
+
+def _client(handler, **kw):
+    c = TourAPIClient("test-key", **kw)
+    c.client = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+    return c
+
+
+async def test_cached_endpoints_skip_the_network_but_sync_list_does_not():
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(200, json=OK)
+
+    c = _client(handler, cache_size=16)
+    for _ in range(3):
+        await c.get_areacode(area_code=1)
+        await c.get_detail_common(content_id=126508)
+        await c.get_area_based_sync_list(num_of_rows=10, page_no=1)
+    assert paths.count("areaCode2") == 1
+    assert paths.count("detailCommon2") == 1
+    assert paths.count("areaBasedSyncList2") == 3
+    stats = c.stats()["cache"]
+    assert stats["hits"] == 4 and stats["entries"] == 2 and stats["bytes"] > 0
+    await c.close()
+
+
+async def test_cache_is_disabled_by_default():
+    calls = []
+
+    def handler(request):
+        calls.append(1)
+        return httpx.Response(200, json=OK)
+
+    c = _client(handler)
+    await c.get_areacode()
+    await c.get_areacode()
+    assert len(calls) == 2 and c.stats()["cache"] is None
+    await c.close()
+
+
+async def test_errors_are_not_cached():
+    status = {"code": 500}
+
+    def handler(request):
+        return httpx.Response(status["code"], json=OK)
+
+    c = _client(handler, cache_size=16)
+    with pytest.raises(httpx.HTTPStatusError):
+        await c.get_areacode()
+    status["code"] = 200
+    assert await c.get_areacode() == OK
+    await c.close()
+
+
+async def test_max_bytes_evicts_least_recently_used():
+    cache = BoundedTTLCache(max_entries=10, max_bytes=100)
+    cache.set("a", 1, size=40)
+    cache.set("b", 2, size=40)
+    cache.get("a")
+    cache.set("c", 3, size=40)
+    assert set(cache._data) == {"a", "c"}
+    assert cache.stats()["bytes"] == 80
+    cache.set("huge", 4, size=1000)
+    assert "huge" not in cache._data
@@ -0,0 +1,112 @@
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+
+from locations.repository import trend_async
+from locations.service.trend import TrendRefresher, TrendStore, trending_near
+
+pytestmark = pytest.mark.asyncio
+
+
+def _row(pid, b24, b7d, r24=0, r7d=0, score=0.0, **extra):
+    return dict(place_id=pid, bookmarks_24h=b24, bookmarks_7d=b7d, ratings_24h=r24, ratings_7d=r7d, score=score, **extra)
+
+
+class FakeTrendRepo:
+    def __init__(self, rows):
+        self.rows = rows
+        self.refreshes = 0
+        self.prunes = 0
+        self.bbox_calls = 0
+
+    async def refresh(self):
+        self.refreshes += 1
+        return len(self.rows)
+
+    async def prune(self, keep_days=8):
+        self.prunes += 1
+        return 0
+
+    async def load_all(self):
+        return self.rows
+
+    async def trending_in_bbox(self, *, min_lat, max_lat, min_lon, max_lon, limit, after=None):
+        self.bbox_calls += 1
+        inside = [r for r in self.rows if min_lat <= r["latitude"] <= max_lat and min_lon <= r["longitude"] <= max_lon]
+        inside.sort(key=lambda r: (-r["score"], str(r["place_id"])))
+        if after:
+            inside = [r for r in inside if (-r["score"], str(r["place_id"])) > (-after[0], str(after[1]))]
+        return inside[:limit]
+
+
+async def test_trending_needs_recent_spike_not_lifetime_total():
+    spike, steady, quiet = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    store = TrendStore(min_24h=3, ratio=2.0)
+    store.replace([
+        _row(spike, 6, 9),      # 이전 6일 일평균 0.5 → 급증
+        _row(steady, 4, 28),    # 매일 4개 꾸준 → 급증 아님
+        _row(quiet, 1, 1),      # 최소 건수 미달
+    ])
+    assert store.is_trending(spike) and store.is_trending(str(spike))
+    assert not store.is_trending(steady)
+    assert not store.is_trending(quiet)
+    assert not store.is_trending(uuid.uuid4()) and store.get(None) is None
+    assert store.get(steady).bookmarks_7d == 28
+
+
+async def test_refresher_replaces_snapshot_and_prunes_periodically():
+    pid = uuid.uuid4()
+    repo = FakeTrendRepo([_row(pid, 5, 5)])
+    store = TrendStore()
+    refresher = TrendRefresher(repo, store, prune_interval=3600)
+    await refresher.refresh()
+    await refresher.refresh()
+    assert repo.refreshes == 2 and repo.prunes == 1
+    assert store.get(pid).bookmarks_24h == 5
+    repo.rows = []
+    await refresher.refresh()
+    assert len(store) == 0
+
+
+async def test_trending_near_cuts_to_radius_in_score_order():
+    rows = [
+        _row(uuid.uuid4(), 5, 5, score=9.0, latitude=37.5665, longitude=126.9780),
+        _row(uuid.uuid4(), 5, 5, score=8.0, latitude=37.6000, longitude=126.9780),   # ≈3.7km
+        _row(uuid.uuid4(), 5, 5, score=7.0, latitude=37.6500, longitude=127.0500),   # 박스 모서리, 반경 밖
+    ]
+    out = await trending_near(FakeTrendRepo(rows), 37.5665, 126.9780, 8_000, limit=5)
+    assert [r["score"] for r in out] == [9.0, 8.0]
+    assert out[0]["distance"] == 0 and 3_000 < out[1]["distance"] < 4_500
+
+
+async def test_trending_near_keeps_reading_past_box_corners_until_limit():
+    # 점수 상위는 모두 박스 모서리(반경 밖), 반경 안 place는 그 뒤에 limit개 넘게 있다
+    corners = [_row(uuid.uuid4(), 5, 5, score=100.0 - i, latitude=37.6050, longitude=127.0250) for i in range(7)]
+    near = [_row(uuid.uuid4(), 5, 5, score=50.0 - i, latitude=37.5665 + i * 0.001, longitude=126.9780) for i in range(5)]
+    repo = FakeTrendRepo(corners + near)
+    out = await trending_near(repo, 37.5665, 126.9780, 5_000, limit=3)
+    assert [r["score"] for r in out] == [50.0, 49.0, 48.0]
+    assert repo.bbox_calls > 1
+    # 반경 안 전체가 limit보다 적으면 있는 만큼만
+    assert len(await trending_near(FakeTrendRepo(corners + near), 37.5665, 126.9780, 5_000, limit=20)) == 5
+
+
+async def test_refresh_clamps_windowed_sums_at_zero(monkeypatch):
+    seen = []
+
+    class _Con:
+        async def fetchval(self, sql, *args):
+            seen.append(sql)
+            return 0
+
+    @asynccontextmanager
+    async def async_connection():
+        yield _Con()
+
+    monkeypatch.setattr(trend_async, "async_connection", async_connection)
+    assert await trend_async.AsyncTrendRepository().refresh() == 0
+    # 창 이전 북마크의 해제(-1)만 창 안에 남아도 합계가 음수가 되지 않아야 한다
+    for column in ("b24", "b7d", "r24", "r7d"):
+        line = next(l for l in seen[0].splitlines() if l.strip().rstrip(",").endswith(f"AS {column}"))
+        assert line.strip().startswith("GREATEST("), line
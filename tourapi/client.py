@@ -1,6 +1,8 @@
-from httpx import AsyncClient
-from typing import Dict, Any, Optional
+from httpx import AsyncClient, Limits
+from typing import Dict, Any, Hashable, Optional, Tuple
 from httpx import Response
+from util.cache import BoundedTTLCache, MISSING
+from util.singleflight import SingleFlight
 from .exceptions import *
 
 BASE_URL = "http://apis.data.go.kr/B551011/KorService2"
@@ -13,16 +15,102 @@ def _push(d: Dict[str, Any], k: str, v: Any) -> None:
     if v is not None:
         d[k] = v
 
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# 엔드포인트별 응답 캐시 TTL(초). 목록에 없는 엔드포인트(areaBasedSyncList2 등)는 캐시하지 않는다.
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    # 코드 테이블: 거의 바뀌지 않음
+    "/areaCode2": 3 * DAY,
+    "/categoryCode2": 3 * DAY,
+    "/ldongCode2": 3 * DAY,
+    "/lclsSystmCode2": 3 * DAY,
+    # 상세 정보
+    "/detailCommon2": 6 * HOUR,
+    "/detailIntro2": 6 * HOUR,
+    "/detailInfo2": 6 * HOUR,
+    "/detailImage2": 6 * HOUR,
+    "/detailPetTour2": 6 * HOUR,
+    # 목록/검색
+    "/locationBasedList2": 10 * MINUTE,
+    "/areaBasedList2": 10 * MINUTE,
+    "/searchKeyword2": 10 * MINUTE,
+    "/searchFestival2": 10 * MINUTE,
+    "/searchStay2": 10 * MINUTE,
+}
+
+def request_key(path: str, params: Dict[str, Any]) -> Hashable:
+    """경로 + 정렬·문자열화한 파라미터 (serviceKey 등 고정값 제외)"""
+    return (path, tuple(sorted((k, str(v)) for k, v in params.items() if k != "serviceKey")))
+
 class TourAPIClient:
-    def __init__(self, api_key: str, app_name: str = "Nomadly", timeout: float = 10.0) -> None:
+    """
+    KorService2 비동기 클라이언트. 앱 전역에서 하나를 공유해 커넥션을 재사용한다.
+    - max_connections: 동시 커넥션 상한
+    - max_keepalive_connections: 유지할 keep-alive 커넥션 수
+    - keepalive_expiry: keep-alive 커넥션 유휴 만료(초)
+    - 동시에 들어온 동일 요청(경로 + 파라미터)은 SingleFlight로 한 번만 호출
+    - cache_size > 0이면 성공 응답을 엔드포인트별 TTL(cache_ttls)로 LRU 캐시
+      (cache_max_bytes: 응답 본문 크기 합 상한)
+    - 캐시/SingleFlight로 반환되는 dict는 여러 호출부가 공유하므로 수정하지 않는다
+    """
+    def __init__(
+        self,
+        api_key: str,
+        app_name: str = "Nomadly",
+        timeout: float = 10.0,
+        *,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        cache_size: int = 0,
+        cache_max_bytes: Optional[int] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
         self.api_key = api_key
         self.app_name = app_name
-        self.client = AsyncClient(base_url=BASE_URL, timeout=timeout)
+        self.client = AsyncClient(
+            base_url=BASE_URL,
+            timeout=timeout,
+            limits=Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        self.inflight = SingleFlight()
+        self.cache_ttls = dict(DEFAULT_CACHE_TTLS if cache_ttls is None else cache_ttls)
+        self.cache: Optional[BoundedTTLCache] = (
+            BoundedTTLCache(max_entries=cache_size, max_bytes=cache_max_bytes) if cache_size > 0 else None
+        )
 
     async def close(self) -> None:
         await self.client.aclose()
 
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "singleflight": self.inflight.stats(),
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
     async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        key = request_key(path, params)
+        ttl = self.cache_ttls.get(path) if self.cache is not None else None
+        if ttl:
+            cached = self.cache.get(key)
+            if cached is not MISSING:
+                return cached
+        return await self.inflight.do(key, lambda: self._fetch(key, path, params, ttl))
+
+    async def _fetch(self, key: Hashable, path: str, params: Dict[str, Any], ttl: Optional[float]) -> Dict[str, Any]:
+        data, nbytes = await self._request(path, params)
+        # 오류 응답은 _request에서 예외로 올라오므로 여기까지 온 응답만 캐시
+        if ttl and self.cache is not None:
+            self.cache.set(key, data, ttl=ttl, size=nbytes)
+        return data
+
+    async def _request(self, path: str, params: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
         base = {
             "serviceKey": self.api_key,
             "_type": "json",
@@ -60,9 +148,9 @@ class TourAPIClient:
             raise_provider(code, msg, data)
         except (KeyError, TypeError):
             # 헤더가 없으면 원문 반환
-            return data
+            return data, len(r.content)
 
-        return data
+        return data, len(r.content)
 
     # 1) 지역코드 조회
     async def get_areacode(self, area_code: Optional[int] = None, num_of_rows: Optional[int] = None, page_no: Optional[int] = None) -> Dict[str, Any]:
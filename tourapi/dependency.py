@@ -0,0 +1,48 @@
+# tourapi/dependency.py
+from __future__ import annotations
+import os
+from typing import Optional
+
+from .client import TourAPIClient
+
+_client: Optional[TourAPIClient] = None
+
+
+def init_tourapi_client() -> TourAPIClient:
+    """
+    앱 전역 TourAPIClient 생성 (FastAPI lifespan에서 호출).
+    - TOURAPI_KEY: 필수
+    - TOURAPI_TIMEOUT: 기본 10초
+    - TOURAPI_MAX_CONNECTIONS: 기본 50
+    - TOURAPI_MAX_KEEPALIVE: 기본 20
+    - TOURAPI_KEEPALIVE_EXPIRY: 기본 30초
+    - TOURAPI_CACHE_SIZE: 응답 캐시 최대 항목 수, 기본 2048 (0이면 캐시 끔)
+    - TOURAPI_CACHE_MAX_BYTES: 응답 캐시 본문 크기 합 상한, 기본 64MB
+    """
+    global _client
+    if _client is None:
+        api_key = os.getenv("TOURAPI_KEY")
+        if not api_key:
+            raise ValueError("TOURAPI_KEY 환경 변수가 설정되지 않았습니다.")
+        _client = TourAPIClient(
+            api_key,
+            timeout=float(os.getenv("TOURAPI_TIMEOUT", "10")),
+            max_connections=int(os.getenv("TOURAPI_MAX_CONNECTIONS", "50")),
+            max_keepalive_connections=int(os.getenv("TOURAPI_MAX_KEEPALIVE", "20")),
+            keepalive_expiry=float(os.getenv("TOURAPI_KEEPALIVE_EXPIRY", "30")),
+            cache_size=int(os.getenv("TOURAPI_CACHE_SIZE", "2048")),
+            cache_max_bytes=int(os.getenv("TOURAPI_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+        )
+    return _client
+
+
+def get_tourapi_client() -> TourAPIClient:
+    """FastAPI 의존성: 공유 TourAPIClient 반환 (lifespan 밖에서 호출되면 지연 생성)"""
+    return _client if _client is not None else init_tourapi_client()
+
+
+async def close_tourapi_client() -> None:
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.close()
@@ -1,6 +1,10 @@
 import psycopg2
 import os
+from contextlib import contextmanager
+from typing import Iterator, Tuple
 from dotenv import load_dotenv
+from psycopg2.extensions import cursor
+from util.db_pool import get_pool, PooledConnection
 
 load_dotenv()
 
@@ -20,68 +24,33 @@ load_dotenv()
 #     return con, cur
 
 def get_connection():
-    database_url = os.getenv('DATABASE_URL')
-    if database_url:
-        con = psycopg2.connect(database_url)
-    else:
-        con = psycopg2.connect(
-            host=os.getenv('DB_HOST', 'aws-1-ap-northeast-2.pooler.supabase.com'),
-            dbname=os.getenv('DB_NAME', 'postgres'),
-            user=os.getenv('DB_USER', 'postgres.kgsiyqzruyspbgedwrxp'),
-            password=os.getenv('DB_PASSWORD', 'kstoB7ONpsnqU1qX'),
-            port=int(os.getenv('DB_PORT', '6543'))
-        )
+    """
+    풀에서 커넥션을 빌려 (con, cur)를 반환한다.
+    con.close()는 풀 반납으로 동작하므로 기존 호출부는 그대로 동작한다.
+    새 코드는 db_cursor()를 사용한다.
+    """
+    con = get_pool().getconn()
     cur = con.cursor()
     return con, cur
 
-def create_table_if_not_exists(table_name, create_sql):
+@contextmanager
+def db_cursor() -> Iterator[Tuple[PooledConnection, cursor]]:
+    """
+    with db_cursor() as (con, cur): ...
+    - 예외 발생 시 rollback 후 재전파
+    - 종료 시 커서를 닫고 커넥션을 풀에 반납
+    """
     con, cur = get_connection()
     try:
-        cur.execute("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_name = %s
-            );
-        """, (table_name,))
-        exists = cur.fetchone()[0]
-        if not exists:
-            cur.execute(create_sql)
-            con.commit()
+        yield con, cur
+    except Exception:
+        try:
+            con.rollback()
+        except Exception:
+            pass
+        raise
     finally:
-        cur.close()
-        con.close()
-
-user_table_sql = """
-CREATE TABLE IF NOT EXISTS "user" (
-    id UUID PRIMARY KEY,
-    username TEXT UNIQUE NOT NULL,
-    profile TEXT NOT NULL,
-    password TEXT NOT NULL
-);
-"""
-
-interest_table_sql = """
-CREATE TABLE IF NOT EXISTS interest (
-    id SERIAL PRIMARY KEY,
-    user_id UUID NOT NULL,
-    interest TEXT NOT NULL,
-    FOREIGN KEY (user_id) REFERENCES "user"(id)
-);
-"""
-
-def create_all_tables():
-    try:
-        create_table_if_not_exists("user", user_table_sql)
-        create_table_if_not_exists("interest", interest_table_sql)
-        print("✅ Database tables initialized successfully")
-    except Exception as e:
-        print(f"⚠️ Database initialization failed: {e}")
-        # Don't crash the app, just log the error
-
-# Only initialize tables if we're not in import-only mode
-if __name__ != '__main__':
-    try:
-        create_all_tables()
-    except Exception as e:
-        print(f"⚠️ Database connection failed during startup: {e}")
-        print("📝 App will continue without database initialization")
\ No newline at end of file
+        try:
+            cur.close()
+        finally:
+            con.close()
@@ -0,0 +1,66 @@
+# util/async_db_pool.py
+from __future__ import annotations
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import asyncpg
+
+from util.db_settings import db_settings
+
+_pool: Optional[asyncpg.Pool] = None
+_lock: Optional[asyncio.Lock] = None
+
+
+def _dsn_kwargs() -> dict:
+    """util.db_settings.db_settings()를 asyncpg 인자 이름으로"""
+    kwargs = db_settings()
+    if "dbname" in kwargs:
+        kwargs["database"] = kwargs.pop("dbname")
+    return kwargs
+
+
+async def get_async_pool() -> asyncpg.Pool:
+    """
+    이벤트 루프 전용 asyncpg 풀 (지연 생성).
+    - DB_ASYNC_POOL_MIN_SIZE: 기본 1
+    - DB_ASYNC_POOL_MAX_SIZE: 기본 10
+    - DB_ASYNC_POOL_MAX_IDLE: 기본 300초 (유휴 커넥션 정리)
+    - DB_ASYNC_POOL_TIMEOUT: 기본 10초 (커넥션 획득/쿼리 타임아웃)
+    Supabase pooler(pgbouncer transaction 모드)는 prepared statement를 유지하지 못하므로
+    statement_cache_size=0으로 둔다.
+    """
+    global _pool, _lock
+    if _pool is not None:
+        return _pool
+    if _lock is None:
+        _lock = asyncio.Lock()
+    async with _lock:
+        if _pool is None:
+            timeout = float(os.getenv("DB_ASYNC_POOL_TIMEOUT", "10"))
+            _pool = await asyncpg.create_pool(
+                min_size=int(os.getenv("DB_ASYNC_POOL_MIN_SIZE", "1")),
+                max_size=int(os.getenv("DB_ASYNC_POOL_MAX_SIZE", "10")),
+                max_inactive_connection_lifetime=float(os.getenv("DB_ASYNC_POOL_MAX_IDLE", "300")),
+                timeout=timeout,
+                command_timeout=timeout,
+                statement_cache_size=0,
+                **_dsn_kwargs(),
+            )
+    return _pool
+
+
+@asynccontextmanager
+async def async_connection() -> AsyncIterator[asyncpg.Connection]:
+    """async with async_connection() as con: ..."""
+    pool = await get_async_pool()
+    async with pool.acquire() as con:
+        yield con
+
+
+async def close_async_pool() -> None:
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.close()
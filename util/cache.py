@@ -0,0 +1,203 @@
+# util/cache.py
+from __future__ import annotations
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# 캐시에 None(부정 캐시)을 저장할 수 있도록 미스를 구분하는 센티널
+MISSING: Any = object()
+
+
+class BoundedTTLCache:
+    """
+    크기 제한 + 항목별 TTL을 갖는 LRU 캐시.
+    - max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - max_bytes(선택)를 넘어도 LRU 순으로 제거. 항목 크기는 set(..., size=)로 호출부가 알려준다
+    - set(..., ttl=)로 항목마다 만료 시간 지정 (미스 결과를 짧게 기억하는 용도 등)
+    - 이벤트 루프 단일 스레드에서 await 없이 동작하므로 락이 필요 없다
+    """
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0, *, max_bytes: Optional[int] = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다.")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, *, size: int = 0) -> None:
+        ttl = self.ttl_seconds if ttl is None else ttl
+        if ttl <= 0:
+            return
+        if self.max_bytes is not None and size > self.max_bytes:
+            # 한 항목이 전체 예산보다 크면 다른 항목을 모두 밀어내지 않도록 저장하지 않는다
+            self._remove(key)
+            return
+        self._remove(key)
+        self._data[key] = (time.monotonic() + ttl, value, size)
+        self._bytes += size
+        while len(self._data) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+            _, (_, _, old_size) = self._data.popitem(last=False)
+            self._bytes -= old_size
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def pop(self, key: Hashable) -> None:
+        self._remove(key)
+
+    def purge_expired(self) -> int:
+        """만료된 항목을 읽히기 전에 미리 제거하고 제거 개수를 반환"""
+        now = time.monotonic()
+        expired = [k for k, (expires_at, _, _) in self._data.items() if expires_at <= now]
+        for k in expired:
+            self._remove(k)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+def _freeze(v: Any) -> Hashable:
+    if isinstance(v, dict):
+        return tuple(sorted((str(k), _freeze(x)) for k, x in v.items()))
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(x) for x in v)
+    if isinstance(v, (set, frozenset)):
+        return tuple(sorted(repr(x) for x in v))
+    try:
+        hash(v)
+        return v
+    except TypeError:
+        return repr(v)
+
+
+def canonical_key(name: str, payload: Optional[Dict[str, Any]] = None) -> Hashable:
+    """
+    (name, payload) → 해시 가능한 정규 키. 키 순서와 무관하며 json.dumps 직렬화 없이 튜플로 만든다.
+    """
+    return (name, _freeze(payload or {}))
+
+
+def approx_size(value: Any, _depth: int = 0) -> int:
+    """캐시 바이트 예산용 대략적 크기: 문자열 길이 합 + 스칼라/컨테이너당 고정 비용"""
+    if _depth > 32:
+        return 8
+    if isinstance(value, (str, bytes)):
+        return len(value) + 8
+    if isinstance(value, dict):
+        return 16 + sum(approx_size(k, _depth + 1) + approx_size(v, _depth + 1) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return 16 + sum(approx_size(v, _depth + 1) for v in value)
+    return 8
+
+
+class ShardedTTLCache:
+    """
+    BoundedTTLCache 여러 개를 키 해시로 나눠 쓰는 캐시.
+    - 한도(max_entries/max_bytes)는 샤드별로 균등 분배
+    - set 시 sweep_interval마다 샤드 하나씩 돌아가며 만료 항목을 미리 제거 (읽히지 않는 항목도 정리)
+    - 모든 연산이 await 없이 끝나므로 이벤트 루프에서 락 없이 읽고 쓴다.
+      샤딩은 락 대신 스윕/퇴출 비용을 샤드 크기로 제한하는 역할
+    """
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        *,
+        max_bytes: Optional[int] = None,
+        shards: int = 8,
+        sweep_interval: float = 30.0,
+    ) -> None:
+        if shards < 1 or max_entries < 1:
+            raise ValueError("shards, max_entries는 1 이상이어야 합니다.")
+        shards = min(shards, max_entries)
+        per_entries = max(1, max_entries // shards)
+        per_bytes = None if max_bytes is None else max(1, max_bytes // shards)
+        self._shards: List[BoundedTTLCache] = [
+            BoundedTTLCache(per_entries, ttl_seconds, max_bytes=per_bytes) for _ in range(shards)
+        ]
+        self.ttl_seconds = ttl_seconds
+        self.sweep_interval = sweep_interval
+        self._next_sweep = time.monotonic() + sweep_interval
+        self._sweep_cursor = 0
+
+    def _shard(self, key: Hashable) -> BoundedTTLCache:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        return self._shard(key).get(key, default)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, *, size: Optional[int] = None) -> None:
+        self._maybe_sweep()
+        self._shard(key).set(key, value, ttl, size=approx_size(value) if size is None else size)
+
+    def pop(self, key: Hashable) -> None:
+        self._shard(key).pop(key)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.sweep_interval
+        self._shards[self._sweep_cursor].purge_expired()
+        self._sweep_cursor = (self._sweep_cursor + 1) % len(self._shards)
+
+    def purge_expired(self) -> int:
+        return sum(shard.purge_expired() for shard in self._shards)
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def stats(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"shards": len(self._shards)}
+        for shard in self._shards:
+            for k, v in shard.stats().items():
+                if v is None:
+                    out.setdefault(k, None)
+                else:
+                    out[k] = (out.get(k) or 0) + v
+        return out
@@ -0,0 +1,272 @@
+# util/db_pool.py
+from __future__ import annotations
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+import psycopg2
+from psycopg2.extensions import connection, TRANSACTION_STATUS_IDLE
+
+from util.db_settings import db_settings
+
+
+class PoolTimeoutError(Exception):
+    """checkout_timeout 안에 커넥션을 얻지 못했을 때 발생"""
+
+
+class _Slot:
+    __slots__ = ("con", "created_at", "last_used_at")
+
+    def __init__(self, con: connection) -> None:
+        now = time.monotonic()
+        self.con = con
+        self.created_at = now
+        self.last_used_at = now
+
+
+class PooledConnection:
+    """
+    psycopg2 connection 프록시.
+    close()가 실제 종료 대신 풀 반납으로 동작하므로 기존 `con.close()` 호출부가 그대로 동작한다.
+    """
+    def __init__(self, pool: "ConnectionPool", slot: _Slot) -> None:
+        self._pool = pool
+        self._slot: Optional[_Slot] = slot
+
+    @property
+    def raw(self) -> connection:
+        if self._slot is None:
+            raise psycopg2.InterfaceError("connection already returned to pool")
+        return self._slot.con
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw, name)
+
+    def cursor(self, *args: Any, **kwargs: Any):
+        return self.raw.cursor(*args, **kwargs)
+
+    def commit(self) -> None:
+        self.raw.commit()
+
+    def rollback(self) -> None:
+        self.raw.rollback()
+
+    @property
+    def closed(self) -> int:
+        return 1 if self._slot is None else self._slot.con.closed
+
+    def close(self) -> None:
+        slot, self._slot = self._slot, None
+        if slot is not None:
+            self._pool._release(slot)
+
+
+class ConnectionPool:
+    """
+    스레드 안전한 psycopg2 커넥션 풀.
+    - min_size/max_size: 유지/최대 커넥션 수
+    - max_lifetime: 이 시간(초)보다 오래된 커넥션은 반납 시 폐기
+    - max_idle: 이 시간(초) 이상 쉬었던 커넥션은 checkout 시 SELECT 1로 상태 확인
+    - checkout_timeout: 풀이 가득 찼을 때 대기할 최대 시간(초)
+    """
+    def __init__(
+        self,
+        connect: Callable[[], connection],
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        max_lifetime: float = 1800.0,
+        max_idle: float = 30.0,
+        checkout_timeout: float = 10.0,
+    ) -> None:
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("0 <= min_size <= max_size, max_size >= 1 이어야 합니다.")
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: Deque[_Slot] = deque()
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats: Dict[str, float] = {
+            "checkouts": 0,
+            "waits": 0,             # 풀이 가득 차서 대기한 횟수
+            "timeouts": 0,          # 대기 끝에 PoolTimeoutError
+            "created": 0,
+            "discarded_unhealthy": 0,
+            "discarded_expired": 0,
+            "max_wait_ms": 0.0,
+        }
+
+    # ---- 내부 ----
+    def _open_slot(self) -> _Slot:
+        con = self._connect()
+        self._stats["created"] += 1
+        return _Slot(con)
+
+    def _discard(self, slot: _Slot) -> None:
+        try:
+            slot.con.close()
+        except Exception:
+            pass
+
+    def _healthy(self, slot: _Slot) -> bool:
+        con = slot.con
+        if con.closed:
+            return False
+        if time.monotonic() - slot.last_used_at < self.max_idle:
+            return True
+        try:
+            with con.cursor() as cur:
+                cur.execute("SELECT 1;")
+            con.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _expired(self, slot: _Slot) -> bool:
+        return self.max_lifetime > 0 and time.monotonic() - slot.created_at > self.max_lifetime
+
+    def _release(self, slot: _Slot) -> None:
+        con = slot.con
+        reusable = not con.closed
+        if reusable and con.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            # 커밋되지 않은 작업은 버린다
+            try:
+                con.rollback()
+            except Exception:
+                reusable = False
+        if reusable and self._expired(slot):
+            self._stats["discarded_expired"] += 1
+            reusable = False
+
+        with self._cond:
+            if reusable and not self._closed:
+                slot.last_used_at = time.monotonic()
+                self._idle.append(slot)
+            else:
+                self._size -= 1
+                self._discard(slot)
+            self._cond.notify()
+
+    # ---- 공개 API ----
+    def open(self) -> None:
+        """min_size만큼 커넥션을 미리 연다."""
+        with self._cond:
+            while self._size < self.min_size:
+                self._idle.append(self._open_slot())
+                self._size += 1
+
+    def getconn(self) -> PooledConnection:
+        deadline = time.monotonic() + self.checkout_timeout
+        waited = False
+        start = time.monotonic()
+        while True:
+            slot: Optional[_Slot] = None
+            create = False
+            with self._cond:
+                if self._closed:
+                    raise psycopg2.InterfaceError("connection pool is closed")
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeoutError(
+                            f"DB 커넥션 풀 고갈: {self.checkout_timeout}s 안에 커넥션을 얻지 못했습니다 (max_size={self.max_size})"
+                        )
+                    if not waited:
+                        waited = True
+                        self._stats["waits"] += 1
+                    self._cond.wait(remaining)
+                if self._idle:
+                    slot = self._idle.pop()
+                else:
+                    self._size += 1
+                    create = True
+
+            if create:
+                try:
+                    slot = self._open_slot()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            elif slot is not None and (self._expired(slot) or not self._healthy(slot)):
+                key = "discarded_expired" if self._expired(slot) else "discarded_unhealthy"
+                self._stats[key] += 1
+                self._discard(slot)
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                continue
+
+            wait_ms = (time.monotonic() - start) * 1000.0
+            with self._cond:
+                self._stats["checkouts"] += 1
+                if wait_ms > self._stats["max_wait_ms"]:
+                    self._stats["max_wait_ms"] = wait_ms
+            return PooledConnection(self, slot)  # type: ignore[arg-type]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            out: Dict[str, Any] = dict(self._stats)
+            out["size"] = self._size
+            out["idle"] = len(self._idle)
+            out["in_use"] = self._size - len(self._idle)
+            out["max_size"] = self.max_size
+            return out
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                self._size -= 1
+                self._discard(self._idle.pop())
+            self._cond.notify_all()
+
+
+def _connect_from_env() -> connection:
+    return psycopg2.connect(**db_settings())
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """
+    프로세스 전역 커넥션 풀 (지연 생성).
+    - DB_POOL_MIN_SIZE: 기본 1
+    - DB_POOL_MAX_SIZE: 기본 10
+    - DB_POOL_MAX_LIFETIME: 기본 1800초
+    - DB_POOL_MAX_IDLE: 기본 30초 (이보다 오래 쉰 커넥션은 checkout 시 상태 확인)
+    - DB_POOL_TIMEOUT: 기본 10초
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    _connect_from_env,
+                    min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+                    max_size=int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+                    max_lifetime=float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+                    max_idle=float(os.getenv("DB_POOL_MAX_IDLE", "30")),
+                    checkout_timeout=float(os.getenv("DB_POOL_TIMEOUT", "10")),
+                )
+    return _pool
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
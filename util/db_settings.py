@@ -0,0 +1,23 @@
+# util/db_settings.py
+from __future__ import annotations
+import os
+from typing import Any, Dict
+
+
+def db_settings() -> Dict[str, Any]:
+    """
+    psycopg2/asyncpg 풀이 같이 쓰는 접속 설정.
+    - DATABASE_URL이 있으면 {"dsn": ...}
+    - 없으면 DB_HOST / DB_NAME / DB_USER / DB_PASSWORD / DB_PORT (비밀번호는 기본값 없이 환경변수로만)
+    반환 키: dsn 또는 host, dbname, user, password, port (asyncpg는 dbname을 database로 바꿔 쓴다)
+    """
+    database_url = os.getenv('DATABASE_URL')
+    if database_url:
+        return {"dsn": database_url}
+    return {
+        "host": os.getenv('DB_HOST', 'aws-1-ap-northeast-2.pooler.supabase.com'),
+        "dbname": os.getenv('DB_NAME', 'postgres'),
+        "user": os.getenv('DB_USER', 'postgres.kgsiyqzruyspbgedwrxp'),
+        "password": os.getenv('DB_PASSWORD'),
+        "port": int(os.getenv('DB_PORT', '6543')),
+    }
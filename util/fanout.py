@@ -0,0 +1,45 @@
+# util/fanout.py
+from __future__ import annotations
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Optional
+
+# bounded의 default로 넘겨 시간 초과/실패를 정상적인 '결과 없음'(None, "")과 구분할 때 쓰는 표식
+FAILED: Any = object()
+
+
+class Deadline:
+    """요청 전체에 주어진 시간 예산. 각 하위 호출은 남은 시간 안에서만 기다린다."""
+    def __init__(self, seconds: float) -> None:
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+
+async def bounded(aw: Awaitable[Any], *, timeout: float, deadline: Optional[Deadline] = None, default: Any = None) -> Any:
+    """
+    aw를 min(timeout, deadline 남은 시간) 안에 기다린다.
+    시간 초과나 예외는 default로 대체해 asyncio.gather 팬아웃의 다른 호출에 영향을 주지 않는다.
+    """
+    limit = timeout if deadline is None else min(timeout, deadline.remaining())
+    if limit <= 0:
+        if inspect.iscoroutine(aw):
+            aw.close()
+        return default
+    try:
+        return await asyncio.wait_for(aw, limit)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        return default
+
+
+async def value(v: Any) -> Any:
+    """gather 인자 자리를 채우는 즉시 완료 awaitable"""
+    return v
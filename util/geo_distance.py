@@ -0,0 +1,76 @@
+# util/geo_distance.py
+from __future__ import annotations
+import math
+from typing import Sequence, Tuple
+
+import numpy as np
+
+# haversine 패키지(Unit.METERS)와 같은 지구 평균 반지름
+EARTH_RADIUS_M = 6_371_008.8
+# 같은 구면 기준의 위도 1도 길이. 박스는 거리 계산보다 좁으면 안 되므로 약간 넓힌다
+M_PER_DEG_LAT = math.pi * EARTH_RADIUS_M / 180.0
+_BBOX_MARGIN = 1.001
+
+
+def _haversine(origin_lat: float, origin_lon: float, la: np.ndarray, lo: np.ndarray) -> np.ndarray:
+    lat1 = np.radians(origin_lat)
+    lat2 = np.radians(la)
+    dlat = lat2 - lat1
+    dlon = np.radians(lo - origin_lon)
+    a = np.sin(dlat / 2.0) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2.0) ** 2
+    return 2.0 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _to_int(d: np.ndarray) -> np.ndarray:
+    out = np.rint(d)
+    out[np.isnan(out)] = -1
+    return out.astype(np.int64)
+
+
+def distances_m(origin_lat: float, origin_lon: float, lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+    """
+    한 원점에서 N개 지점까지의 haversine 거리(m)를 한 번에 계산해 정수(int64)로 반환.
+    좌표가 None/NaN이면 해당 원소는 -1.
+    """
+    la = np.asarray(lats, dtype=np.float64)
+    lo = np.asarray(lons, dtype=np.float64)
+    if la.size == 0:
+        return np.empty(0, dtype=np.int64)
+    return _to_int(_haversine(origin_lat, origin_lon, la, lo))
+
+
+def bbox(origin_lat: float, origin_lon: float, radius_m: float) -> Tuple[float, float, float, float]:
+    """반경 radius_m 원을 덮는 (min_lat, min_lon, max_lat, max_lon)"""
+    dlat = radius_m * _BBOX_MARGIN / M_PER_DEG_LAT
+    dlon = radius_m * _BBOX_MARGIN / (M_PER_DEG_LAT * max(0.01, math.cos(math.radians(origin_lat))))
+    return origin_lat - dlat, origin_lon - dlon, origin_lat + dlat, origin_lon + dlon
+
+
+def bbox_mask(origin_lat: float, origin_lon: float, lats: np.ndarray, lons: np.ndarray, radius_m: float) -> np.ndarray:
+    """반경 radius_m 원을 덮는 위경도 박스 안에 있는 원소 마스크 (정확한 거리 계산 전 값싼 1차 필터)"""
+    min_lat, min_lon, max_lat, max_lon = bbox(origin_lat, origin_lon, radius_m)
+    with np.errstate(invalid="ignore"):
+        return (lats >= min_lat) & (lats <= max_lat) & (lons >= min_lon) & (lons <= max_lon)
+
+
+def within_radius(
+    origin_lat: float, origin_lon: float, lats: Sequence[float], lons: Sequence[float], radius_m: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    반경 안 지점의 (원래 인덱스, 정수 거리 m). 입력 순서를 유지한다.
+    바운딩 박스로 먼저 거른 뒤 남은 지점만 haversine 계산.
+    """
+    la = np.asarray(lats, dtype=np.float64)
+    lo = np.asarray(lons, dtype=np.float64)
+    if la.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    idx = np.nonzero(bbox_mask(origin_lat, origin_lon, la, lo, radius_m))[0]
+    d = _haversine(origin_lat, origin_lon, la[idx], lo[idx])
+    keep = d <= radius_m  # 반올림 전 값으로 비교해 경계가 haversine()과 같게
+    return idx[keep], _to_int(d[keep])
+
+
+def distance_m(lat1: float, lon1: float, lat2: float, lon2: float) -> int:
+    """단건 거리(m, 정수). 좌표가 유효하지 않으면 0"""
+    d = int(distances_m(lat1, lon1, [lat2], [lon2])[0])
+    return max(0, d)
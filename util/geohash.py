@@ -0,0 +1,88 @@
+# util/geohash.py
+from __future__ import annotations
+import math
+from typing import Set, Tuple
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE = {c: i for i, c in enumerate(_BASE32)}
+
+
+def encode(lat: float, lon: float, precision: int = 6) -> str:
+    """위도/경도 → geohash 문자열"""
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    out = []
+    bit = ch = 0
+    even = True  # 짝수 번째 비트는 경도
+    while len(out) < precision:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            if lon >= mid:
+                ch = (ch << 1) | 1
+                lon_lo = mid
+            else:
+                ch <<= 1
+                lon_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                ch = (ch << 1) | 1
+                lat_lo = mid
+            else:
+                ch <<= 1
+                lat_hi = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            out.append(_BASE32[ch])
+            bit = ch = 0
+    return "".join(out)
+
+
+def decode_bbox(gh: str) -> Tuple[float, float, float, float]:
+    """geohash → (min_lat, min_lon, max_lat, max_lon)"""
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    even = True
+    for c in gh:
+        v = _DECODE[c]
+        for shift in range(4, -1, -1):
+            b = (v >> shift) & 1
+            if even:
+                mid = (lon_lo + lon_hi) / 2
+                lon_lo, lon_hi = (mid, lon_hi) if b else (lon_lo, mid)
+            else:
+                mid = (lat_lo + lat_hi) / 2
+                lat_lo, lat_hi = (mid, lat_hi) if b else (lat_lo, mid)
+            even = not even
+    return lat_lo, lon_lo, lat_hi, lon_hi
+
+
+def decode(gh: str) -> Tuple[float, float]:
+    """geohash 셀 중심 (lat, lon)"""
+    a, b, c, d = decode_bbox(gh)
+    return (a + c) / 2, (b + d) / 2
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """precision 자리 셀의 (위도 폭, 경도 폭) 도 단위"""
+    bits = 5 * precision
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def cells_covering(min_lat: float, min_lon: float, max_lat: float, max_lon: float, precision: int) -> Set[str]:
+    """바운딩 박스와 겹치는 모든 셀"""
+    dlat, dlon = cell_size(precision)
+    min_lat, max_lat = max(-90.0, min_lat), min(90.0, max_lat)
+    min_lon, max_lon = max(-180.0, min_lon), min(180.0, max_lon)
+    lat = (math.floor((min_lat + 90.0) / dlat) + 0.5) * dlat - 90.0
+    cells: Set[str] = set()
+    while lat - dlat / 2 <= max_lat:
+        lon = (math.floor((min_lon + 180.0) / dlon) + 0.5) * dlon - 180.0
+        while lon - dlon / 2 <= max_lon:
+            cells.add(encode(min(lat, 90.0), min(lon, 180.0), precision))
+            lon += dlon
+        lat += dlat
+    return cells
@@ -0,0 +1,64 @@
+# util/pagination.py
+"""
+키셋 페이지네이션용 불투명 cursor.
+- cursor는 마지막 항목의 정렬 키 값들을 JSON 배열로 담은 base64url 문자열
+- 조회는 limit + 1개를 읽어 다음 페이지 유무를 판단하고, 다음 조회는 WHERE (키...) < (cursor 값...)로 이어간다
+"""
+from __future__ import annotations
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+T = TypeVar("T")
+
+
+class InvalidCursor(ValueError):
+    """클라이언트가 보낸 cursor를 해석할 수 없을 때 (컨트롤러에서 400으로 변환)"""
+
+
+def _default(o: Any) -> Any:
+    return o.isoformat() if isinstance(o, datetime) else str(o)
+
+
+def page_size(limit: Optional[int]) -> int:
+    """1 ~ MAX_PAGE_SIZE로 제한 (None이면 기본값)"""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값들 → cursor (datetime은 ISO 문자열, UUID 등은 str)"""
+    raw = json.dumps(list(values), separators=(",", ":"), ensure_ascii=False, default=_default).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], *parsers: Callable[[Any], Any]) -> Optional[Tuple[Any, ...]]:
+    """
+    cursor → 정렬 키 값 튜플. 값마다 parsers의 같은 위치 함수로 변환한다 (개수도 일치해야 함).
+    cursor가 비어 있으면 None, 잘못된 cursor는 InvalidCursor
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError(cursor)
+        return tuple(p(v) for p, v in zip(parsers, values))
+    except Exception as e:
+        raise InvalidCursor("유효하지 않은 cursor입니다.") from e
+
+
+def paginate(rows: Sequence[T], limit: int, key: Callable[[T], Sequence[Any]]) -> Tuple[List[T], Optional[str]]:
+    """
+    limit + 1개까지 읽은 rows → (페이지, 다음 cursor 또는 None)
+    key: 행 → 정렬 키 값들 (쿼리의 ORDER BY와 같은 순서)
+    """
+    page = list(rows[:limit])
+    next_cursor = encode_cursor(*key(page[-1])) if len(rows) > limit and page else None
+    return page, next_cursor
@@ -0,0 +1,47 @@
+# util/periodic.py
+from __future__ import annotations
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+
+class PeriodicTask:
+    """
+    이벤트 루프에서 fn()을 interval초마다 실행하는 백그라운드 작업 (FastAPI lifespan에서 start/stop).
+    - 실행 중 예외는 출력만 하고 다음 주기에 다시 시도
+    - run_immediately=True면 시작하자마자 한 번 실행
+    """
+    def __init__(self, name: str, interval: float, fn: Callable[[], Awaitable[object]], *, run_immediately: bool = True) -> None:
+        self.name = name
+        self.interval = interval
+        self.fn = fn
+        self.run_immediately = run_immediately
+        self.runs = 0
+        self.failures = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._loop())
+
+    async def _loop(self) -> None:
+        if not self.run_immediately:
+            await asyncio.sleep(self.interval)
+        while True:
+            try:
+                await self.fn()
+                self.runs += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                print(f"⚠️ periodic task '{self.name}' failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
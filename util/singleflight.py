@@ -0,0 +1,48 @@
+# util/singleflight.py
+from __future__ import annotations
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    동일 키로 동시에 들어온 비동기 호출을 하나의 in-flight 태스크로 합친다.
+    - 먼저 온 호출(leader)만 실제로 fn()을 실행하고, 나머지는 같은 결과/예외를 공유
+    - 완료되면 키를 비우므로 캐시가 아니다 (이후 호출은 다시 실행)
+    - 공유 결과는 같은 객체이므로 호출부에서 변경하지 않아야 한다
+    - 한 호출자가 취소되어도 실행 중인 태스크는 다른 대기자를 위해 계속 진행
+    """
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.calls = 0        # 실제 실행 횟수
+        self.coalesced = 0    # 진행 중인 호출에 합쳐진 횟수
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._done(k, t))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 대기자가 모두 취소된 경우 '예외 미확인' 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
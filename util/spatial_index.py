@@ -0,0 +1,116 @@
+# util/spatial_index.py
+from __future__ import annotations
+import heapq
+import math
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from haversine import haversine, Unit
+
+from util import geohash
+
+M_PER_DEG_LAT = 111_320.0
+
+Hit = Tuple[float, Hashable]  # (거리 m, id)
+
+
+def bbox_around(lat: float, lon: float, radius_m: float) -> Tuple[float, float, float, float]:
+    """반경 radius_m 원을 덮는 (min_lat, min_lon, max_lat, max_lon)"""
+    dlat = radius_m / M_PER_DEG_LAT
+    dlon = radius_m / (M_PER_DEG_LAT * max(0.01, math.cos(math.radians(lat))))
+    return lat - dlat, lon - dlon, lat + dlat, lon + dlon
+
+
+class GeoGridIndex:
+    """
+    geohash 셀 단위 격자로 나눈 메모리 공간 인덱스.
+    - (content_type, 셀) → {id: (lat, lon)} 버킷. 반경/근접 질의는 원을 덮는 셀만 훑는다
+    - add/remove로 점진 갱신 (같은 id를 다시 add하면 이동)
+    - payload: id별 임의 데이터(예: TourAPI 항목 dict)를 함께 보관
+    precision 5 ≈ 4.9km × 4.9km, 6 ≈ 1.2km × 0.6km
+    """
+    def __init__(self, precision: int = 5) -> None:
+        self.precision = precision
+        self._cells: Dict[Tuple[Any, str], Dict[Hashable, Tuple[float, float]]] = {}
+        self._where: Dict[Hashable, Tuple[Any, str]] = {}
+        self._payload: Dict[Hashable, Any] = {}
+        self._types: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def add(self, id: Hashable, lat: float, lon: float, content_type: Any = None, payload: Any = None) -> None:
+        self.remove(id)
+        cell = geohash.encode(lat, lon, self.precision)
+        key = (content_type, cell)
+        self._cells.setdefault(key, {})[id] = (lat, lon)
+        self._where[id] = key
+        self._types[content_type] = self._types.get(content_type, 0) + 1
+        if payload is not None:
+            self._payload[id] = payload
+
+    def remove(self, id: Hashable) -> bool:
+        key = self._where.pop(id, None)
+        if key is None:
+            return False
+        bucket = self._cells.get(key)
+        if bucket is not None:
+            bucket.pop(id, None)
+            if not bucket:
+                del self._cells[key]
+        ctype = key[0]
+        self._types[ctype] -= 1
+        if not self._types[ctype]:
+            del self._types[ctype]
+        self._payload.pop(id, None)
+        return True
+
+    def payload(self, id: Hashable) -> Any:
+        return self._payload.get(id)
+
+    def _candidates(self, lat: float, lon: float, radius_m: float, content_type: Any):
+        types = list(self._types) if content_type is None else [content_type]
+        cells = geohash.cells_covering(*bbox_around(lat, lon, radius_m), self.precision)
+        for t in types:
+            for cell in cells:
+                bucket = self._cells.get((t, cell))
+                if bucket:
+                    yield from bucket.items()
+
+    def radius(self, lat: float, lon: float, radius_m: float, content_type: Any = None) -> List[Hit]:
+        """반경 radius_m 안의 (거리, id) 목록, 가까운 순"""
+        origin = (lat, lon)
+        hits: List[Hit] = []
+        for id, pt in self._candidates(lat, lon, radius_m, content_type):
+            d = haversine(origin, pt, unit=Unit.METERS)
+            if d <= radius_m:
+                hits.append((d, id))
+        hits.sort(key=lambda h: h[0])
+        return hits
+
+    def nearest(self, lat: float, lon: float, k: int, content_type: Any = None, *, max_radius_m: float = 50_000.0) -> List[Hit]:
+        """
+        가장 가까운 k개. 셀 한 칸 크기에서 시작해 반경을 두 배씩 늘리며,
+        반경 안에서 k개를 찾으면 그 밖에 더 가까운 점은 없으므로 종료한다.
+        """
+        if k <= 0 or not self._where:
+            return []
+        dlat, _ = geohash.cell_size(self.precision)
+        r = dlat * M_PER_DEG_LAT
+        origin = (lat, lon)
+        while True:
+            r = min(r, max_radius_m)
+            hits = [
+                (d, id) for id, pt in self._candidates(lat, lon, r, content_type)
+                for d in (haversine(origin, pt, unit=Unit.METERS),) if d <= r
+            ]
+            if len(hits) >= k or r >= max_radius_m:
+                return heapq.nsmallest(k, hits, key=lambda h: h[0])
+            r *= 2
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "points": len(self._where),
+            "cells": len(self._cells),
+            "precision": self.precision,
+            "types": dict(self._types),
+        }